@@ -0,0 +1,296 @@
+import asyncio
+import discord
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Set, Tuple
+from config.settings import BOT_CONFIG
+from utils.sqlite_store import SQLiteStore
+
+logger = logging.getLogger(__name__)
+
+ACTIVITY_CONFIG = BOT_CONFIG.get('activity', {})
+ACTIVITY_DB = os.path.join("data", "activity.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS member_activity (
+    guild_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    messages INTEGER NOT NULL,
+    last_active REAL NOT NULL,
+    PRIMARY KEY (guild_id, user_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS activity_rewards (
+    guild_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    rewarded_at REAL NOT NULL,
+    PRIMARY KEY (guild_id, user_id)
+) WITHOUT ROWID;
+"""
+
+UPSERT = """
+INSERT INTO member_activity (guild_id, user_id, messages, last_active) VALUES (?, ?, ?, ?)
+ON CONFLICT (guild_id, user_id) DO UPDATE SET
+    messages = messages + excluded.messages,
+    last_active = MAX(last_active, excluded.last_active)
+"""
+
+MemberKey = Tuple[int, int]
+
+class TopK:
+    """
+    The K highest counts of one guild, kept current on every increment.
+
+    Counts only grow, so a member enters when they pass the smallest
+    count in the set and the smallest is evicted. The floor is only
+    recomputed on evictions, so most increments are a dict lookup and a
+    comparison.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.counts: Dict[int, int] = {}
+        self.floor = 0
+
+    def update(self, user_id: int, count: int):
+        counts = self.counts
+        if user_id in counts:
+            counts[user_id] = count
+            return
+        if len(counts) < self.size:
+            counts[user_id] = count
+            self.floor = min(counts.values())
+            return
+        if count <= self.floor:
+            return
+        counts[user_id] = count
+        del counts[min(counts, key=counts.get)]
+        self.floor = min(counts.values())
+
+    def ranked(self, limit: int) -> List[Tuple[int, int]]:
+        return sorted(self.counts.items(), key=lambda item: -item[1])[:limit]
+
+class ActivityTracker:
+    """
+    Per-guild, per-member message counters.
+
+    The message path only bumps in-memory totals and a pending delta;
+    deltas are written to SQLite (WAL) in one upsert batch per flush
+    interval from a worker thread, so there is never a database write per
+    message. Totals are loaded once at startup and feed a top-K per guild
+    for /leaderboard. Members crossing the reward threshold are collected
+    and given the reward role through RoleManager by a periodic job on the
+    shared scheduler. Members the grant fails for stay candidates for the
+    next run; members who got the role (or already had it) are recorded, so
+    a role staff took away is never granted again. Messages from the same
+    member within the cooldown count once, so spamming doesn't climb the
+    board.
+    """
+
+    def __init__(self, bot, role_manager, scheduler, path: str = ACTIVITY_DB):
+        self.bot = bot
+        self.role_manager = role_manager
+        self.scheduler = scheduler
+        self.path = path
+        self.enabled = ACTIVITY_CONFIG.get('enabled', True)
+        self.flush_interval = ACTIVITY_CONFIG.get('flush_interval_seconds', 30)
+        self.cooldown = ACTIVITY_CONFIG.get('cooldown_seconds', 10)
+        self.top_size = ACTIVITY_CONFIG.get('leaderboard_size', 25)
+        self.reward_role = ACTIVITY_CONFIG.get('reward_role', "Veteran Player")
+        self.reward_threshold = ACTIVITY_CONFIG.get('reward_threshold', 1000)
+        self.reward_interval = ACTIVITY_CONFIG.get('reward_interval_seconds', 600)
+
+        self.totals: Dict[int, Dict[int, int]] = {}
+        self.top: Dict[int, TopK] = {}
+        # (guild_id, user_id) -> [messages, last_active] not yet written
+        self.pending: Dict[MemberKey, list] = {}
+        self.reward_candidates: Set[MemberKey] = set()
+        # Members who were given the reward role once; never candidates again
+        self.rewarded_members: Set[MemberKey] = set()
+        self.written = 0
+        self.rewarded = 0
+        self._last_counted: Dict[MemberKey, float] = {}
+        self.db = SQLiteStore(path, SCHEMA)
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._reward_job: Optional[int] = None
+
+    async def start(self):
+        """Load totals, then start the flusher and the reward job"""
+        if not self.enabled:
+            logger.info("Activity tracking is disabled")
+            return
+        rows, rewarded = await self.db.run(self._load)
+        self.rewarded_members = set(rewarded)
+        for guild_id, user_id, messages in rows:
+            self._set_total(guild_id, user_id, messages)
+            if messages >= self.reward_threshold and (guild_id, user_id) not in self.rewarded_members:
+                self.reward_candidates.add((guild_id, user_id))
+        logger.info(f"Loaded activity for {len(rows)} member(s)")
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush_loop())
+        self._reward_job = self.scheduler.schedule(time.time() + self.reward_interval, self._reward_loop)
+
+    async def close(self):
+        """Stop the flusher, write pending counts and close the database"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._reward_job is not None:
+            self.scheduler.cancel(self._reward_job)
+            self._reward_job = None
+        await self.flush()
+        await self.db.close()
+
+    def _load(self) -> Tuple[List[Tuple[int, int, int]], List[MemberKey]]:
+        conn = self.db.connect()
+        rows = conn.execute("SELECT guild_id, user_id, messages FROM member_activity").fetchall()
+        rewarded = conn.execute("SELECT guild_id, user_id FROM activity_rewards").fetchall()
+        return rows, rewarded
+
+    def _set_total(self, guild_id: int, user_id: int, messages: int):
+        totals = self.totals.get(guild_id)
+        if totals is None:
+            totals = self.totals[guild_id] = {}
+            self.top[guild_id] = TopK(self.top_size)
+        totals[user_id] = messages
+        self.top[guild_id].update(user_id, messages)
+
+    def record(self, message: discord.Message):
+        """
+        Count a guild message; memory only
+        """
+        guild = message.guild
+        if not self.enabled or guild is None:
+            return
+        key = (guild.id, message.author.id)
+        now = time.time()
+        if now - self._last_counted.get(key, 0.0) < self.cooldown:
+            return
+        self._last_counted[key] = now
+
+        total = self.totals.get(guild.id, {}).get(key[1], 0) + 1
+        self._set_total(guild.id, key[1], total)
+        if total == self.reward_threshold and key not in self.rewarded_members:
+            self.reward_candidates.add(key)
+
+        delta = self.pending.get(key)
+        if delta is None:
+            self.pending[key] = [1, now]
+        else:
+            delta[0] += 1
+            delta[1] = now
+
+    def leaderboard(self, guild_id: int, limit: int = 10) -> List[Tuple[int, int]]:
+        """(user_id, messages) pairs, most active first"""
+        top = self.top.get(guild_id)
+        return top.ranked(limit) if top is not None else []
+
+    def rank_of(self, guild_id: int, user_id: int) -> Tuple[int, Optional[int]]:
+        """A member's count and rank; the rank is only computed inside the top-K"""
+        count = self.totals.get(guild_id, {}).get(user_id, 0)
+        top = self.top.get(guild_id)
+        if top is None or user_id not in top.counts:
+            return count, None
+        return count, 1 + sum(1 for other in top.counts.values() if other > count)
+
+    async def flush(self) -> int:
+        """
+        Write pending deltas in one transaction off the event loop
+        """
+        async with self._flush_lock:
+            if not self.pending:
+                return 0
+            batch, self.pending = self.pending, {}
+            rows = [(guild_id, user_id, delta[0], delta[1]) for (guild_id, user_id), delta in batch.items()]
+            try:
+                await self.db.run(self._write_batch, rows)
+            except Exception as e:
+                # Merge back so the counts are retried with the next flush
+                for key, delta in batch.items():
+                    current = self.pending.setdefault(key, [0, delta[1]])
+                    current[0] += delta[0]
+                logger.error(f"Error writing activity batch: {e}")
+                return 0
+            self.written += len(rows)
+            self._sweep_cooldowns()
+            return len(rows)
+
+    def _write_batch(self, rows: List[Tuple[int, int, int, float]]):
+        conn = self.db.connect()
+        with conn:
+            conn.executemany(UPSERT, rows)
+
+    def _sweep_cooldowns(self):
+        cutoff = time.time() - self.cooldown
+        for key in [key for key, last in self._last_counted.items() if last < cutoff]:
+            del self._last_counted[key]
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def _reward_loop(self):
+        try:
+            await self.grant_rewards()
+        finally:
+            self._reward_job = self.scheduler.schedule(time.time() + self.reward_interval, self._reward_loop)
+
+    async def grant_rewards(self) -> int:
+        """
+        Give the reward role to members who crossed the threshold
+        """
+        candidates, self.reward_candidates = self.reward_candidates, set()
+        granted = 0
+        done: List[MemberKey] = []
+        # Not granted this time (guild, role or member not cached, or the call failed); retried next run
+        retry: List[MemberKey] = []
+        roles: Dict[int, Optional[discord.Role]] = {}
+        for guild_id, user_id in candidates:
+            guild = self.bot.get_guild(guild_id)
+            if guild is None:
+                retry.append((guild_id, user_id))
+                continue
+            if guild_id not in roles:
+                roles[guild_id] = discord.utils.get(guild.roles, name=self.reward_role)
+            role = roles[guild_id]
+            member = guild.get_member(user_id)
+            if member is not None and member.bot:
+                continue
+            if role is None or member is None:
+                retry.append((guild_id, user_id))
+                continue
+            if role in member.roles:
+                done.append((guild_id, user_id))
+                continue
+            success, message = await self.role_manager.add_role(member, role, guild.me)
+            if success:
+                granted += 1
+                done.append((guild_id, user_id))
+                logger.info(f"{member} reached {self.reward_threshold} messages and earned {role.name}")
+            else:
+                retry.append((guild_id, user_id))
+                logger.warning(f"Could not give {role.name} to {member}: {message}")
+        self.reward_candidates.update(retry)
+        self.rewarded += granted
+        if done:
+            await self._mark_rewarded(done)
+        return granted
+
+    async def _mark_rewarded(self, members: List[MemberKey]):
+        self.rewarded_members.update(members)
+        now = time.time()
+        try:
+            await self.db.run(self._write_rewards, [(*key, now) for key in members])
+        except Exception as e:
+            # Still remembered for this process; a restart may offer these members again
+            logger.error(f"Error recording activity rewards: {e}")
+
+    def _write_rewards(self, rows: List[Tuple[int, int, float]]):
+        conn = self.db.connect()
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO activity_rewards (guild_id, user_id, rewarded_at) VALUES (?, ?, ?)", rows
+            )
@@ -0,0 +1,157 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Set, Tuple
+from config.settings import BOT_CONFIG
+from utils.sqlite_store import SQLiteStore
+
+logger = logging.getLogger(__name__)
+
+AUDIT_CONFIG = BOT_CONFIG.get('role_audit', {})
+AUDIT_DB = os.path.join("data", "role_audit.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS role_changes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at REAL NOT NULL,
+    guild_id INTEGER NOT NULL,
+    action TEXT NOT NULL,
+    target_id INTEGER NOT NULL,
+    target_name TEXT NOT NULL,
+    moderator_id INTEGER NOT NULL,
+    moderator_name TEXT NOT NULL,
+    role_id INTEGER NOT NULL,
+    role_name TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_role_changes_target ON role_changes (guild_id, target_id, id);
+CREATE INDEX IF NOT EXISTS idx_role_changes_moderator ON role_changes (guild_id, moderator_id, id);
+CREATE INDEX IF NOT EXISTS idx_role_changes_role ON role_changes (guild_id, role_id, id);
+"""
+
+INSERT = """
+INSERT INTO role_changes (
+    created_at, guild_id, action, target_id, target_name,
+    moderator_id, moderator_name, role_id, role_name
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Filter name -> indexed column
+FILTER_COLUMNS = {
+    'target': 'target_id',
+    'moderator': 'moderator_id',
+    'role': 'role_id',
+}
+
+AuditRow = Tuple[float, int, str, int, str, int, str, int, str]
+
+class RoleAuditStore:
+    """
+    Append-only SQLite (WAL) log of role changes.
+
+    Records are buffered in memory and written in batches from a worker
+    thread, so recording a change never touches the disk on the event loop.
+    Queries use keyset pagination over the (guild, column, id) indexes, so a
+    page costs the same no matter how much history exists.
+    """
+
+    def __init__(self, path: str = AUDIT_DB):
+        self.path = path
+        self.batch_size = AUDIT_CONFIG.get('batch_size', 50)
+        self.flush_interval = AUDIT_CONFIG.get('flush_interval_seconds', 5)
+        self.pending: List[AuditRow] = []
+        self.written = 0
+        self.db = SQLiteStore(path, SCHEMA)
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._background: Set[asyncio.Task] = set()
+
+    async def start(self):
+        """Open the database and start the periodic flusher"""
+        await self.db.run(self.db.connect)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def close(self):
+        """Stop the flusher, write pending records and close the database"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
+        await self.db.close()
+
+    @property
+    def flushing(self) -> int:
+        """Number of batch flushes currently running in the background"""
+        return len(self._background)
+
+    def record(self, guild_id: int, action: str, target, moderator, role):
+        """
+        Buffer a role change; flushed in the next batch
+        """
+        self.pending.append((
+            time.time(), guild_id, action,
+            target.id, str(target),
+            moderator.id, str(moderator),
+            role.id, role.name
+        ))
+        if len(self.pending) >= self.batch_size and not self._flush_lock.locked():
+            task = asyncio.create_task(self.flush())
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+    async def flush(self) -> int:
+        """
+        Write all buffered records in one transaction off the event loop
+        """
+        async with self._flush_lock:
+            if not self.pending:
+                return 0
+            batch, self.pending = self.pending, []
+            try:
+                await self.db.run(self._write_batch, batch)
+            except Exception as e:
+                # Keep the batch so it's retried with the next flush
+                self.pending = batch + self.pending
+                logger.error(f"Error writing role audit batch: {e}")
+                return 0
+            self.written += len(batch)
+            return len(batch)
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def _write_batch(self, batch: List[AuditRow]):
+        conn = self.db.connect()
+        with conn:
+            conn.executemany(INSERT, batch)
+
+    async def query(self, guild_id: int, filter_name: str, value: int, limit: int = 10,
+                    before_id: Optional[int] = None) -> List[Dict]:
+        """
+        Get one page of changes, newest first, filtered by target, moderator or role.
+        Pass the smallest id of the previous page as before_id for the next page.
+        """
+        column = FILTER_COLUMNS[filter_name]
+        # Buffered records are included so a change shows up immediately
+        await self.flush()
+        return await self.db.run(self._query, guild_id, column, value, limit, before_id)
+
+    def _query(self, guild_id: int, column: str, value: int, limit: int, before_id: Optional[int]) -> List[Dict]:
+        conn = self.db.connect()
+        sql = (
+            "SELECT id, created_at, action, target_id, target_name, moderator_id, moderator_name, "
+            f"role_id, role_name FROM role_changes WHERE guild_id = ? AND {column} = ?"
+        )
+        params: list = [guild_id, value]
+        if before_id is not None:
+            sql += " AND id < ?"
+            params.append(before_id)
+        sql += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+
+        keys = ('id', 'created_at', 'action', 'target_id', 'target_name', 'moderator_id',
+                'moderator_name', 'role_id', 'role_name')
+        return [dict(zip(keys, row)) for row in conn.execute(sql, params)]
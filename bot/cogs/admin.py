@@ -0,0 +1,160 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+import asyncio
+import logging
+import time
+from bot.commands import EXTENSIONS, snapshot_commands, sync_changed_commands
+from bot.diagnostics import collect_diagnostics
+from bot.embeds import build_diagnostics_embed
+from bot.event_bus import ConfigReloaded
+from bot.memory_profiler import memory_profiler
+from bot.permissions import PermissionLevel
+from bot.middleware import command_pipeline, send_response, CommandError
+from utils.log_analytics import log_analyzer, format_report
+
+logger = logging.getLogger(__name__)
+
+# /logstats window choices, in hours (0 = everything still on disk)
+LOG_WINDOWS = {
+    "Last hour": 1,
+    "Last 24 hours": 24,
+    "Last 7 days": 7 * 24,
+    "All logs": 0,
+}
+
+class AdminCommands(commands.Cog):
+    """Owner-only maintenance commands"""
+
+    memprofile = app_commands.Group(name="memprofile", description="Tracemalloc memory-growth profiling (Owner only)")
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="reload", description="Reload a command extension without restarting (Owner only)")
+    @app_commands.describe(extension="The command extension to reload")
+    @app_commands.choices(extension=[
+        app_commands.Choice(name=name.rsplit('.', 1)[-1], value=name) for name in EXTENSIONS
+    ])
+    @command_pipeline(
+        level=PermissionLevel.OWNER,
+        defer=True,
+        ephemeral=True,
+        denied_message="❌ Only the bot owner can use this command.",
+        error_message="❌ An error occurred while reloading the extension."
+    )
+    async def reload(self, interaction: discord.Interaction, extension: app_commands.Choice[str]):
+        """Reload an extension and re-sync only the commands it changed"""
+        started = time.perf_counter()
+        before = snapshot_commands(self.bot)
+        
+        try:
+            try:
+                await self.bot.reload_extension(extension.value)
+            except commands.ExtensionNotLoaded:
+                await self.bot.load_extension(extension.value)
+        except commands.ExtensionError as e:
+            logger.error(f"Failed to reload {extension.value}: {e}")
+            raise CommandError(f"Failed to reload `{extension.name}`: {e.__cause__ or e}")
+        
+        self.bot.event_bus.publish(ConfigReloaded(extension.value))
+        changed, removed = await sync_changed_commands(self.bot, before)
+        elapsed = time.perf_counter() - started
+        
+        synced = ", ".join(f"/{name}" for name in changed + removed) or "none"
+        await send_response(
+            interaction,
+            f"🔄 Reloaded `{extension.name}` in {elapsed:.2f}s. Commands re-synced: {synced}",
+            ephemeral=True
+        )
+        logger.info(f"Extension {extension.value} reloaded by {interaction.user} in {elapsed:.2f}s")
+
+    @app_commands.command(name="logstats", description="Command usage, errors and link handouts from the bot logs (Owner only)")
+    @app_commands.describe(window="How far back to look")
+    @app_commands.choices(window=[
+        app_commands.Choice(name=label, value=hours) for label, hours in LOG_WINDOWS.items()
+    ])
+    @command_pipeline(
+        level=PermissionLevel.OWNER,
+        defer=True,
+        ephemeral=True,
+        denied_message="❌ Only the bot owner can use this command.",
+        error_message="❌ An error occurred while reading the logs."
+    )
+    async def log_stats(self, interaction: discord.Interaction, window: app_commands.Choice[int]):
+        """Summarize the current and rotated log files"""
+        since = time.time() - window.value * 3600 if window.value else None
+        summary = await asyncio.to_thread(log_analyzer.summarize, since)
+        
+        embed = discord.Embed(
+            title=f"📊 Log Stats ({window.name})",
+            color=discord.Color.blue()
+        )
+        for title, text in format_report(summary):
+            embed.add_field(name=title, value=text[:1024], inline=False)
+        embed.set_footer(text=f"{summary['files']} log file(s) • Homeland RP | Official Bot")
+        await send_response(interaction, embed=embed, ephemeral=True)
+
+    @app_commands.command(name="diag", description="Show runtime health of the bot (Owner only)")
+    @command_pipeline(
+        level=PermissionLevel.OWNER,
+        ephemeral=True,
+        denied_message="❌ Only the bot owner can use this command.",
+        error_message="❌ An error occurred while collecting diagnostics."
+    )
+    async def diag(self, interaction: discord.Interaction):
+        """Report latency, loop lag, memory, caches, queues and slow handlers"""
+        diag = await collect_diagnostics(self.bot)
+        await send_response(interaction, embed=build_diagnostics_embed(diag), ephemeral=True)
+
+    @memprofile.command(name="start", description="Snapshot memory at an interval and write the top growth sites to disk")
+    @app_commands.describe(
+        interval_minutes="Minutes between snapshots",
+        count_objects="Also export live counts of Members, Views, Messages and other discord.py objects"
+    )
+    @command_pipeline(
+        level=PermissionLevel.OWNER,
+        defer=True,
+        ephemeral=True,
+        denied_message="❌ Only the bot owner can use this command.",
+        error_message="❌ An error occurred while starting memory profiling."
+    )
+    async def memprofile_start(self, interaction: discord.Interaction,
+                               interval_minutes: app_commands.Range[float, 0.5, 1440.0] = 5.0,
+                               count_objects: bool = False):
+        """Start periodic tracemalloc snapshots"""
+        if memory_profiler.running:
+            raise CommandError("Memory profiling is already running. Stop it first with `/memprofile stop`.")
+        
+        await memory_profiler.start(interval_minutes * 60, count_objects=count_objects)
+        await send_response(
+            interaction,
+            f"🔬 Memory profiling started. A growth report is written to `{memory_profiler.output_dir}` "
+            f"every {interval_minutes:g} minute(s).",
+            ephemeral=True
+        )
+        logger.info(f"Memory profiling started by {interaction.user}")
+
+    @memprofile.command(name="stop", description="Stop profiling and write a final report against the baseline")
+    @command_pipeline(
+        level=PermissionLevel.OWNER,
+        defer=True,
+        ephemeral=True,
+        denied_message="❌ Only the bot owner can use this command.",
+        error_message="❌ An error occurred while stopping memory profiling."
+    )
+    async def memprofile_stop(self, interaction: discord.Interaction):
+        """Stop profiling and report growth since it started"""
+        if not memory_profiler.running:
+            raise CommandError("Memory profiling isn't running.")
+        
+        path = await memory_profiler.stop()
+        await send_response(
+            interaction,
+            f"🔬 Memory profiling stopped after {memory_profiler.reports} report(s). Final report: `{path}`",
+            ephemeral=True
+        )
+        logger.info(f"Memory profiling stopped by {interaction.user}")
+
+async def setup(bot):
+    await bot.add_cog(AdminCommands(bot))
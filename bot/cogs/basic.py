@@ -0,0 +1,47 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+from typing import Optional
+from bot.views import get_link_view
+from bot.middleware import command_pipeline, send_response, CommandError
+
+class BasicCommands(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="status_server", description="Send server status with player count and event")
+    @app_commands.describe(
+        players="Number of players",
+        event="Current event",
+        code="Join code (leave empty to use the next pooled code)"
+    )
+    @command_pipeline()
+    async def status_server(self, interaction: discord.Interaction, players: int, event: str,
+                            code: Optional[str] = None):
+        join_codes = self.bot.server_manager.join_codes
+        if code is None:
+            code = join_codes.take()
+            if code is None:
+                raise CommandError("There are no live join codes. Pass one with `code` or add one with `/joincode add`.")
+
+        embed = discord.Embed(
+            title="🚧 Homeland RP 🚨",
+            description="Join us now and enjoy the roleplay!",
+            color=discord.Color.dark_blue()
+        )
+        embed.set_thumbnail(url="https://i.ibb.co/FndmtVx/logo.png")  # Cambia a tu logo si quieres
+        embed.add_field(name="Players", value=str(players), inline=True)
+        embed.add_field(name="Event", value=event, inline=True)
+        embed.add_field(name="Code", value=f"`{code}`", inline=False)
+        embed.add_field(
+            name="\u200b",
+            value="**Your stay in our ingame server will make us happy**\n🌆 | Please remember to follow all rules and regulations!",
+            inline=False
+        )
+
+        view = get_link_view(join_codes.launch_url(code), "Join Now")
+
+        await send_response(interaction, embed=embed, view=view)
+
+async def setup(bot):
+    await bot.add_cog(BasicCommands(bot))
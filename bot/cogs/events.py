@@ -0,0 +1,106 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+import logging
+import time
+from typing import List, Optional
+from bot.permissions import PermissionLevel
+from bot.middleware import command_pipeline, send_response, CommandError
+from bot.embeds import build_rp_events_embed
+
+logger = logging.getLogger(__name__)
+
+# Most reminder pings per session
+MAX_REMINDERS = 5
+
+def parse_reminders(value: str) -> List[int]:
+    """Parse "30, 10" into [30, 10]"""
+    minutes = []
+    for part in value.replace(" ", "").split(","):
+        if not part:
+            continue
+        if not part.isdigit() or not 1 <= int(part) <= 10080:
+            raise CommandError("Reminders must be minutes before the start, like `60, 15`.")
+        minutes.append(int(part))
+    if len(minutes) > MAX_REMINDERS:
+        raise CommandError(f"At most {MAX_REMINDERS} reminders per session.")
+    return minutes
+
+class EventCommands(commands.Cog):
+    """Scheduled RP sessions"""
+
+    rpevent = app_commands.Group(name="rpevent", description="Scheduled RP sessions")
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.rp_events = bot.rp_events
+
+    async def event_autocomplete(self, interaction: discord.Interaction,
+                                 current: str) -> List[app_commands.Choice[int]]:
+        if interaction.guild_id is None:
+            return []
+        current = current.lower()
+        return [
+            app_commands.Choice(name=f"#{event['id']} {event['title']}"[:100], value=event['id'])
+            for event in self.rp_events.upcoming(interaction.guild_id)
+            if current in f"#{event['id']} {event['title']}".lower()
+        ][:25]
+
+    @rpevent.command(name="create", description="Schedule an RP session in this channel (Owner/Admin only)")
+    @app_commands.describe(
+        title="What the session is about; shown as the current RP while it runs",
+        starts_in="Minutes from now until the session starts",
+        duration="How long the session runs, in minutes",
+        reminders="Reminder pings, in minutes before the start (e.g. 60, 15)",
+        ping="Role to ping with reminders and at the start"
+    )
+    @command_pipeline(
+        level=PermissionLevel.ADMIN,
+        guild_only=True,
+        denied_message="❌ Only the owner or administrators can schedule RP sessions.",
+        error_message="❌ An error occurred while scheduling the RP session."
+    )
+    async def rpevent_create(self, interaction: discord.Interaction, title: str,
+                             starts_in: app_commands.Range[int, 1, 43200],
+                             duration: app_commands.Range[int, 15, 1440] = 120,
+                             reminders: Optional[str] = None, ping: Optional[discord.Role] = None):
+        """Schedule a session with reminders"""
+        if len(title) > 200:
+            raise CommandError("The session title must be 200 characters or less.")
+        offsets = parse_reminders(reminders) if reminders is not None else self.rp_events.default_reminders
+
+        starts_at = time.time() + starts_in * 60
+        event = await self.rp_events.create(
+            interaction.guild.id, interaction.channel.id, title, starts_at, starts_at + duration * 60,
+            [minutes for minutes in offsets if minutes < starts_in], ping.id if ping else None, str(interaction.user)
+        )
+
+        embed = build_rp_events_embed([event])
+        embed.title = "✅ RP Session Scheduled"
+        await send_response(interaction, embed=embed)
+
+    @rpevent.command(name="list", description="Show upcoming and running RP sessions")
+    @command_pipeline(guild_only=True, error_message="❌ Unable to list RP sessions.")
+    async def rpevent_list(self, interaction: discord.Interaction):
+        """List this guild's sessions"""
+        await send_response(interaction, embed=build_rp_events_embed(self.rp_events.upcoming(interaction.guild.id)))
+
+    @rpevent.command(name="cancel", description="Cancel a scheduled or running RP session (Owner/Admin only)")
+    @app_commands.describe(event="The session to cancel")
+    @app_commands.autocomplete(event=event_autocomplete)
+    @command_pipeline(
+        level=PermissionLevel.ADMIN,
+        guild_only=True,
+        denied_message="❌ Only the owner or administrators can cancel RP sessions.",
+        error_message="❌ An error occurred while cancelling the RP session."
+    )
+    async def rpevent_cancel(self, interaction: discord.Interaction, event: int):
+        """Cancel a session and its pending reminders"""
+        cancelled = await self.rp_events.cancel(event, interaction.guild.id)
+        if cancelled is None:
+            raise CommandError(f"There is no RP session #{event} in this server.")
+        await send_response(interaction, f"🗑️ Cancelled RP session #{event} **{cancelled['title']}**.")
+        logger.info(f"RP session #{event} cancelled by {interaction.user}")
+
+async def setup(bot):
+    await bot.add_cog(EventCommands(bot))
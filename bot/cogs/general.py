@@ -0,0 +1,44 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+import logging
+from bot.middleware import command_pipeline, send_response
+from bot.embeds import build_bot_info_embed, build_leaderboard_embed
+from bot.render_cache import render_cache
+
+logger = logging.getLogger(__name__)
+
+class GeneralCommands(commands.Cog):
+    """General information about the bot"""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="botinfo", description="Get information about the bot")
+    @command_pipeline()
+    async def botinfo(self, interaction: discord.Interaction):
+        """Display bot information"""
+        # Everything but the guild count is static
+        guild_count = len(self.bot.guilds)
+        embed = render_cache.get("botinfo", None, guild_count)
+        if embed is None:
+            embed = render_cache.put("botinfo", None, guild_count, build_bot_info_embed(guild_count))
+        await send_response(interaction, embed=embed)
+
+    @app_commands.command(name="leaderboard", description="Show the most active roleplayers in this server")
+    @command_pipeline(guild_only=True, error_message="❌ Unable to load the leaderboard.")
+    async def leaderboard(self, interaction: discord.Interaction):
+        """Display the activity top 10 and the caller's own count"""
+        activity = self.bot.activity_tracker
+        guild = interaction.guild
+        embed = build_leaderboard_embed(
+            guild.name,
+            activity.leaderboard(guild.id, 10),
+            activity.rank_of(guild.id, interaction.user.id),
+            activity.reward_role,
+            activity.reward_threshold
+        )
+        await send_response(interaction, embed=embed)
+
+async def setup(bot):
+    await bot.add_cog(GeneralCommands(bot))
@@ -0,0 +1,315 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+import logging
+from typing import List, Optional
+from bot.permissions import PermissionLevel
+from bot.middleware import command_pipeline, send_response, CommandError
+from bot.embeds import (build_role_info_embed, build_role_history_embed, build_role_panel_embed,
+                        build_reaction_roles_embed)
+from bot.reaction_roles import RoleButton, button_key, emoji_key
+from bot.render_cache import render_cache
+from config.settings import BOT_CONFIG
+
+logger = logging.getLogger(__name__)
+
+HISTORY_PAGE_SIZE = BOT_CONFIG.get('role_audit', {}).get('page_size', 10)
+
+class RoleHistoryPaginator(discord.ui.View):
+    """Older/newer buttons for /rolehistory using keyset cursors"""
+
+    def __init__(self, audit, author_id: int, guild_id: int, filter_name: str, value: int, subject: str):
+        super().__init__(timeout=120)
+        self.audit = audit
+        self.author_id = author_id
+        self.guild_id = guild_id
+        self.filter_name = filter_name
+        self.value = value
+        self.subject = subject
+        # before_id cursor of every page shown so far; None is the newest page
+        self.cursors = [None]
+        self.rows = []
+
+    async def load(self) -> discord.Embed:
+        self.rows = await self.audit.query(
+            self.guild_id, self.filter_name, self.value, HISTORY_PAGE_SIZE, self.cursors[-1]
+        )
+        self.newer.disabled = len(self.cursors) == 1
+        self.older.disabled = len(self.rows) < HISTORY_PAGE_SIZE
+        return build_role_history_embed(self.subject, self.rows, len(self.cursors))
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user.id == self.author_id
+
+    @discord.ui.button(label="◀ Newer", style=discord.ButtonStyle.secondary)
+    async def newer(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.cursors.pop()
+        await interaction.response.edit_message(embed=await self.load(), view=self)
+
+    @discord.ui.button(label="Older ▶", style=discord.ButtonStyle.secondary)
+    async def older(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.cursors.append(self.rows[-1]['id'])
+        await interaction.response.edit_message(embed=await self.load(), view=self)
+
+class RoleCommands(commands.Cog):
+    """Role assignment and role information"""
+
+    reactionrole = app_commands.Group(name="reactionrole", description="Self-assignable roles through reactions and buttons (Admin only)")
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.role_manager = bot.role_manager
+        self.reaction_roles = bot.reaction_roles
+
+    def _check_assignable(self, guild: discord.Guild, role: discord.Role):
+        if not self.role_manager.is_role_manageable(role, guild.me):
+            raise CommandError(
+                f"I can't hand out '{role.name}': it's protected, managed by an integration or above my highest role."
+            )
+
+    def _resolve_role(self, guild: discord.Guild, value: str) -> discord.Role:
+        """Autocomplete sends the role id; typed names that weren't picked still resolve"""
+        role = guild.get_role(int(value)) if value.isdigit() else None
+        if role is None:
+            role = discord.utils.find(lambda r: r.name.lower() == value.strip().lower(), guild.roles)
+        if role is None:
+            raise CommandError(f"I couldn't find a role called '{value}'.")
+        return role
+
+    async def _role_choices(self, interaction: discord.Interaction, current: str,
+                            held: bool) -> List[app_commands.Choice[str]]:
+        guild = interaction.guild
+        if guild is None:
+            return []
+        # Narrow to roles the chosen member has (removing) or lacks (adding) once a member is picked
+        member = getattr(interaction.namespace, 'member', None)
+        member_roles = {role.id for role in member.roles} if isinstance(member, discord.Member) else None
+        if held:
+            roles = self.bot.role_search.search(guild, current, only=member_roles)
+        else:
+            roles = self.bot.role_search.search(guild, current, exclude=member_roles)
+        return [app_commands.Choice(name=role.name[:100], value=str(role.id)) for role in roles]
+
+    async def assignable_role_autocomplete(self, interaction: discord.Interaction,
+                                           current: str) -> List[app_commands.Choice[str]]:
+        return await self._role_choices(interaction, current, held=False)
+
+    async def held_role_autocomplete(self, interaction: discord.Interaction,
+                                     current: str) -> List[app_commands.Choice[str]]:
+        return await self._role_choices(interaction, current, held=True)
+
+    @app_commands.command(name="addrole", description="Add a role to a user (Owner only)")
+    @app_commands.describe(
+        member="The member to add the role to",
+        role="The role to add"
+    )
+    @app_commands.autocomplete(role=assignable_role_autocomplete)
+    @command_pipeline(
+        level=PermissionLevel.OWNER,
+        guild_only=True,
+        denied_message="❌ Only the bot owner can use this command.",
+        error_message="❌ An error occurred while adding the role."
+    )
+    async def add_role(self, interaction: discord.Interaction, member: discord.Member, role: str):
+        """Add a role to a member"""
+        role = self._resolve_role(interaction.guild, role)
+        success, message = await self.role_manager.add_role(member, role, interaction.user)
+        if not success:
+            raise CommandError(message)
+        
+        embed = discord.Embed(
+            title="✅ Role Added Successfully",
+            description=message,
+            color=discord.Color.green()
+        )
+        embed.set_footer(text="Homeland RP | Official Bot")
+        await send_response(interaction, embed=embed)
+        logger.info(f"Role {role.name} added to {member} by {interaction.user}")
+
+    @app_commands.command(name="removerole", description="Remove a role from a user (Owner only)")
+    @app_commands.describe(
+        member="The member to remove the role from",
+        role="The role to remove"
+    )
+    @app_commands.autocomplete(role=held_role_autocomplete)
+    @command_pipeline(
+        level=PermissionLevel.OWNER,
+        guild_only=True,
+        denied_message="❌ Only the bot owner can use this command.",
+        error_message="❌ An error occurred while removing the role."
+    )
+    async def remove_role(self, interaction: discord.Interaction, member: discord.Member, role: str):
+        """Remove a role from a member"""
+        role = self._resolve_role(interaction.guild, role)
+        success, message = await self.role_manager.remove_role(member, role, interaction.user)
+        if not success:
+            raise CommandError(message)
+        
+        embed = discord.Embed(
+            title="✅ Role Removed Successfully",
+            description=message,
+            color=discord.Color.orange()
+        )
+        embed.set_footer(text="Homeland RP | Official Bot")
+        await send_response(interaction, embed=embed)
+        logger.info(f"Role {role.name} removed from {member} by {interaction.user}")
+
+    @app_commands.command(name="roleinfo", description="Get information about server roles")
+    @command_pipeline(guild_only=True, error_message="❌ Unable to retrieve role information.")
+    async def role_info(self, interaction: discord.Interaction):
+        """Display information about available roles"""
+        role_manager = self.role_manager
+        guild = interaction.guild
+        
+        async def build():
+            roles_info = await role_manager.get_roles_info(guild)
+            return build_role_info_embed(roles_info)
+        
+        # The role scan only runs when the guild's role index has changed
+        embed = await render_cache.render(
+            "roleinfo", guild.id, role_manager.get_guild_version(guild.id), build
+        )
+        await send_response(interaction, embed=embed)
+
+    @app_commands.command(name="rolehistory", description="Show who changed roles for a member, by a moderator, or for a role")
+    @app_commands.describe(
+        member="Show role changes made to this member",
+        moderator="Show role changes made by this moderator",
+        role="Show changes of this role"
+    )
+    @command_pipeline(
+        level=PermissionLevel.MODERATOR,
+        guild_only=True,
+        ephemeral=True,
+        denied_message="❌ Only moderators and above can view role history.",
+        error_message="❌ Unable to retrieve role history."
+    )
+    async def role_history(self, interaction: discord.Interaction, member: Optional[discord.Member] = None,
+                           moderator: Optional[discord.Member] = None, role: Optional[discord.Role] = None):
+        """Display paginated role change history"""
+        filters = [
+            (name, value) for name, value in (("target", member), ("moderator", moderator), ("role", role))
+            if value is not None
+        ]
+        if len(filters) != 1:
+            raise CommandError("Pick exactly one of member, moderator or role.")
+        
+        filter_name, subject = filters[0]
+        label = f"@{subject}" if filter_name != "role" else subject.name
+        if filter_name == "moderator":
+            label = f"changes by @{subject}"
+        
+        view = RoleHistoryPaginator(
+            self.role_manager.audit, interaction.user.id, interaction.guild.id, filter_name, subject.id, label
+        )
+        embed = await view.load()
+        await send_response(interaction, embed=embed, view=view, ephemeral=True)
+
+    @reactionrole.command(name="add", description="Give a role to members who react to a message in this channel")
+    @app_commands.describe(
+        message_id="ID of the message in this channel",
+        emoji="The emoji members react with",
+        role="The role to give"
+    )
+    @command_pipeline(
+        level=PermissionLevel.ADMIN,
+        guild_only=True,
+        defer=True,
+        ephemeral=True,
+        denied_message="❌ Only admins can set up reaction roles.",
+        error_message="❌ An error occurred while adding the reaction role."
+    )
+    async def reactionrole_add(self, interaction: discord.Interaction, message_id: str, emoji: str, role: discord.Role):
+        """Bind an emoji on a message to a role"""
+        if not message_id.isdigit():
+            raise CommandError("That isn't a valid message ID.")
+        self._check_assignable(interaction.guild, role)
+        
+        partial = discord.PartialEmoji.from_str(emoji.strip())
+        message = interaction.channel.get_partial_message(int(message_id))
+        try:
+            await message.add_reaction(partial)
+        except discord.NotFound:
+            raise CommandError("I couldn't find that message in this channel.")
+        except discord.HTTPException:
+            raise CommandError("I couldn't react with that emoji.")
+        
+        self.reaction_roles.bind(
+            interaction.guild.id, interaction.channel.id, message.id, emoji_key(partial), role, str(partial)
+        )
+        await self.reaction_roles.save()
+        await send_response(interaction, f"✅ Reacting with {partial} now gives **{role.name}**.", ephemeral=True)
+        logger.info(f"Reaction role {partial} -> {role.name} on {message.id} added by {interaction.user}")
+
+    @reactionrole.command(name="buttons", description="Post a panel of buttons that toggle roles")
+    @app_commands.describe(title="Title of the panel", role1="First role", role2="Second role",
+                           role3="Third role", role4="Fourth role", role5="Fifth role")
+    @command_pipeline(
+        level=PermissionLevel.ADMIN,
+        guild_only=True,
+        defer=True,
+        ephemeral=True,
+        denied_message="❌ Only admins can set up button roles.",
+        error_message="❌ An error occurred while posting the role panel."
+    )
+    async def reactionrole_buttons(self, interaction: discord.Interaction, title: str, role1: discord.Role,
+                                   role2: Optional[discord.Role] = None, role3: Optional[discord.Role] = None,
+                                   role4: Optional[discord.Role] = None, role5: Optional[discord.Role] = None):
+        """Post a role button panel in this channel"""
+        roles = list({role.id: role for role in (role1, role2, role3, role4, role5) if role is not None}.values())
+        for role in roles:
+            self._check_assignable(interaction.guild, role)
+        
+        view = discord.ui.View(timeout=None)
+        for role in roles:
+            view.add_item(RoleButton(role.id, label=role.name))
+        message = await interaction.channel.send(embed=build_role_panel_embed(title, roles), view=view)
+        
+        for role in roles:
+            self.reaction_roles.bind(interaction.guild.id, interaction.channel.id, message.id, button_key(role.id), role)
+        await self.reaction_roles.save()
+        await send_response(interaction, f"✅ Posted a panel with {len(roles)} role button(s).", ephemeral=True)
+        logger.info(f"Role button panel {message.id} posted by {interaction.user}")
+
+    @reactionrole.command(name="remove", description="Stop a message from handing out roles")
+    @app_commands.describe(
+        message_id="ID of the reaction role or button panel message",
+        emoji="Only remove this emoji's binding (all bindings if left empty)"
+    )
+    @command_pipeline(
+        level=PermissionLevel.ADMIN,
+        guild_only=True,
+        ephemeral=True,
+        denied_message="❌ Only admins can remove reaction roles.",
+        error_message="❌ An error occurred while removing the reaction role."
+    )
+    async def reactionrole_remove(self, interaction: discord.Interaction, message_id: str, emoji: Optional[str] = None):
+        """Unbind one emoji, or every reaction and button, from a message"""
+        if not message_id.isdigit():
+            raise CommandError("That isn't a valid message ID.")
+        bindings = self.reaction_roles.index.get(int(message_id), {})
+        if not any(binding['guild_id'] == interaction.guild.id for binding in bindings.values()):
+            raise CommandError("That message has no reaction or button roles.")
+        
+        key = emoji_key(discord.PartialEmoji.from_str(emoji.strip())) if emoji else None
+        removed = self.reaction_roles.unbind(int(message_id), key)
+        if not removed:
+            raise CommandError("That emoji isn't bound on that message.")
+        await self.reaction_roles.save()
+        await send_response(interaction, f"✅ Removed {removed} binding(s).", ephemeral=True)
+
+    @reactionrole.command(name="list", description="List the reaction and button roles in this server")
+    @command_pipeline(
+        level=PermissionLevel.ADMIN,
+        guild_only=True,
+        ephemeral=True,
+        denied_message="❌ Only admins can list reaction roles.",
+        error_message="❌ Unable to list reaction roles."
+    )
+    async def reactionrole_list(self, interaction: discord.Interaction):
+        """Show every binding in the guild"""
+        bindings = self.reaction_roles.bindings_for_guild(interaction.guild.id)
+        await send_response(interaction, embed=build_reaction_roles_embed(bindings), ephemeral=True)
+
+async def setup(bot):
+    await bot.add_cog(RoleCommands(bot))
@@ -0,0 +1,231 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+import logging
+import time
+from typing import List, Optional
+from bot.join_codes import parse_code
+from bot.permissions import PermissionLevel
+from bot.middleware import command_pipeline, send_response, CommandError
+from bot.embeds import (
+    build_join_codes_embed, build_server_embed, build_server_status_embed, build_status_history_embed
+)
+from bot.render_cache import render_cache
+
+logger = logging.getLogger(__name__)
+
+# /statushistory window choices, in seconds
+HISTORY_WINDOWS = {
+    "Last hour": 3600,
+    "Last 6 hours": 6 * 3600,
+    "Last 24 hours": 24 * 3600,
+    "Last 7 days": 7 * 86400,
+    "Last 30 days": 30 * 86400,
+    "Last year": 365 * 86400,
+}
+
+UNSAVED_NOTE = "\n⚠️ The saved join code pool couldn't be read or written, so this change only lasts until the bot restarts."
+
+class ServerCommands(commands.Cog):
+    """Server links, join codes, status and status history"""
+
+    joincode = app_commands.Group(name="joincode", description="Manage the pool of join codes handed out by /server")
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.server_manager = bot.server_manager
+        self.join_codes = bot.server_manager.join_codes
+
+    async def join_code_autocomplete(self, interaction: discord.Interaction,
+                                     current: str) -> List[app_commands.Choice[str]]:
+        current = current.lower()
+        return [
+            app_commands.Choice(name=code, value=code)
+            for code in self.join_codes.codes
+            if current in code.lower()
+        ][:25]
+
+    @app_commands.command(name="server", description="Get a Roblox private server link for Homeland RP")
+    @command_pipeline(error_message="❌ Unable to retrieve server link at this time. Please try again later.")
+    async def get_server(self, interaction: discord.Interaction):
+        """Provide a Roblox private server link"""
+        server_manager = self.server_manager
+        server_link = await server_manager.get_server_link()
+        
+        embed = render_cache.get("server", server_link, server_manager.links_version)
+        if embed is None:
+            embed = render_cache.put(
+                "server", server_link, server_manager.links_version,
+                build_server_embed(server_link)
+            )
+        
+        await send_response(interaction, embed=embed)
+        logger.info(f"Server link provided to {interaction.user} in {interaction.guild}")
+
+    @app_commands.command(name="serverstatus", description="Check Roblox server status and player count")
+    @command_pipeline(error_message="❌ Unable to retrieve server status at this time. Please try again later.")
+    async def server_status(self, interaction: discord.Interaction):
+        """Display server status information"""
+        server_manager = self.server_manager
+        
+        # Point at the live board instead of posting another copy of it
+        board = self.bot.status_board
+        if board.redirect_serverstatus and board.jump_url and interaction.guild_id == board.guild_id:
+            await send_response(
+                interaction,
+                f"📌 The live server status is always up to date here: {board.jump_url}",
+                ephemeral=True
+            )
+            return
+        
+        # Get server status from server manager, unless it hasn't changed since the last render
+        version = server_manager.status_cache_version()
+        embed = render_cache.get("serverstatus", None, version)
+        if embed is None:
+            status_info = await server_manager.get_server_status()
+            embed = build_server_status_embed(status_info)
+            # The "Status unavailable" fallback is never cached, so the next call reads the file again
+            if not status_info.get('fallback'):
+                embed = render_cache.put("serverstatus", None, version, embed)
+        
+        await send_response(interaction, embed=embed)
+        logger.info(f"Server status requested by {interaction.user}")
+
+    @app_commands.command(name="updatestatus", description="Update server player count and current RP (Owner/Admin only)")
+    @app_commands.describe(
+        player_count="Number of players currently online (0-50)",
+        current_rp="Current roleplay scenario happening on the server"
+    )
+    @command_pipeline(
+        level=PermissionLevel.ADMIN,
+        denied_message="❌ Only the owner or administrators can update server status.",
+        error_message="❌ An error occurred while updating server status."
+    )
+    async def update_status(self, interaction: discord.Interaction, player_count: int, current_rp: str):
+        """Update server status information"""
+        # Validate player count
+        if player_count < 0 or player_count > 50:
+            raise CommandError("Player count must be between 0 and 50.")
+        
+        # Validate RP description length
+        if len(current_rp) > 200:
+            raise CommandError("Current RP description must be 200 characters or less.")
+        
+        # Update server status
+        success = await self.server_manager.update_server_status(
+            player_count, 
+            current_rp, 
+            str(interaction.user)
+        )
+        if not success:
+            raise CommandError("Failed to update server status. Please try again later.")
+        
+        embed = discord.Embed(
+            title="✅ Server Status Updated",
+            description="Server information has been updated successfully!",
+            color=discord.Color.green()
+        )
+        embed.add_field(
+            name="👥 Player Count",
+            value=f"{player_count}/50",
+            inline=True
+        )
+        embed.add_field(
+            name="🎭 Current RP",
+            value=current_rp,
+            inline=False
+        )
+        embed.set_footer(text=f"Updated by {interaction.user} • Homeland RP | Official Bot")
+        await send_response(interaction, embed=embed)
+        logger.info(f"Server status updated by {interaction.user}: {player_count} players, RP: {current_rp}")
+
+    @app_commands.command(name="statusboard", description="Post the live status board in this channel (Owner/Admin only)")
+    @command_pipeline(
+        level=PermissionLevel.ADMIN,
+        guild_only=True,
+        ephemeral=True,
+        denied_message="❌ Only the owner or administrators can move the status board.",
+        error_message="❌ An error occurred while posting the status board."
+    )
+    async def status_board(self, interaction: discord.Interaction):
+        """Move the live status board to the current channel"""
+        board = self.bot.status_board
+        if not await board.move_to(interaction.channel):
+            raise CommandError("Failed to post the status board. Check my permissions in this channel.")
+        await send_response(interaction, f"✅ Status board posted: {board.jump_url}", ephemeral=True)
+        logger.info(f"Status board moved to #{interaction.channel} by {interaction.user}")
+
+    @app_commands.command(name="statushistory", description="Show peak, average and trend of the player count")
+    @app_commands.describe(window="How far back to look")
+    @app_commands.choices(window=[
+        app_commands.Choice(name=label, value=seconds) for label, seconds in HISTORY_WINDOWS.items()
+    ])
+    @command_pipeline(error_message="❌ Unable to retrieve status history.")
+    async def status_history(self, interaction: discord.Interaction, window: app_commands.Choice[int]):
+        """Display player-count history over a window"""
+        history = self.server_manager.history.query(window.value)
+        await send_response(interaction, embed=build_status_history_embed(window.name, history))
+
+    @joincode.command(name="add", description="Add a join code to the pool (Owner/Admin only)")
+    @app_commands.describe(
+        code="The join code, or a launch link containing one",
+        hours="Hours until the code expires; 0 never expires (defaults to the configured lifetime)",
+        capacity="How many times the code may be handed out (unlimited if empty)"
+    )
+    @command_pipeline(
+        level=PermissionLevel.ADMIN,
+        ephemeral=True,
+        denied_message="❌ Only the owner or administrators can manage join codes.",
+        error_message="❌ An error occurred while adding the join code."
+    )
+    async def joincode_add(self, interaction: discord.Interaction, code: str,
+                           hours: Optional[app_commands.Range[int, 0, 720]] = None,
+                           capacity: Optional[app_commands.Range[int, 1, 10000]] = None):
+        """Add a code with an expiry and capacity"""
+        parsed = parse_code(code)
+        if parsed is None:
+            raise CommandError("Join codes are 4-32 letters and digits.")
+        hours = self.join_codes.default_ttl_hours if hours is None else hours
+        expires_at = time.time() + hours * 3600 if hours else None
+        if not self.join_codes.add(parsed, expires_at, capacity, str(interaction.user)):
+            raise CommandError(f"`{parsed}` is already in the pool.")
+        saved = await self.join_codes.save()
+        
+        expiry = f"expires <t:{int(expires_at)}:R>" if expires_at else "never expires"
+        await send_response(
+            interaction, f"✅ Added join code `{parsed}`; it {expiry}.{'' if saved else UNSAVED_NOTE}", ephemeral=True
+        )
+        logger.info(f"Join code {parsed} added by {interaction.user}")
+
+    @joincode.command(name="remove", description="Remove a join code from the pool (Owner/Admin only)")
+    @app_commands.describe(code="The join code to remove")
+    @app_commands.autocomplete(code=join_code_autocomplete)
+    @command_pipeline(
+        level=PermissionLevel.ADMIN,
+        ephemeral=True,
+        denied_message="❌ Only the owner or administrators can manage join codes.",
+        error_message="❌ An error occurred while removing the join code."
+    )
+    async def joincode_remove(self, interaction: discord.Interaction, code: str):
+        """Remove a code before it expires"""
+        if not self.join_codes.remove(code):
+            raise CommandError(f"`{code}` is not in the pool.")
+        saved = await self.join_codes.save()
+        await send_response(interaction, f"🗑️ Removed join code `{code}`.{'' if saved else UNSAVED_NOTE}", ephemeral=True)
+        logger.info(f"Join code {code} removed by {interaction.user}")
+
+    @joincode.command(name="list", description="Show the live join codes (Owner/Admin only)")
+    @command_pipeline(
+        level=PermissionLevel.ADMIN,
+        ephemeral=True,
+        denied_message="❌ Only the owner or administrators can view join codes.",
+        error_message="❌ Unable to list join codes."
+    )
+    async def joincode_list(self, interaction: discord.Interaction):
+        """List live codes, soonest to expire first"""
+        # Drop anything that expired since the last reaper pass
+        self.join_codes.reap()
+        await send_response(interaction, embed=build_join_codes_embed(self.join_codes.live()), ephemeral=True)
+
+async def setup(bot):
+    await bot.add_cog(ServerCommands(bot))
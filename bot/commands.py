@@ -1,396 +1,53 @@
-import discord
-from discord.ext import commands
-from discord import app_commands
 import logging
-from bot.role_manager import RoleManager
-from bot.server_manager import ServerManager
-from bot.permissions import has_permission, PermissionLevel
-from config.settings import BOT_CONFIG
+from typing import Dict, List, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Command extensions loaded at startup, in order
+EXTENSIONS = [
+    "bot.cogs.general",
+    "bot.cogs.server",
+    "bot.cogs.roles",
+    "bot.cogs.events",
+    "bot.cogs.basic",
+    "bot.cogs.admin",
+]
+
 async def setup_commands(bot):
-    """Setup all bot commands"""
-    role_manager = RoleManager()
-    server_manager = ServerManager()
-    
-    @bot.tree.command(name="server", description="Get a Roblox private server link for Homeland RP")
-    async def get_server(interaction: discord.Interaction):
-        """Provide a Roblox private server link"""
-        try:
-            server_link = await server_manager.get_server_link()
-            
-            embed = discord.Embed(
-                title="🎮 Homeland RP Private Server",
-                description=f"Join our private server using the link below:",
-                color=discord.Color.blue()
-            )
-            embed.add_field(
-                name="Server Link",
-                value=f"[Click here to join!]({server_link})",
-                inline=False
-            )
-            embed.add_field(
-                name="📋 Instructions",
-                value="1. Click the link above\n2. Wait for Roblox to load\n3. Have fun roleplaying!",
-                inline=False
-            )
-            embed.set_footer(text="Homeland RP | Official Bot")
-            
-            await interaction.response.send_message(embed=embed)
-            logger.info(f"Server link provided to {interaction.user} in {interaction.guild}")
-            
-        except Exception as e:
-            logger.error(f"Error providing server link: {e}")
-            await interaction.response.send_message(
-                "❌ Unable to retrieve server link at this time. Please try again later.",
-                ephemeral=True
-            )
-    
-    @bot.tree.command(name="addrole", description="Add a role to a user (Owner only)")
-    @app_commands.describe(
-        member="The member to add the role to",
-        role="The role to add"
-    )
-    async def add_role(interaction: discord.Interaction, member: discord.Member, role: discord.Role):
-        """Add a role to a member"""
-        if not has_permission(interaction.user, PermissionLevel.OWNER):
-            await interaction.response.send_message(
-                "❌ Only the bot owner can use this command.",
-                ephemeral=True
-            )
-            return
-        
-        try:
-            # Ensure we have a guild member context
-            if not isinstance(interaction.user, discord.Member):
-                await interaction.response.send_message(
-                    "❌ This command can only be used in a server.",
-                    ephemeral=True
-                )
-                return
-            
-            success, message = await role_manager.add_role(member, role, interaction.user)
-            
-            if success:
-                embed = discord.Embed(
-                    title="✅ Role Added Successfully",
-                    description=message,
-                    color=discord.Color.green()
-                )
-                embed.set_footer(text="Homeland RP | Official Bot")
-                await interaction.response.send_message(embed=embed)
-                logger.info(f"Role {role.name} added to {member} by {interaction.user}")
-            else:
-                await interaction.response.send_message(f"❌ {message}", ephemeral=True)
-                
-        except Exception as e:
-            logger.error(f"Error adding role: {e}")
-            try:
-                if not interaction.response.is_done():
-                    await interaction.response.send_message(
-                        "❌ An error occurred while adding the role.",
-                        ephemeral=True
-                    )
-                else:
-                    await interaction.followup.send(
-                        "❌ An error occurred while adding the role.",
-                        ephemeral=True
-                    )
-            except Exception as followup_error:
-                logger.error(f"Error sending error message: {followup_error}")
-    
-    @bot.tree.command(name="removerole", description="Remove a role from a user (Owner only)")
-    @app_commands.describe(
-        member="The member to remove the role from",
-        role="The role to remove"
-    )
-    async def remove_role(interaction: discord.Interaction, member: discord.Member, role: discord.Role):
-        """Remove a role from a member"""
-        if not has_permission(interaction.user, PermissionLevel.OWNER):
-            await interaction.response.send_message(
-                "❌ Only the bot owner can use this command.",
-                ephemeral=True
-            )
-            return
-        
-        try:
-            # Ensure we have a guild member context
-            if not isinstance(interaction.user, discord.Member):
-                await interaction.response.send_message(
-                    "❌ This command can only be used in a server.",
-                    ephemeral=True
-                )
-                return
-            
-            success, message = await role_manager.remove_role(member, role, interaction.user)
-            
-            if success:
-                embed = discord.Embed(
-                    title="✅ Role Removed Successfully",
-                    description=message,
-                    color=discord.Color.orange()
-                )
-                embed.set_footer(text="Homeland RP | Official Bot")
-                await interaction.response.send_message(embed=embed)
-                logger.info(f"Role {role.name} removed from {member} by {interaction.user}")
-            else:
-                await interaction.response.send_message(f"❌ {message}", ephemeral=True)
-                
-        except Exception as e:
-            logger.error(f"Error removing role: {e}")
-            try:
-                if not interaction.response.is_done():
-                    await interaction.response.send_message(
-                        "❌ An error occurred while removing the role.",
-                        ephemeral=True
-                    )
-                else:
-                    await interaction.followup.send(
-                        "❌ An error occurred while removing the role.",
-                        ephemeral=True
-                    )
-            except Exception as followup_error:
-                logger.error(f"Error sending error message: {followup_error}")
-    
-    @bot.tree.command(name="roleinfo", description="Get information about server roles")
-    async def role_info(interaction: discord.Interaction):
-        """Display information about available roles"""
+    """Setup all bot commands by loading the command extensions"""
+    for extension in EXTENSIONS:
         try:
-            if not interaction.guild:
-                await interaction.response.send_message(
-                    "❌ This command can only be used in a server.",
-                    ephemeral=True
-                )
-                return
-            
-            roles_info = await role_manager.get_roles_info(interaction.guild)
-            
-            embed = discord.Embed(
-                title="📋 Server Roles Information",
-                description="Here are the available roles in this server:",
-                color=discord.Color.blue()
-            )
-            
-            for category, roles in roles_info.items():
-                if roles:
-                    role_list = "\n".join([f"• {role['name']} - {role['members']} members" for role in roles])
-                    embed.add_field(
-                        name=f"{category}",
-                        value=role_list,
-                        inline=False
-                    )
-            
-            embed.set_footer(text="Homeland RP | Official Bot")
-            await interaction.response.send_message(embed=embed)
-            
+            await bot.load_extension(extension)
         except Exception as e:
-            logger.error(f"Error getting role info: {e}")
-            await interaction.response.send_message(
-                "❌ Unable to retrieve role information.",
-                ephemeral=True
-            )
-    
-    @bot.tree.command(name="botinfo", description="Get information about the bot")
-    async def bot_info(interaction: discord.Interaction):
-        """Display bot information"""
-        embed = discord.Embed(
-            title="🤖 Homeland RP | Official Bot",
-            description="Your official bot for Homeland RP server management!",
-            color=discord.Color.gold()
-        )
-        
-        embed.add_field(
-            name="📋 Features",
-            value="• Private server link distribution\n• Role management system\n• Permission-based commands\n• Activity logging",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🔧 Commands",
-            value="• `/server` - Get private server link\n• `/serverstatus` - Check server status\n• `/updatestatus` - Update server info (Owner/Admin only)\n• `/addrole` - Add role to user (Owner only)\n• `/removerole` - Remove role from user (Owner only)\n• `/roleinfo` - View role information",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="👥 Guild Info",
-            value=f"Serving {len(bot.guilds)} server(s)",
-            inline=True
-        )
-        
-        embed.set_footer(text="Homeland RP | Official Bot • Made for the community")
-        await interaction.response.send_message(embed=embed)
-    
-    @bot.tree.command(name="serverstatus", description="Check Roblox server status and player count")
-    async def server_status(interaction: discord.Interaction):
-        """Display server status information"""
-        try:
-            # Get server status from server manager
-            status_info = await server_manager.get_server_status()
-            
-            embed = discord.Embed(
-                title="🎮 Homeland RP Server Status",
-                color=discord.Color.green() if status_info.get('online', False) else discord.Color.red()
-            )
-            
-            # Server status
-            status_emoji = "🟢" if status_info.get('online', False) else "🔴"
-            embed.add_field(
-                name=f"{status_emoji} Server Status",
-                value="Online" if status_info.get('online', False) else "Offline",
-                inline=True
-            )
-            
-            # Player count
-            player_count = status_info.get('player_count', 'Unknown')
-            embed.add_field(
-                name="👥 Players Count",
-                value=f"{player_count}/50" if isinstance(player_count, int) else str(player_count),
-                inline=True
-            )
-            
-            # Current RP scenario
-            current_rp = status_info.get('current_rp', 'No active RP session')
-            embed.add_field(
-                name="🎭 Current RP",
-                value=current_rp,
-                inline=False
-            )
-            
-            # Last updated and updated by
-            last_updated = status_info.get('last_updated', 'Not set')
-            updated_by = status_info.get('updated_by', 'System')
-            embed.set_footer(text=f"Last updated: {last_updated} by {updated_by} • Homeland RP | Official Bot")
-            
-            await interaction.response.send_message(embed=embed)
-            logger.info(f"Server status requested by {interaction.user}")
-            
-        except Exception as e:
-            logger.error(f"Error getting server status: {e}")
-            try:
-                if not interaction.response.is_done():
-                    embed = discord.Embed(
-                        title="❌ Server Status Error",
-                        description="Unable to retrieve server status at this time. Please try again later.",
-                        color=discord.Color.red()
-                    )
-                    embed.set_footer(text="Homeland RP | Official Bot")
-                    await interaction.response.send_message(embed=embed, ephemeral=True)
-            except Exception as followup_error:
-                logger.error(f"Error sending server status error message: {followup_error}")
-    
-    @bot.tree.command(name="updatestatus", description="Update server player count and current RP (Owner/Admin only)")
-    @app_commands.describe(
-        player_count="Number of players currently online (0-50)",
-        current_rp="Current roleplay scenario happening on the server"
-    )
-    async def update_status(interaction: discord.Interaction, player_count: int, current_rp: str):
-        """Update server status information"""
-        try:
-            # Check permissions - Owner or Admin only
-            if not has_permission(interaction.user, PermissionLevel.ADMIN):
-                await interaction.response.send_message(
-                    "❌ Only the owner or administrators can update server status.",
-                    ephemeral=True
-                )
-                return
-            
-            # Validate player count
-            if player_count < 0 or player_count > 50:
-                await interaction.response.send_message(
-                    "❌ Player count must be between 0 and 50.",
-                    ephemeral=True
-                )
-                return
-            
-            # Validate RP description length
-            if len(current_rp) > 200:
-                await interaction.response.send_message(
-                    "❌ Current RP description must be 200 characters or less.",
-                    ephemeral=True
-                )
-                return
-            
-            # Update server status
-            success = await server_manager.update_server_status(
-                player_count, 
-                current_rp, 
-                str(interaction.user)
-            )
-            
-            if success:
-                embed = discord.Embed(
-                    title="✅ Server Status Updated",
-                    description="Server information has been updated successfully!",
-                    color=discord.Color.green()
-                )
-                embed.add_field(
-                    name="👥 Player Count",
-                    value=f"{player_count}/50",
-                    inline=True
-                )
-                embed.add_field(
-                    name="🎭 Current RP",
-                    value=current_rp,
-                    inline=False
-                )
-                embed.set_footer(text=f"Updated by {interaction.user} • Homeland RP | Official Bot")
-                await interaction.response.send_message(embed=embed)
-                logger.info(f"Server status updated by {interaction.user}: {player_count} players, RP: {current_rp}")
-            else:
-                await interaction.response.send_message(
-                    "❌ Failed to update server status. Please try again later.",
-                    ephemeral=True
-                )
-                
-        except Exception as e:
-            logger.error(f"Error updating server status: {e}")
-            try:
-                if not interaction.response.is_done():
-                    await interaction.response.send_message(
-                        "❌ An error occurred while updating server status.",
-                        ephemeral=True
-                    )
-            except Exception as followup_error:
-                logger.error(f"Error sending update status error message: {followup_error}")
+            logger.error(f"Failed to load extension {extension}: {e}")
     
     logger.info("All commands have been set up successfully")
 
-from discord import app_commands
-from discord.ext import commands
-import discord
-
-class BasicCommands(commands.Cog):
-    def __init__(self, bot):
-        self.bot = bot
-
-    @app_commands.command(name="status_server", description="Send server status with player count and event")
-    @app_commands.describe(players="Number of players", event="Current event", code="Join code")
-    async def status_server(self, interaction: discord.Interaction, players: int, event: str, code: str):
-        embed = discord.Embed(
-            title="🚧 Homeland RP 🚨",
-            description="Join us now and enjoy the roleplay!",
-            color=discord.Color.dark_blue()
-        )
-        embed.set_thumbnail(url="https://i.ibb.co/FndmtVx/logo.png")  # Cambia a tu logo si quieres
-        embed.add_field(name="Players", value=str(players), inline=True)
-        embed.add_field(name="Event", value=event, inline=True)
-        embed.add_field(name="Code", value=f"`{code}`", inline=False)
-        embed.add_field(
-            name="\u200b",
-            value="**Your stay in our ingame server will make us happy**\n🌆 | Please remember to follow all rules and regulations!",
-            inline=False
-        )
-
-        view = discord.ui.View()
-        button = discord.ui.Button(
-            label="Join Now",
-            style=discord.ButtonStyle.link,
-            url=f"https://www.roblox.com/games/start?placeId=7711635737&launchData=joinCode%3D{code}"
-        )
-        view.add_item(button)
-
-        await interaction.response.send_message(embed=embed, view=view)
-
-async def setup(bot):
-    await bot.add_cog(BasicCommands(bot))
+def snapshot_commands(bot) -> Dict[str, dict]:
+    """
+    Get the payload Discord would receive for every global tree command, by name
+    """
+    return {command.name: command.to_dict(bot.tree) for command in bot.tree.get_commands()}
+
+async def sync_changed_commands(bot, before: Dict[str, dict]) -> Tuple[List[str], List[str]]:
+    """
+    Push only the commands whose payload differs from a snapshot
+    Returns: (upserted command names, deleted command names)
+    """
+    after = snapshot_commands(bot)
+    changed = [name for name, payload in after.items() if before.get(name) != payload]
+    removed = [name for name in before if name not in after]
+    
+    application_id = bot.application_id
+    for name in changed:
+        await bot.http.upsert_global_command(application_id, after[name])
+    
+    if removed:
+        remote = {command.name: command.id for command in await bot.tree.fetch_commands()}
+        for name in removed:
+            if name in remote:
+                await bot.http.delete_global_command(application_id, remote[name])
+    
+    if changed or removed:
+        logger.info(f"Synced changed commands: upserted {changed or 'none'}, deleted {removed or 'none'}")
+    return changed, removed
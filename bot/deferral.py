@@ -0,0 +1,130 @@
+import asyncio
+import discord
+import logging
+import time
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Key under which the active guard is stored in interaction.extras
+GUARD_KEY = 'deferral_guard'
+
+class DeferralMetrics:
+    """
+    Per-command counts of how often the latency budget ran out
+    """
+
+    def __init__(self):
+        # command -> [invocations, deferred, failed deferrals]
+        self.commands: Dict[str, List[int]] = {}
+
+    def _entry(self, command_name: str) -> List[int]:
+        entry = self.commands.get(command_name)
+        if entry is None:
+            entry = self.commands[command_name] = [0, 0, 0]
+        return entry
+
+    def record_invocation(self, command_name: str):
+        self._entry(command_name)[0] += 1
+
+    def record_deferred(self, command_name: str):
+        self._entry(command_name)[1] += 1
+
+    def record_failed(self, command_name: str):
+        self._entry(command_name)[2] += 1
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get invocation and deferral counts with the deferral rate per command
+        """
+        return {
+            name: {
+                'invocations': invocations,
+                'deferred': deferred,
+                'failed': failed,
+                'deferral_rate': deferred / invocations if invocations else 0.0
+            }
+            for name, (invocations, deferred, failed) in self.commands.items()
+        }
+
+class DeferralGuard:
+    """
+    Defers an interaction automatically once its latency budget runs out.
+
+    Responses sent through middleware.send_response take the guard's lock,
+    so a send and the automatic defer can never race each other; whichever
+    runs second sees the interaction as acknowledged and the send becomes
+    a followup. The defer uses the command's pipeline visibility; the first
+    followup after it replaces the "thinking" placeholder, so a message with
+    the other visibility (an ephemeral error after a public defer) deletes
+    the placeholder first instead of inheriting its visibility.
+    """
+
+    def __init__(self, interaction: discord.Interaction, command_name: str, budget: float,
+                 ephemeral: bool = False):
+        self.interaction = interaction
+        self.command_name = command_name
+        self.budget = budget
+        self.ephemeral = ephemeral
+        self.lock = asyncio.Lock()
+        self.deferred = False
+        # True while the "thinking" message from the automatic defer is waiting to be replaced
+        self.placeholder = False
+        self.started = time.monotonic()
+        self._task: Optional[asyncio.Task] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+
+    def start(self):
+        """Arm the timer and attach the guard to the interaction"""
+        extras = getattr(self.interaction, 'extras', None)
+        if extras is not None:
+            extras[GUARD_KEY] = self
+        deferral_metrics.record_invocation(self.command_name)
+
+        if self.budget <= 0:
+            self._fire()
+        else:
+            self._handle = asyncio.get_running_loop().call_later(self.budget, self._fire)
+
+    def _fire(self):
+        self._handle = None
+        self._task = asyncio.create_task(self._defer())
+
+    async def _defer(self):
+        async with self.lock:
+            if self.interaction.response.is_done():
+                return
+            try:
+                await self.interaction.response.defer(thinking=True, ephemeral=self.ephemeral)
+                self.deferred = True
+                self.placeholder = True
+                deferral_metrics.record_deferred(self.command_name)
+                logger.debug(f"/{self.command_name} deferred after {time.monotonic() - self.started:.2f}s")
+            except discord.InteractionResponded:
+                pass
+            except Exception as e:
+                deferral_metrics.record_failed(self.command_name)
+                logger.warning(f"Failed to defer /{self.command_name}: {e}")
+
+    async def stop(self):
+        """Disarm the timer and wait for a defer that is already in flight"""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._task is not None and not self._task.done():
+            await self._task
+        extras = getattr(self.interaction, 'extras', None)
+        if extras is not None:
+            extras.pop(GUARD_KEY, None)
+
+def get_guard(interaction: discord.Interaction) -> Optional[DeferralGuard]:
+    """
+    Get the active deferral guard of an interaction, if any
+    """
+    extras = getattr(interaction, 'extras', None)
+    if extras is None:
+        return None
+    return extras.get(GUARD_KEY)
+
+# Create global deferral metrics instance
+deferral_metrics = DeferralMetrics()
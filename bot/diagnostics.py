@@ -0,0 +1,136 @@
+import asyncio
+import logging
+import math
+import os
+import resource
+import time
+import tracemalloc
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+from bot.deferral import deferral_metrics
+from bot.middleware import cooldown_map, pipeline_metrics
+from bot.render_cache import render_cache
+from bot.views import link_view_cache
+
+logger = logging.getLogger(__name__)
+
+class LoopLagMonitor:
+    """
+    Samples event-loop lag: how much later than requested a short sleep wakes up
+    """
+
+    def __init__(self, interval: float = 0.5, samples: int = 600):
+        self.interval = interval
+        self.samples: Deque[float] = deque(maxlen=samples)
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, time.perf_counter() - started - self.interval))
+
+    def percentiles(self) -> Dict[str, float]:
+        """Lag in milliseconds at p50/p95/p99 and the maximum over the sample window"""
+        if not self.samples:
+            return {}
+        ordered = sorted(self.samples)
+        last = len(ordered) - 1
+        return {
+            'p50': ordered[int(last * 0.50)] * 1000,
+            'p95': ordered[int(last * 0.95)] * 1000,
+            'p99': ordered[int(last * 0.99)] * 1000,
+            'max': ordered[last] * 1000,
+        }
+
+def read_rss() -> int:
+    """Resident set size in bytes (peak RSS where /proc isn't available)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def top_allocators(limit: int = 5) -> List[Dict[str, Any]]:
+    """Largest allocation sites by line, if tracemalloc is tracing"""
+    if not tracemalloc.is_tracing():
+        return []
+    snapshot = tracemalloc.take_snapshot()
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    ))
+    return [
+        {'site': str(stat.traceback[0]), 'size': stat.size, 'count': stat.count}
+        for stat in snapshot.statistics('lineno')[:limit]
+    ]
+
+def _hit_rate(hits: int, misses: int) -> Optional[float]:
+    total = hits + misses
+    return hits / total if total else None
+
+def _process_stats() -> Dict[str, Any]:
+    return {'rss': read_rss(), 'tracing': tracemalloc.is_tracing(), 'top_allocators': top_allocators()}
+
+async def collect_diagnostics(bot, slow_handlers: int = 5) -> Dict[str, Any]:
+    """
+    Gather runtime health for /diag. Snapshotting memory runs in a worker thread;
+    everything else only reads counters that are already maintained.
+    """
+    process = await asyncio.to_thread(_process_stats)
+
+    server_manager = bot.server_manager
+    view_store = getattr(bot._connection, '_view_store', None)
+    caches = [
+        ('Link views', len(link_view_cache), _hit_rate(link_view_cache.hits, link_view_cache.misses)),
+        ('Rendered embeds', len(render_cache), _hit_rate(render_cache.hits, render_cache.misses)),
+        ('Player counts', len(server_manager.player_counts), None),
+        ('Cooldowns', len(cooldown_map), None),
+        ('Stored views', len(getattr(view_store, '_views', ())), None),
+        ('Role index versions', len(bot.role_manager.guild_versions), None),
+        ('Auto-response channels', len(bot.last_auto_response), None),
+        ('Cached users', len(bot.users), None),
+        ('Spam guard windows', bot.spam_guard.summary()['tracked_keys'], None),
+        ('Reaction role bindings', len(bot.reaction_roles), None),
+        ('Role search indexes', len(bot.role_search), None),
+        ('Live join codes', len(server_manager.join_codes), None),
+    ]
+
+    board = bot.status_board
+    queues = [
+        ('Role audit buffer', len(bot.role_manager.audit.pending)),
+        ('Status board edits', 1 if board.pending else 0),
+        ('Role audit flushes', bot.role_manager.audit.flushing),
+        ('Onboarding backlog', bot.onboarding.backlog),
+        ('Self-assign changes settling', bot.reaction_roles.backlog),
+        ('Scheduled jobs', len(bot.scheduler)),
+        ('Activity deltas unflushed', len(bot.activity_tracker.pending)),
+        ('Event bus backlog', bot.event_bus.backlog),
+    ]
+
+    deferrals = deferral_metrics.summary()
+    return {
+        # latency is NaN until the first heartbeat
+        'latency': bot.latency * 1000 if math.isfinite(bot.latency) else None,
+        'loop_lag': loop_lag_monitor.percentiles(),
+        'tasks': len(asyncio.all_tasks()),
+        'rss': process['rss'],
+        'tracing': process['tracing'],
+        'top_allocators': process['top_allocators'],
+        'caches': caches,
+        'queues': queues,
+        'event_bus': bot.event_bus.summary(),
+        'deferred': sum(entry['deferred'] for entry in deferrals.values()),
+        'slow_handlers': list(pipeline_metrics.slow_handlers)[-slow_handlers:],
+    }
+
+loop_lag_monitor = LoopLagMonitor()
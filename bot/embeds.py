@@ -0,0 +1,346 @@
+import discord
+from datetime import datetime
+from typing import Dict, List
+
+FOOTER_TEXT = "Homeland RP | Official Bot"
+
+def build_server_embed(server_link: str) -> discord.Embed:
+    """
+    Build the /server embed for a private server link
+    """
+    embed = discord.Embed(
+        title="🎮 Homeland RP Private Server",
+        description=f"Join our private server using the link below:",
+        color=discord.Color.blue()
+    )
+    embed.add_field(
+        name="Server Link",
+        value=f"[Click here to join!]({server_link})",
+        inline=False
+    )
+    embed.add_field(
+        name="📋 Instructions",
+        value="1. Click the link above\n2. Wait for Roblox to load\n3. Have fun roleplaying!",
+        inline=False
+    )
+    embed.set_footer(text=FOOTER_TEXT)
+    return embed
+
+def build_role_info_embed(roles_info: Dict[str, List[Dict]]) -> discord.Embed:
+    """
+    Build the /roleinfo embed from RoleManager.get_roles_info output
+    """
+    embed = discord.Embed(
+        title="📋 Server Roles Information",
+        description="Here are the available roles in this server:",
+        color=discord.Color.blue()
+    )
+
+    for category, roles in roles_info.items():
+        if roles:
+            role_list = "\n".join([f"• {role['name']} - {role['members']} members" for role in roles])
+            embed.add_field(
+                name=f"{category}",
+                value=role_list,
+                inline=False
+            )
+
+    embed.set_footer(text=FOOTER_TEXT)
+    return embed
+
+def build_bot_info_embed(guild_count: int) -> discord.Embed:
+    """
+    Build the /botinfo embed
+    """
+    embed = discord.Embed(
+        title="🤖 Homeland RP | Official Bot",
+        description="Your official bot for Homeland RP server management!",
+        color=discord.Color.gold()
+    )
+
+    embed.add_field(
+        name="📋 Features",
+        value="• Private server link distribution\n• Role management system\n• Permission-based commands\n• Activity logging",
+        inline=False
+    )
+
+    embed.add_field(
+        name="🔧 Commands",
+        value="• `/server` - Get private server link\n• `/serverstatus` - Check server status\n• `/updatestatus` - Update server info (Owner/Admin only)\n• `/addrole` - Add role to user (Owner only)\n• `/removerole` - Remove role from user (Owner only)\n• `/roleinfo` - View role information",
+        inline=False
+    )
+
+    embed.add_field(
+        name="👥 Guild Info",
+        value=f"Serving {guild_count} server(s)",
+        inline=True
+    )
+
+    embed.set_footer(text=f"{FOOTER_TEXT} • Made for the community")
+    return embed
+
+def build_server_status_embed(status_info: dict) -> discord.Embed:
+    """
+    Build the /serverstatus embed from ServerManager.get_server_status output
+    """
+    embed = discord.Embed(
+        title="🎮 Homeland RP Server Status",
+        color=discord.Color.green() if status_info.get('online', False) else discord.Color.red()
+    )
+
+    # Server status
+    status_emoji = "🟢" if status_info.get('online', False) else "🔴"
+    embed.add_field(
+        name=f"{status_emoji} Server Status",
+        value="Online" if status_info.get('online', False) else "Offline",
+        inline=True
+    )
+
+    # Player count
+    player_count = status_info.get('player_count', 'Unknown')
+    embed.add_field(
+        name="👥 Players Count",
+        value=f"{player_count}/50" if isinstance(player_count, int) else str(player_count),
+        inline=True
+    )
+
+    # Current RP scenario
+    current_rp = status_info.get('current_rp', 'No active RP session')
+    embed.add_field(
+        name="🎭 Current RP",
+        value=current_rp,
+        inline=False
+    )
+
+    # Last updated and updated by
+    last_updated = status_info.get('last_updated', 'Not set')
+    updated_by = status_info.get('updated_by', 'System')
+    embed.set_footer(text=f"Last updated: {last_updated} by {updated_by} • {FOOTER_TEXT}")
+    return embed
+
+def build_status_history_embed(window_label: str, history: dict) -> discord.Embed:
+    """
+    Build the /statushistory embed from StatusHistory.query output
+    """
+    embed = discord.Embed(
+        title=f"📈 Homeland RP Player History ({window_label})",
+        color=discord.Color.blue()
+    )
+
+    if not history['samples']:
+        embed.description = "No player counts were recorded in this window."
+    else:
+        trend = history['trend_per_hour']
+        trend_emoji = "📈" if trend > 0.05 else "📉" if trend < -0.05 else "➖"
+        embed.add_field(name="🔝 Peak", value=f"{history['peak']}/50", inline=True)
+        embed.add_field(name="👥 Average", value=f"{history['average']:.1f}", inline=True)
+        embed.add_field(name=f"{trend_emoji} Trend", value=f"{trend:+.2f} players/hour", inline=True)
+
+    recent = history.get('recent', [])
+    if recent:
+        embed.add_field(name="🕒 Latest Counts", value=" → ".join(str(count) for count in recent), inline=False)
+
+    sessions = history.get('sessions', [])
+    if sessions:
+        lines = [
+            f"• {datetime.fromtimestamp(began).strftime('%Y-%m-%d %H:%M')} - {name}"
+            for began, name in sessions[-5:]
+        ]
+        embed.add_field(name="🎭 RP Sessions", value="\n".join(lines), inline=False)
+
+    embed.set_footer(text=f"{history['samples']} sample(s) • {history['resolution']} rollups • {FOOTER_TEXT}")
+    return embed
+
+def build_role_history_embed(subject: str, rows: List[Dict], page: int) -> discord.Embed:
+    """
+    Build a /rolehistory page from RoleAuditStore.query rows
+    """
+    embed = discord.Embed(
+        title=f"📜 Role History - {subject}",
+        color=discord.Color.blue()
+    )
+
+    if not rows:
+        embed.description = "No role changes recorded." if page == 1 else "No older role changes."
+    else:
+        lines = []
+        for row in rows:
+            when = datetime.fromtimestamp(row['created_at']).strftime('%Y-%m-%d %H:%M')
+            arrow = "➕" if row['action'] == "add" else "➖"
+            lines.append(
+                f"{arrow} `{when}` **{row['role_name']}** "
+                f"{'to' if row['action'] == 'add' else 'from'} <@{row['target_id']}> by <@{row['moderator_id']}>"
+            )
+        embed.description = "\n".join(lines)
+
+    embed.set_footer(text=f"Page {page} • {FOOTER_TEXT}")
+    return embed
+
+def build_diagnostics_embed(diag: dict) -> discord.Embed:
+    """
+    Build the /diag embed from diagnostics.collect_diagnostics output
+    """
+    embed = discord.Embed(
+        title="🩺 Homeland RP Bot Diagnostics",
+        color=discord.Color.dark_grey()
+    )
+
+    lag = diag['loop_lag']
+    lag_text = (
+        f"p50 {lag['p50']:.1f}ms • p95 {lag['p95']:.1f}ms • p99 {lag['p99']:.1f}ms • max {lag['max']:.1f}ms"
+        if lag else "No samples yet"
+    )
+    embed.add_field(name="📡 Gateway Latency", value=f"{diag['latency']:.0f}ms" if diag['latency'] is not None else "Not connected", inline=True)
+    embed.add_field(name="🧵 Tasks", value=str(diag['tasks']), inline=True)
+    embed.add_field(name="💾 RSS", value=f"{diag['rss'] / 1048576:.1f} MiB", inline=True)
+    embed.add_field(name="⏱️ Event Loop Lag", value=lag_text, inline=False)
+
+    cache_lines = [
+        f"• {name}: {size}" + (f" ({rate:.0%} hits)" if rate is not None else "")
+        for name, size, rate in diag['caches']
+    ]
+    embed.add_field(name="🗃️ Caches", value="\n".join(cache_lines), inline=False)
+
+    queue_lines = [f"• {name}: {depth}" for name, depth in diag['queues']]
+    queue_lines.append(f"• Auto-deferred interactions: {diag['deferred']}")
+    embed.add_field(name="📥 Queues", value="\n".join(queue_lines), inline=False)
+
+    bus = diag['event_bus']
+    bus_lines = [f"{sum(bus['published'].values())} published • {bus['avg_publish_us']:.1f}µs avg publish"]
+    bus_lines += [
+        f"• {entry['name']}: {entry['handled']} handled, {entry['coalesced']} coalesced, "
+        f"{entry['dropped']} dropped, {entry['avg_ms']:.2f}ms avg"
+        for entry in bus['subscribers']
+    ]
+    embed.add_field(name="📣 Event Bus", value="\n".join(bus_lines)[:1024], inline=False)
+
+    if diag['tracing']:
+        allocators = "\n".join(
+            f"• `{entry['site'][-60:]}` {entry['size'] / 1024:.0f} KiB ({entry['count']})"
+            for entry in diag['top_allocators']
+        ) or "None"
+    else:
+        allocators = "tracemalloc is not tracing"
+    embed.add_field(name="🔬 Top Allocators", value=allocators[:1024], inline=False)
+
+    slow = "\n".join(
+        f"• /{entry['command']} {entry['duration'] * 1000:.0f}ms ({entry['outcome']}) "
+        f"at {datetime.fromtimestamp(entry['at']).strftime('%H:%M:%S')}"
+        for entry in reversed(diag['slow_handlers'])
+    ) or "None"
+    embed.add_field(name="🐢 Slow Handlers", value=slow, inline=False)
+
+    embed.set_footer(text=FOOTER_TEXT)
+    return embed
+
+def build_role_panel_embed(title: str, roles: List[discord.Role]) -> discord.Embed:
+    """
+    Build the message posted above a panel of role buttons
+    """
+    embed = discord.Embed(
+        title=f"🎭 {title}",
+        description="Click a button to get a role, click it again to remove it.\n\n"
+                    + "\n".join(f"• **{role.name}**" for role in roles),
+        color=discord.Color.blurple()
+    )
+    embed.set_footer(text=FOOTER_TEXT)
+    return embed
+
+def build_reaction_roles_embed(bindings: List[Dict]) -> discord.Embed:
+    """
+    Build the /reactionrole list embed from ReactionRoles bindings
+    """
+    embed = discord.Embed(
+        title="🎭 Self-Assignable Roles",
+        color=discord.Color.blurple()
+    )
+
+    if not bindings:
+        embed.description = "No reaction or button roles are set up."
+    else:
+        lines = []
+        for binding in bindings:
+            link = f"https://discord.com/channels/{binding['guild_id']}/{binding['channel_id']}/{binding['message_id']}"
+            trigger = "button" if binding['key'].startswith("button:") else binding['emoji']
+            lines.append(f"{trigger} → <@&{binding['role_id']}> on [message]({link})")
+        embed.description = "\n".join(lines[:40])
+        if len(lines) > 40:
+            embed.description += f"\n…and {len(lines) - 40} more"
+
+    embed.set_footer(text=FOOTER_TEXT)
+    return embed
+
+def build_rp_events_embed(events: List[Dict]) -> discord.Embed:
+    """
+    Build the /rpevent list embed from RPEventManager sessions
+    """
+    embed = discord.Embed(
+        title="📅 RP Sessions",
+        color=discord.Color.purple()
+    )
+
+    if not events:
+        embed.description = "No RP sessions are scheduled. Admins can add one with `/rpevent create`."
+    for event in events[:25]:
+        state = "🟢 Running" if event['started'] else f"Starts <t:{int(event['starts_at'])}:R>"
+        lines = [f"{state} • ends <t:{int(event['ends_at'])}:t>"]
+        if event['reminders']:
+            lines.append("Reminders: " + ", ".join(f"{minutes}m" for minutes in event['reminders']))
+        if event['ping_role_id']:
+            lines.append(f"Pings <@&{event['ping_role_id']}>")
+        embed.add_field(name=f"#{event['id']} {event['title']}"[:256], value="\n".join(lines), inline=False)
+
+    embed.set_footer(text=FOOTER_TEXT)
+    return embed
+
+def build_leaderboard_embed(guild_name: str, rows: List[tuple], own: tuple, reward_role: str,
+                            reward_threshold: int) -> discord.Embed:
+    """
+    Build the /leaderboard embed from (user_id, messages) rows and the caller's (messages, rank)
+    """
+    embed = discord.Embed(
+        title=f"🏆 Most Active Roleplayers - {guild_name}",
+        color=discord.Color.gold()
+    )
+
+    medals = {1: "🥇", 2: "🥈", 3: "🥉"}
+    if not rows:
+        embed.description = "No activity recorded yet."
+    else:
+        embed.description = "\n".join(
+            f"{medals.get(rank, f'`#{rank}`')} <@{user_id}> • {messages:,} messages"
+            for rank, (user_id, messages) in enumerate(rows, start=1)
+        )
+
+    messages, rank = own
+    embed.add_field(
+        name="📈 You",
+        value=f"{messages:,} messages" + (f" • rank #{rank}" if rank else ""),
+        inline=True
+    )
+    embed.add_field(name="🎖️ Reward", value=f"**{reward_role}** at {reward_threshold:,} messages", inline=True)
+    embed.set_footer(text=FOOTER_TEXT)
+    return embed
+
+def build_join_codes_embed(codes: List[Dict]) -> discord.Embed:
+    """
+    Build the /joincode list embed from JoinCodePool entries
+    """
+    embed = discord.Embed(
+        title="🔑 Join Code Pool",
+        color=discord.Color.dark_blue()
+    )
+
+    if not codes:
+        embed.description = "The pool is empty, so `/server` falls back to the configured links. Admins can add codes with `/joincode add`."
+    for entry in codes[:25]:
+        expires = f"Expires <t:{int(entry['expires_at'])}:R>" if entry['expires_at'] is not None else "Never expires"
+        uses = f"{entry['uses']}/{entry['capacity']}" if entry['capacity'] is not None else f"{entry['uses']}"
+        embed.add_field(
+            name=entry['code'],
+            value=f"{expires}\nHanded out: {uses}\nAdded by {entry['added_by']}",
+            inline=True
+        )
+
+    embed.set_footer(text=FOOTER_TEXT)
+    return embed
@@ -0,0 +1,174 @@
+import asyncio
+import inspect
+import logging
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Type
+from config.settings import BOT_CONFIG
+
+logger = logging.getLogger(__name__)
+
+EVENT_BUS_CONFIG = BOT_CONFIG.get('event_bus', {})
+
+class StatusChanged(NamedTuple):
+    """The stored server status was updated"""
+
+class LinksChanged(NamedTuple):
+    """A server link was added or removed"""
+
+class RoleIndexChanged(NamedTuple):
+    """A guild's roles or role memberships changed (RoleManager version bump)"""
+    guild_id: int
+
+class RolesEdited(NamedTuple):
+    """A guild's roles themselves were created, edited or deleted, or the bot's own roles changed"""
+    guild_id: int
+
+class ConfigReloaded(NamedTuple):
+    """A command extension was reloaded"""
+    extension: str
+
+Handler = Callable[[Any], Any]
+
+class Subscription:
+    """
+    One consumer of one event type, with its own bounded queue and task.
+
+    The queue is an ordered dict keyed by the event, so an invalidation
+    that is already waiting absorbs its duplicates. When the queue is full
+    the oldest event is dropped and counted.
+    """
+
+    def __init__(self, event_type: Type, handler: Handler, name: str, max_queue: int):
+        self.event_type = event_type
+        self.handler = handler
+        self.name = name
+        self.max_queue = max_queue
+        self.queue: "OrderedDict[Any, None]" = OrderedDict()
+        self.handled = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.max_seconds = 0.0
+        self._ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    def offer(self, event):
+        if self._closed:
+            return
+        queue = self.queue
+        if event in queue:
+            self.coalesced += 1
+            return
+        if len(queue) >= self.max_queue:
+            queue.popitem(last=False)
+            self.dropped += 1
+        queue[event] = None
+        self._ready.set()
+        if self._task is None:
+            try:
+                self._task = asyncio.get_running_loop().create_task(self._run())
+            except RuntimeError:
+                # No running loop yet; the next offer from inside the loop starts the task
+                pass
+
+    async def _run(self):
+        while True:
+            await self._ready.wait()
+            while self.queue:
+                event, _ = self.queue.popitem(last=False)
+                started = time.perf_counter()
+                try:
+                    result = self.handler(event)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    self.errors += 1
+                    logger.error(f"Event subscriber '{self.name}' failed on {type(event).__name__}: {e}")
+                elapsed = time.perf_counter() - started
+                self.handled += 1
+                self.busy_seconds += elapsed
+                if elapsed > self.max_seconds:
+                    self.max_seconds = elapsed
+            self._ready.clear()
+
+    async def close(self):
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+class EventBus:
+    """
+    In-process publish/subscribe for change notifications.
+
+    Events are typed NamedTuples. publish() is synchronous and only puts
+    the event on each subscriber's queue, so the command that caused a
+    change pays for the enqueues and nothing else, however many consumers
+    there are or however slow they are. Each subscriber drains its queue
+    in its own task. Publish cost and subscriber time are measured for
+    /diag.
+    """
+
+    def __init__(self, max_queue: Optional[int] = None):
+        self.max_queue = max_queue or EVENT_BUS_CONFIG.get('max_queue', 1000)
+        self._subscribers: Dict[Type, List[Subscription]] = {}
+        self.published: Counter = Counter()
+        self.publish_seconds = 0.0
+
+    def subscribe(self, event_type: Type, handler: Handler, name: str) -> Subscription:
+        """
+        Call handler(event) for every published event of this type; handler may be async
+        """
+        subscription = Subscription(event_type, handler, name, self.max_queue)
+        self._subscribers.setdefault(event_type, []).append(subscription)
+        return subscription
+
+    async def unsubscribe(self, subscription: Subscription):
+        subscribers = self._subscribers.get(subscription.event_type, [])
+        if subscription in subscribers:
+            subscribers.remove(subscription)
+        await subscription.close()
+
+    def publish(self, event):
+        started = time.perf_counter()
+        for subscription in self._subscribers.get(type(event), ()):
+            subscription.offer(event)
+        self.published[type(event).__name__] += 1
+        self.publish_seconds += time.perf_counter() - started
+
+    @property
+    def subscriptions(self) -> List[Subscription]:
+        return [subscription for subscribers in self._subscribers.values() for subscription in subscribers]
+
+    @property
+    def backlog(self) -> int:
+        return sum(len(subscription.queue) for subscription in self.subscriptions)
+
+    def summary(self) -> Dict[str, Any]:
+        """Publish counts and overhead, and per-subscriber delivery stats"""
+        published = sum(self.published.values())
+        return {
+            'published': dict(self.published),
+            'avg_publish_us': self.publish_seconds / published * 1e6 if published else 0.0,
+            'subscribers': [
+                {
+                    'name': subscription.name,
+                    'event': subscription.event_type.__name__,
+                    'queued': len(subscription.queue),
+                    'handled': subscription.handled,
+                    'coalesced': subscription.coalesced,
+                    'dropped': subscription.dropped,
+                    'errors': subscription.errors,
+                    'avg_ms': subscription.busy_seconds / subscription.handled * 1000 if subscription.handled else 0.0,
+                    'max_ms': subscription.max_seconds * 1000,
+                }
+                for subscription in self.subscriptions
+            ],
+        }
+
+    async def close(self):
+        await asyncio.gather(*(subscription.close() for subscription in self.subscriptions))
@@ -0,0 +1,110 @@
+import asyncio
+import errno
+import logging
+import os
+import random
+from collections import Counter
+from typing import Any, Dict, Optional
+import discord
+from config.settings import BOT_CONFIG
+from utils import json_store
+
+logger = logging.getLogger(__name__)
+
+FAULT_CONFIG = BOT_CONFIG.get('fault_injection', {})
+
+class InjectedResponse:
+    """The parts of an aiohttp response that discord.HTTPException reads"""
+
+    def __init__(self, status: int, reason: str):
+        self.status = status
+        self.reason = reason
+
+class FaultInjector:
+    """
+    Config-driven faults at the Discord HTTP and JSON file boundaries.
+
+    HTTP requests can be slowed down, rate limited (429 with retry-after,
+    waited out the way discord.py does unless it exceeds the client's
+    max_ratelimit_timeout), failed with a 503 or left to time out. File
+    writes can fail with ENOSPC and file reads can return truncated JSON.
+    Each fault is rolled independently per call from a seeded RNG, so a
+    drill replays the same faults. Disabled, every hook is a single
+    attribute check.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.injected: Counter = Counter()
+        self.configure(FAULT_CONFIG if config is None else config)
+
+    def configure(self, config: Dict[str, Any]):
+        http = config.get('http', {})
+        files = config.get('files', {})
+        self.config = config
+        self.enabled = config.get('enabled', False)
+        self.latency = http.get('latency_seconds', 0.0)
+        self.jitter = http.get('jitter', 0.5)
+        self.rate_limit_rate = http.get('rate_limit_rate', 0.0)
+        self.retry_after = http.get('retry_after_seconds', 1.0)
+        self.server_error_rate = http.get('server_error_rate', 0.0)
+        self.timeout_rate = http.get('timeout_rate', 0.0)
+        self.timeout_seconds = http.get('timeout_seconds', 10.0)
+        self.disk_full_rate = files.get('disk_full_rate', 0.0)
+        self.corrupt_json_rate = files.get('corrupt_json_rate', 0.0)
+        self._random = random.Random(config.get('seed'))
+        if self.enabled:
+            logger.warning(f"Fault injection is enabled: {config}")
+
+    async def http(self, route: str, max_ratelimit_timeout: Optional[float] = None):
+        """
+        Run before a REST request; sleeps or raises what a degraded Discord would
+        """
+        if not self.enabled:
+            return
+        roll = self._random.random
+        if self.latency:
+            self.injected['latency'] += 1
+            await asyncio.sleep(self.latency * self._random.uniform(1 - self.jitter, 1 + self.jitter))
+        if roll() < self.timeout_rate:
+            self.injected['timeout'] += 1
+            await asyncio.sleep(self.timeout_seconds)
+            raise asyncio.TimeoutError(f"Injected timeout on {route}")
+        if roll() < self.server_error_rate:
+            self.injected['5xx'] += 1
+            raise discord.DiscordServerError(InjectedResponse(503, "Service Unavailable"), f"Injected 503 on {route}")
+        if roll() < self.rate_limit_rate:
+            self.injected['429'] += 1
+            if max_ratelimit_timeout is not None and self.retry_after > max_ratelimit_timeout:
+                raise discord.RateLimited(self.retry_after)
+            await asyncio.sleep(self.retry_after)
+
+    def write(self, path: str):
+        """Run before writing a file; raises ENOSPC when the disk is 'full'"""
+        if self.enabled and self._random.random() < self.disk_full_rate:
+            self.injected['disk_full'] += 1
+            raise OSError(errno.ENOSPC, os.strerror(errno.ENOSPC), path)
+
+    def read(self, path: str, text: str) -> str:
+        """Pass file contents through, truncated when corruption is rolled"""
+        if self.enabled and self._random.random() < self.corrupt_json_rate:
+            self.injected['corrupt_json'] += 1
+            return text[:len(text) // 2]
+        return text
+
+    def install(self, http: Optional[discord.http.HTTPClient] = None):
+        """
+        Route JSON store reads and writes through the file faults and, if given,
+        every REST call of a discord.py HTTP client through the HTTP faults
+        """
+        json_store.set_hooks(self.read, self.write)
+        if http is None:
+            return
+        request = http.request
+
+        async def faulty_request(route, **kwargs):
+            await self.http(f"{route.method} {route.path}", http.max_ratelimit_timeout)
+            return await request(route, **kwargs)
+
+        http.request = faulty_request
+
+faults = FaultInjector()
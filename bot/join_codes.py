@@ -0,0 +1,206 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import re
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+from config.settings import BOT_CONFIG
+from utils.json_store import load_json, save_json
+
+logger = logging.getLogger(__name__)
+
+JOIN_CODE_CONFIG = BOT_CONFIG.get('join_codes', {})
+JOIN_CODE_FILE = os.path.join("config", "join_codes.json")
+
+LAUNCH_URL = "https://www.roblox.com/games/start?placeId={place_id}&launchData=joinCode%3D{code}"
+JOIN_CODE_PATTERN = re.compile(r'joinCode%3D([A-Za-z0-9]+)')
+VALID_CODE = re.compile(r'[A-Za-z0-9]{4,32}')
+
+def codes_from_links(links: List[str]) -> List[str]:
+    """Join codes embedded in launch links, in order"""
+    return [match.group(1) for match in map(JOIN_CODE_PATTERN.search, links) if match]
+
+def parse_code(value: str) -> Optional[str]:
+    """A bare join code, or the one in a pasted launch link; None if neither"""
+    value = value.strip()
+    match = JOIN_CODE_PATTERN.search(value)
+    if match:
+        value = match.group(1)
+    return value if VALID_CODE.fullmatch(value) else None
+
+class JoinCodePool:
+    """
+    Join codes handed out round-robin, each with an optional expiry and a
+    capacity (how many times it may be handed out).
+
+    Codes live in a dict with a rotation deque and an expiry heap beside
+    it, all holding the same entry dicts. take() pops the front of the
+    rotation and re-appends it, so a handout is O(1); removed, expired and
+    used-up entries are dropped from the dict and skipped lazily when they
+    surface in the deque or heap. Expiry is also checked at handout, so a
+    dead code is never given out even between reaper passes. The reaper
+    pops expired entries off the heap and saves the pool, including use
+    counts, which are only persisted by the reaper and on close. A pool
+    file that exists but can't be read is never saved over.
+    """
+
+    def __init__(self, path: str = JOIN_CODE_FILE):
+        self.path = path
+        self.place_id = JOIN_CODE_CONFIG.get('place_id', 7711635737)
+        self.reap_interval = JOIN_CODE_CONFIG.get('reap_interval_seconds', 60)
+        self.default_ttl_hours = JOIN_CODE_CONFIG.get('default_ttl_hours', 24)
+        self.codes: Dict[str, Dict] = {}
+        self.handed_out = 0
+        self.reaped = 0
+        self._rotation: Deque[Dict] = deque()
+        self._expiry: List[Tuple[float, int, Dict]] = []
+        self._seq = itertools.count()
+        self._dirty = False
+        # False when the saved pool couldn't be read, so it isn't overwritten
+        self.writable = True
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    async def start(self, seed_links: List[str] = ()):
+        """Load the saved pool, or seed it from configured links on first run, then start the reaper"""
+        if not os.path.exists(self.path):
+            for code in codes_from_links(list(seed_links)):
+                self.add(code, None, None, "config")
+            await self.save()
+        else:
+            state = await asyncio.to_thread(load_json, self.path, None)
+            if not isinstance(state, dict):
+                self.writable = False
+                logger.error(
+                    f"Join code pool {self.path} could not be read; starting with an empty pool and "
+                    f"leaving the file untouched. Fix or remove it and restart to persist join codes again."
+                )
+            else:
+                for entry in state.get('codes', []):
+                    self._insert(entry)
+        reaped = self.reap()
+        logger.info(f"Join code pool has {len(self.codes)} live code(s), {reaped} expired while offline")
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._reap_loop())
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._dirty:
+            await self.save()
+
+    async def save(self) -> bool:
+        """Write the pool; while unsaved it stays dirty, so the reaper and close() try again"""
+        if not self.writable:
+            logger.warning(f"Not saving the join code pool over the unreadable {self.path}")
+            return False
+        state = {'codes': list(self.codes.values())}
+        # Cleared before the write so a change made while it runs marks the pool dirty again
+        self._dirty = False
+        saved = await asyncio.to_thread(save_json, self.path, state)
+        if not saved:
+            self._dirty = True
+        return saved
+
+    def launch_url(self, code: str) -> str:
+        return LAUNCH_URL.format(place_id=self.place_id, code=code)
+
+    def _insert(self, entry: Dict):
+        self.codes[entry['code']] = entry
+        self._rotation.append(entry)
+        if entry['expires_at'] is not None:
+            heapq.heappush(self._expiry, (entry['expires_at'], next(self._seq), entry))
+
+    def _live(self, entry: Dict) -> bool:
+        return self.codes.get(entry['code']) is entry
+
+    def add(self, code: str, expires_at: Optional[float], capacity: Optional[int], added_by: str) -> bool:
+        """
+        Add a code; returns False if it is already in the pool
+        """
+        if code in self.codes:
+            return False
+        self._insert({
+            'code': code,
+            'expires_at': expires_at,
+            'capacity': capacity,
+            'uses': 0,
+            'added_by': added_by,
+        })
+        self._dirty = True
+        return True
+
+    def remove(self, code: str) -> bool:
+        if self.codes.pop(code, None) is None:
+            return False
+        self._dirty = True
+        return True
+
+    def take(self, now: Optional[float] = None) -> Optional[str]:
+        """
+        The next live code, or None if the pool is empty
+        """
+        now = time.time() if now is None else now
+        rotation = self._rotation
+        while rotation:
+            entry = rotation.popleft()
+            if not self._live(entry):
+                continue
+            if entry['expires_at'] is not None and entry['expires_at'] <= now:
+                del self.codes[entry['code']]
+                self.reaped += 1
+                self._dirty = True
+                continue
+            entry['uses'] += 1
+            self.handed_out += 1
+            self._dirty = True
+            if entry['capacity'] is not None and entry['uses'] >= entry['capacity']:
+                # Last handout; the code is full after this
+                del self.codes[entry['code']]
+                logger.info(f"Join code {entry['code']} reached its capacity of {entry['capacity']}")
+            else:
+                rotation.append(entry)
+            return entry['code']
+        return None
+
+    def reap(self, now: Optional[float] = None) -> int:
+        """
+        Drop every expired code; returns how many were dropped
+        """
+        now = time.time() if now is None else now
+        expiry = self._expiry
+        reaped = 0
+        while expiry and expiry[0][0] <= now:
+            _, _, entry = heapq.heappop(expiry)
+            if self._live(entry):
+                del self.codes[entry['code']]
+                reaped += 1
+        # Rotation entries of dropped codes are skipped by take(); rebuild once they dominate
+        if len(self._rotation) > 2 * len(self.codes) + 64:
+            self._rotation = deque(entry for entry in self._rotation if self._live(entry))
+        if reaped:
+            self.reaped += reaped
+            self._dirty = True
+            logger.info(f"Reaped {reaped} expired join code(s)")
+        return reaped
+
+    def live(self) -> List[Dict]:
+        """Live codes, soonest to expire first"""
+        return sorted(
+            self.codes.values(),
+            key=lambda entry: entry['expires_at'] if entry['expires_at'] is not None else float('inf')
+        )
+
+    async def _reap_loop(self):
+        while True:
+            await asyncio.sleep(self.reap_interval)
+            self.reap()
+            if self._dirty:
+                await self.save()
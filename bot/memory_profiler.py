@@ -0,0 +1,193 @@
+import asyncio
+import discord
+import gc
+import glob
+import linecache
+import logging
+import os
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from config.settings import BOT_CONFIG
+from utils.json_store import save_json
+
+logger = logging.getLogger(__name__)
+
+PROFILE_CONFIG = BOT_CONFIG.get('memory_profiling', {})
+PROFILE_DIR = os.path.join("logs", "memprofile")
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_PATHS = (os.path.join(PROJECT_ROOT, "main.py"), os.path.join(PROJECT_ROOT, "bot") + os.sep)
+
+# discord.py objects whose live counts are exported
+TRACKED_TYPES = {
+    'Member': discord.Member,
+    'User': discord.User,
+    'Message': discord.Message,
+    'View': discord.ui.View,
+    'Interaction': discord.Interaction,
+    'Embed': discord.Embed,
+}
+
+def count_discord_objects() -> Dict[str, int]:
+    """Count live tracked discord.py objects on the heap"""
+    counts: Counter = Counter()
+    for obj in gc.get_objects():
+        for name, cls in TRACKED_TYPES.items():
+            if isinstance(obj, cls):
+                counts[name] += 1
+    return {name: counts.get(name, 0) for name in TRACKED_TYPES}
+
+def _is_project_frame(frame: tracemalloc.Frame) -> bool:
+    return frame.filename.startswith(PROJECT_PATHS[1]) or frame.filename == PROJECT_PATHS[0]
+
+def _format_frame(frame: tracemalloc.Frame) -> str:
+    filename = os.path.relpath(frame.filename, PROJECT_ROOT) if frame.filename.startswith(PROJECT_ROOT) else frame.filename
+    return f"{filename}:{frame.lineno}"
+
+class MemoryProfiler:
+    """
+    Takes tracemalloc snapshots at an interval and writes the allocation
+    sites that grew the most since the previous snapshot.
+
+    Each report names the most recent frame in main.py or bot/ for every
+    site, so growth inside discord.py or the standard library can be tied
+    back to the code that triggered it.
+    """
+
+    def __init__(self, output_dir: str = PROFILE_DIR):
+        self.output_dir = output_dir
+        self.top = PROFILE_CONFIG.get('top', 25)
+        self.keep_reports = PROFILE_CONFIG.get('keep_reports', 48)
+        self.interval = 0.0
+        self.count_objects = False
+        self.reports = 0
+        self.last_report: Optional[str] = None
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self._baseline_objects: Dict[str, int] = {}
+        self._previous_objects: Dict[str, int] = {}
+        self._started_tracing = False
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self, interval: float, frames: Optional[int] = None, count_objects: bool = False):
+        """
+        Start tracing (if needed) and take the baseline snapshot
+        """
+        if self.running:
+            raise RuntimeError("Memory profiling is already running")
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames or PROFILE_CONFIG.get('frames', 10))
+            self._started_tracing = True
+
+        self.interval = interval
+        self.count_objects = count_objects
+        self.reports = 0
+        self._baseline = self._previous = await asyncio.to_thread(self._snapshot)
+        self._baseline_objects = self._previous_objects = (
+            await asyncio.to_thread(count_discord_objects) if count_objects else {}
+        )
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Memory profiling started (every {interval:.0f}s, {tracemalloc.get_traceback_limit()} frames)")
+
+    async def stop(self) -> Optional[str]:
+        """
+        Write a final report against the baseline and stop tracing if this profiler started it
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        path = None
+        if self._baseline is not None and tracemalloc.is_tracing():
+            path = await self._report(self._baseline, "final")
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self._baseline = self._previous = None
+        logger.info("Memory profiling stopped")
+        return path
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self._report(self._previous, "interval")
+            except Exception as e:
+                logger.error(f"Error writing memory profile: {e}")
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, linecache.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ))
+
+    async def _report(self, reference: tracemalloc.Snapshot, kind: str) -> str:
+        report = await asyncio.to_thread(self._build_report, reference, kind)
+        path = os.path.join(self.output_dir, f"memprofile-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{self.reports:04d}-{kind}.json")
+        await asyncio.to_thread(self._write, path, report)
+        self.reports += 1
+        self.last_report = path
+        return path
+
+    def _build_report(self, reference: tracemalloc.Snapshot, kind: str) -> Dict[str, Any]:
+        snapshot = self._snapshot()
+        stats = snapshot.compare_to(reference, 'traceback')
+        self._previous = snapshot
+
+        growth: List[Dict[str, Any]] = []
+        for stat in stats:
+            if stat.size_diff <= 0:
+                continue
+            frames = list(stat.traceback)
+            origin = next((frame for frame in reversed(frames) if _is_project_frame(frame)), None)
+            growth.append({
+                'site': _format_frame(frames[-1]),
+                'origin': _format_frame(origin) if origin is not None else None,
+                'size_diff': stat.size_diff,
+                'count_diff': stat.count_diff,
+                'size': stat.size,
+                'count': stat.count,
+                'traceback': [_format_frame(frame) for frame in reversed(frames)],
+            })
+            if len(growth) >= self.top:
+                break
+
+        report: Dict[str, Any] = {
+            'kind': kind,
+            'taken_at': time.time(),
+            'traced_bytes': tracemalloc.get_traced_memory()[0],
+            'total_growth': sum(stat.size_diff for stat in stats),
+            'top_growth': growth,
+        }
+
+        if self.count_objects:
+            objects = count_discord_objects()
+            # Diffs use the same reference as the allocation growth
+            reference_objects = self._baseline_objects if kind == "final" else self._previous_objects
+            report['discord_objects'] = {
+                name: {'count': count, 'diff': count - reference_objects.get(name, 0)}
+                for name, count in objects.items()
+            }
+            self._previous_objects = objects
+
+        return report
+
+    def _write(self, path: str, report: Dict[str, Any]):
+        os.makedirs(self.output_dir, exist_ok=True)
+        save_json(path, report)
+        reports = sorted(glob.glob(os.path.join(self.output_dir, "memprofile-*.json")))
+        for old in reports[:-self.keep_reports]:
+            os.remove(old)
+
+memory_profiler = MemoryProfiler()
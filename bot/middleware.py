@@ -0,0 +1,355 @@
+import discord
+import functools
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+from bot.deferral import DeferralGuard, get_guard
+from bot.permissions import has_permission, PermissionLevel
+from bot.shutdown import DRAINING_MESSAGE, shutdown_coordinator
+from bot.tracing import tracer
+from config.settings import BOT_CONFIG
+from utils.logger import command_logger, permission_logger
+
+logger = logging.getLogger(__name__)
+
+GUILD_ONLY_MESSAGE = "❌ This command can only be used in a server."
+DEFAULT_DENIED_MESSAGE = "❌ You don't have permission to use this command."
+DEFAULT_ERROR_MESSAGE = "❌ An error occurred while running this command."
+
+COMMAND_CONFIG = BOT_CONFIG.get('commands', {})
+
+# Discord fails an interaction that isn't acknowledged within 3 seconds
+DEFAULT_DEFER_BUDGET = 2.0
+
+class CommandError(Exception):
+    """
+    Raised by command handlers to send a user-facing error message
+    """
+
+    def __init__(self, message: str, ephemeral: bool = True):
+        super().__init__(message)
+        self.message = message
+        self.ephemeral = ephemeral
+
+class CommandContext:
+    """
+    State shared by the pipeline stages for one command invocation
+    """
+
+    __slots__ = ('interaction', 'command_name', 'options', 'started', 'inclusive', 'outcome')
+
+    def __init__(self, interaction: discord.Interaction, command_name: str, options: 'PipelineOptions'):
+        self.interaction = interaction
+        self.command_name = command_name
+        self.options = options
+        self.started = time.perf_counter()
+        # Stage name -> time spent in the stage and everything inside it
+        self.inclusive: Dict[str, float] = {}
+        self.outcome = "ok"
+
+class PipelineOptions:
+    """
+    Per-command pipeline settings
+    """
+
+    __slots__ = ('level', 'guild_only', 'cooldown', 'defer_budget', 'ephemeral', 'denied_message',
+                 'error_message')
+
+    def __init__(self, level: PermissionLevel, guild_only: bool, cooldown: float, defer_budget: float,
+                 ephemeral: bool, denied_message: str, error_message: str):
+        self.level = level
+        self.guild_only = guild_only
+        self.cooldown = cooldown
+        self.defer_budget = defer_budget
+        self.ephemeral = ephemeral
+        self.denied_message = denied_message
+        self.error_message = error_message
+
+async def send_response(interaction: discord.Interaction, *args, **kwargs):
+    """
+    Send a response, switching to a followup once the interaction was acknowledged
+    """
+    guard = get_guard(interaction)
+    if guard is None:
+        return await _send(interaction, None, *args, **kwargs)
+
+    # Hold the guard's lock so an automatic defer can't race this send
+    async with guard.lock:
+        return await _send(interaction, guard, *args, **kwargs)
+
+async def _send(interaction: discord.Interaction, guard: Optional[DeferralGuard], *args, **kwargs):
+    if not interaction.response.is_done():
+        return await interaction.response.send_message(*args, **kwargs)
+
+    if guard is not None and guard.placeholder:
+        guard.placeholder = False
+        # The first followup edits the deferred "thinking" message and keeps its visibility;
+        # drop the placeholder so e.g. an ephemeral error after a public defer stays ephemeral
+        if kwargs.get('ephemeral', False) != guard.ephemeral:
+            try:
+                await interaction.delete_original_response()
+            except discord.HTTPException as e:
+                logger.warning(f"Could not remove the deferred response of /{guard.command_name}: {e}")
+    return await interaction.followup.send(*args, **kwargs)
+
+class CooldownMap:
+    """
+    Per-command, per-user cooldown expiries with lazy eviction
+    """
+
+    def __init__(self, sweep_threshold: int = 1024):
+        self._expiries: Dict[Tuple[str, int], float] = {}
+        self.sweep_threshold = sweep_threshold
+
+    def check(self, command_name: str, user_id: int, cooldown: float) -> float:
+        """
+        Start the cooldown if it isn't running and return 0, otherwise return the seconds left
+        """
+        now = time.monotonic()
+        key = (command_name, user_id)
+        expiry = self._expiries.get(key)
+        if expiry is not None and expiry > now:
+            return expiry - now
+
+        self._expiries[key] = now + cooldown
+        if len(self._expiries) > self.sweep_threshold:
+            self._sweep(now)
+        return 0.0
+
+    def _sweep(self, now: float):
+        for key in [k for k, expiry in self._expiries.items() if expiry <= now]:
+            del self._expiries[key]
+        # Keep sweeps amortised when most entries are still active
+        self.sweep_threshold = max(1024, len(self._expiries) * 2)
+
+    def __len__(self) -> int:
+        return len(self._expiries)
+
+class PipelineMetrics:
+    """
+    Aggregated per-command, per-stage timings
+    """
+
+    def __init__(self, slow_threshold: float = 1.0, slow_history: int = 50):
+        # (command, stage) -> [count, total seconds, max seconds]
+        self.stages: Dict[Tuple[str, str], List[float]] = {}
+        self.slow_threshold = slow_threshold
+        self.slow_handlers: Deque[Dict[str, Any]] = deque(maxlen=slow_history)
+
+    def record(self, ctx: CommandContext, stage_names: List[str]):
+        """
+        Record the self time of every stage that ran for this invocation
+        """
+        total = 0.0
+        for index, name in enumerate(stage_names):
+            inclusive = ctx.inclusive.get(name)
+            if inclusive is None:
+                break
+            inner = ctx.inclusive.get(stage_names[index + 1], 0.0) if index + 1 < len(stage_names) else 0.0
+            self._add(ctx.command_name, name, inclusive - inner)
+            total = max(total, inclusive)
+
+        self._add(ctx.command_name, "total", total)
+        if total >= self.slow_threshold:
+            self.slow_handlers.append({
+                'command': ctx.command_name,
+                'duration': total,
+                'outcome': ctx.outcome,
+                'at': time.time()
+            })
+
+    def _add(self, command_name: str, stage: str, duration: float):
+        entry = self.stages.get((command_name, stage))
+        if entry is None:
+            self.stages[(command_name, stage)] = [1, duration, duration]
+        else:
+            entry[0] += 1
+            entry[1] += duration
+            if duration > entry[2]:
+                entry[2] = duration
+
+    def summary(self, command_name: Optional[str] = None) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Get average and max milliseconds per stage, grouped by command
+        """
+        result: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (name, stage), (count, total, peak) in self.stages.items():
+            if command_name is not None and name != command_name:
+                continue
+            result.setdefault(name, {})[stage] = {
+                'count': count,
+                'avg_ms': total / count * 1000,
+                'max_ms': peak * 1000
+            }
+        return result
+
+Stage = Callable[[CommandContext, Callable[[], Awaitable[None]]], Awaitable[None]]
+
+async def audit_stage(ctx: CommandContext, call_next):
+    """Log every invocation with its outcome and duration"""
+    interaction = ctx.interaction
+    try:
+        await call_next()
+    finally:
+        command_logger.log_command_usage(
+            str(interaction.user),
+            ctx.command_name,
+            str(interaction.guild) if interaction.guild else None
+        )
+        duration = (time.perf_counter() - ctx.started) * 1000
+        logger.debug(f"/{ctx.command_name} finished with outcome '{ctx.outcome}' in {duration:.1f}ms")
+
+async def drain_stage(ctx: CommandContext, call_next):
+    """Refuse new commands while shutting down and track the ones already running"""
+    if not shutdown_coordinator.accepting("interaction"):
+        ctx.outcome = "draining"
+        await _send_error(ctx, DRAINING_MESSAGE, True)
+        return
+    with shutdown_coordinator.track("interaction"):
+        await call_next()
+
+async def error_stage(ctx: CommandContext, call_next):
+    """Turn exceptions raised further down into a user-facing message"""
+    try:
+        await call_next()
+    except CommandError as e:
+        ctx.outcome = "rejected"
+        await _send_error(ctx, f"❌ {e.message}", e.ephemeral)
+    except discord.Forbidden as e:
+        ctx.outcome = "error"
+        logger.error(f"Forbidden in /{ctx.command_name}: {e}")
+        await _send_error(ctx, "❌ I don't have permission to do that.", True)
+    except Exception as e:
+        ctx.outcome = "error"
+        logger.error(f"Error in /{ctx.command_name}: {e}")
+        await _send_error(ctx, ctx.options.error_message, True)
+
+async def _send_error(ctx: CommandContext, message: str, ephemeral: bool):
+    try:
+        await send_response(ctx.interaction, message, ephemeral=ephemeral)
+    except Exception as followup_error:
+        logger.error(f"Error sending error message: {followup_error}")
+
+async def permission_stage(ctx: CommandContext, call_next):
+    """Reject users below the command's permission level"""
+    level = ctx.options.level
+    if level is not PermissionLevel.USER and not has_permission(ctx.interaction.user, level):
+        ctx.outcome = "denied"
+        permission_logger.log_permission_denied(str(ctx.interaction.user), ctx.command_name, level.name)
+        await send_response(ctx.interaction, ctx.options.denied_message, ephemeral=True)
+        return
+    await call_next()
+
+async def cooldown_stage(ctx: CommandContext, call_next):
+    """Rate limit repeated use of a command by the same user"""
+    cooldown = ctx.options.cooldown
+    if cooldown > 0:
+        remaining = cooldown_map.check(ctx.command_name, ctx.interaction.user.id, cooldown)
+        if remaining > 0:
+            ctx.outcome = "cooldown"
+            await send_response(
+                ctx.interaction,
+                f"⏳ Please wait {remaining:.0f}s before using /{ctx.command_name} again.",
+                ephemeral=True
+            )
+            return
+    await call_next()
+
+async def guild_stage(ctx: CommandContext, call_next):
+    """Reject guild-only commands used outside a server"""
+    interaction = ctx.interaction
+    if ctx.options.guild_only and (interaction.guild is None or not isinstance(interaction.user, discord.Member)):
+        ctx.outcome = "rejected"
+        await send_response(interaction, GUILD_ONLY_MESSAGE, ephemeral=True)
+        return
+    await call_next()
+
+async def defer_stage(ctx: CommandContext, call_next):
+    """Defer automatically when the handler hasn't responded within the latency budget"""
+    # The budget counts from when the interaction entered the pipeline
+    budget = max(0.0, ctx.options.defer_budget - (time.perf_counter() - ctx.started))
+    guard = DeferralGuard(ctx.interaction, ctx.command_name, budget, ctx.options.ephemeral)
+    guard.start()
+    try:
+        await call_next()
+    finally:
+        await guard.stop()
+
+# Outermost first. The deferral guard wraps error mapping so an error sent after an
+# automatic defer still sees the guard and can replace its placeholder.
+STAGES: List[Tuple[str, Stage]] = [
+    ("audit", audit_stage),
+    ("drain", drain_stage),
+    ("defer", defer_stage),
+    ("errors", error_stage),
+    ("permission", permission_stage),
+    ("cooldown", cooldown_stage),
+    ("guild_only", guild_stage),
+]
+STAGE_NAMES = [name for name, _ in STAGES] + ["handler"]
+
+async def run_pipeline(ctx: CommandContext, handler: Callable[[], Awaitable[Any]]):
+    """
+    Run the stages around a handler, recording each stage's inclusive time
+    """
+    async def call(index: int):
+        name = STAGE_NAMES[index]
+        start = time.perf_counter()
+        try:
+            with tracer.span(f"stage.{name}"):
+                if index == len(STAGES):
+                    await handler()
+                else:
+                    await STAGES[index][1](ctx, lambda: call(index + 1))
+        finally:
+            ctx.inclusive[name] = time.perf_counter() - start
+
+    interaction = ctx.interaction
+    with tracer.trace(f"/{ctx.command_name}", kind="interaction", command=ctx.command_name,
+                      user_id=interaction.user.id, guild_id=interaction.guild_id) as span:
+        try:
+            await call(0)
+        finally:
+            span.set_attribute('outcome', ctx.outcome)
+            pipeline_metrics.record(ctx, STAGE_NAMES)
+
+def command_pipeline(level: PermissionLevel = PermissionLevel.USER, guild_only: bool = False,
+                     cooldown: Optional[float] = None, defer: bool = False,
+                     defer_budget: Optional[float] = None, ephemeral: bool = False,
+                     denied_message: str = DEFAULT_DENIED_MESSAGE,
+                     error_message: str = DEFAULT_ERROR_MESSAGE):
+    """
+    Decorator running an app command callback through the middleware pipeline.
+    Place it directly above the callback, below @app_commands.command/@tree.command.
+    A cooldown of None uses the command's entry in the 'commands.cooldowns' config.
+    The interaction is deferred once defer_budget seconds pass without a response
+    (the 'commands.defer_budget_seconds' config by default, immediately if defer=True).
+    """
+    if defer:
+        defer_budget = 0.0
+    elif defer_budget is None:
+        defer_budget = COMMAND_CONFIG.get('defer_budget_seconds', DEFAULT_DEFER_BUDGET)
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            # discord.py passes the interaction positionally, after the cog for cog commands
+            interaction = args[-1]
+            command = getattr(interaction, 'command', None)
+            command_name = command.qualified_name if command is not None else func.__name__
+
+            command_cooldown = cooldown
+            if command_cooldown is None:
+                command_cooldown = COMMAND_CONFIG.get('cooldowns', {}).get(command_name, 0)
+
+            options = PipelineOptions(level, guild_only, command_cooldown, defer_budget, ephemeral,
+                                      denied_message, error_message)
+            ctx = CommandContext(interaction, command_name, options)
+            await run_pipeline(ctx, lambda: func(*args, **kwargs))
+        return wrapper
+    return decorator
+
+# Create global pipeline state
+cooldown_map = CooldownMap()
+pipeline_metrics = PipelineMetrics(slow_threshold=COMMAND_CONFIG.get('slow_handler_seconds', 1.0))
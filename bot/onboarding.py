@@ -0,0 +1,238 @@
+import asyncio
+import datetime
+import discord
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Set, Tuple
+from config.settings import BOT_CONFIG
+from utils.json_store import load_json, save_json
+from utils.resilience import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+ONBOARDING_CONFIG = BOT_CONFIG.get('onboarding', {})
+ONBOARDING_FILE = os.path.join("config", "onboarding.json")
+
+class OnboardingQueue:
+    """
+    Assigns the configured starter roles to members who join.
+
+    on_member_join only records the member. Joins arriving within the batch
+    window are collected, deduplicated and resolved against each guild's
+    starter roles once per batch, then handed to a small worker pool that
+    shares a token bucket, so a raid of thousands of joins drains at a
+    steady rate instead of flooding Discord with requests that come back
+    as 429s. Each member gets one role edit however many starter roles
+    there are.
+
+    The join time of the last fully drained batch is persisted. On startup
+    every member who joined after it without their starter roles (joins
+    missed during a restart, a queue cut short by shutdown, or assignments
+    that failed) is queued again. A failed assignment holds the checkpoint
+    just before that member's join, so it is retried on the next start.
+    """
+
+    def __init__(self, role_manager, path: str = ONBOARDING_FILE):
+        self.role_manager = role_manager
+        self.path = path
+        self.enabled = ONBOARDING_CONFIG.get('enabled', True)
+        self.starter_roles: List[str] = ONBOARDING_CONFIG.get('starter_roles', ["Civilian"])
+        self.batch_window = ONBOARDING_CONFIG.get('batch_window_seconds', 2)
+        self.worker_count = ONBOARDING_CONFIG.get('workers', 3)
+        self.reconcile_hours = ONBOARDING_CONFIG.get('reconcile_hours', 24)
+        self.max_retries = ONBOARDING_CONFIG.get('max_retries', 3)
+        self.limiter = TokenBucket(
+            ONBOARDING_CONFIG.get('requests_per_second', 5), ONBOARDING_CONFIG.get('burst', 5)
+        )
+
+        # (guild_id, member_id) -> member, waiting for the batch window to close
+        self.pending: Dict[Tuple[int, int], discord.Member] = {}
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.in_flight = 0
+        self.stats = {'joined': 0, 'assigned': 0, 'skipped': 0, 'failed': 0, 'rate_limited': 0, 'reconciled': 0}
+        # Join time of the newest member in the current backlog
+        self.newest_join = 0.0
+        # Join time of the oldest member whose assignment failed in this process
+        self.oldest_failed_join: Optional[float] = None
+        self.checkpoint = 0.0
+        self._batch_task: Optional[asyncio.Task] = None
+        self._workers: List[asyncio.Task] = []
+        self._reconciled: Set[int] = set()
+        self._background: Set[asyncio.Task] = set()
+
+    @property
+    def backlog(self) -> int:
+        """Members waiting for their roles, batched or queued"""
+        return len(self.pending) + self.queue.qsize() + self.in_flight
+
+    async def start(self):
+        """Load the checkpoint and start the worker pool"""
+        state = await asyncio.to_thread(load_json, self.path, {})
+        self.checkpoint = state.get('checkpoint', 0.0)
+        if not self.enabled:
+            logger.info("Onboarding is disabled")
+            return
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.worker_count)]
+
+    async def close(self):
+        """Stop the workers; anything still queued is reconciled on the next start"""
+        tasks = self._workers + list(self._background) + ([self._batch_task] if self._batch_task else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._batch_task = None
+        if self.backlog:
+            logger.info(f"Onboarding stopped with {self.backlog} member(s) waiting; they'll be reconciled on restart")
+
+    def enqueue(self, member: discord.Member):
+        """
+        Record a join; assigned after the batch window closes
+        """
+        if not self.enabled or member.bot:
+            return
+        # Members still on the rules screen get their roles once they pass it
+        if member.pending:
+            return
+        self.pending[(member.guild.id, member.id)] = member
+        self.stats['joined'] += 1
+        if self._batch_task is None or self._batch_task.done():
+            self._batch_task = asyncio.create_task(self._collect())
+
+    async def _collect(self):
+        await asyncio.sleep(self.batch_window)
+        batch, self.pending = self.pending, {}
+
+        # Starter roles are resolved once per guild per batch
+        guild_roles: Dict[int, List[discord.Role]] = {}
+        for member in batch.values():
+            guild = member.guild
+            roles = guild_roles.get(guild.id)
+            if roles is None:
+                roles = guild_roles[guild.id] = self._starter_roles(guild)
+            missing = [role for role in roles if role not in member.roles]
+            if not missing:
+                self.stats['skipped'] += 1
+                continue
+            if member.joined_at is not None:
+                self.newest_join = max(self.newest_join, member.joined_at.timestamp())
+            self.queue.put_nowait((member, missing, 0))
+
+        logger.info(f"Onboarding batch of {len(batch)} join(s), {self.queue.qsize()} queued")
+        await self._maybe_checkpoint()
+
+    def _starter_roles(self, guild: discord.Guild) -> List[discord.Role]:
+        roles = []
+        for name in self.starter_roles:
+            role = discord.utils.get(guild.roles, name=name)
+            if role is None:
+                logger.warning(f"Starter role '{name}' not found in {guild}")
+            else:
+                roles.append(role)
+        return roles
+
+    async def _worker(self):
+        while True:
+            member, roles, attempt = await self.queue.get()
+            self.in_flight += 1
+            try:
+                await self._assign(member, roles, attempt)
+            except Exception as e:
+                self._failed(member)
+                logger.error(f"Error onboarding {member}: {e}")
+            finally:
+                self.in_flight -= 1
+                self.queue.task_done()
+            await self._maybe_checkpoint()
+
+    async def _assign(self, member: discord.Member, roles: List[discord.Role], attempt: int):
+        await self.limiter.acquire()
+        try:
+            success, message = await self.role_manager.add_roles(
+                member, roles, member.guild.me, reason="Starter roles on join"
+            )
+        except discord.RateLimited as e:
+            # Hold the whole pool, then retry this member at the back of the queue
+            self.stats['rate_limited'] += 1
+            self.limiter.pause(e.retry_after)
+            if attempt < self.max_retries:
+                self.queue.put_nowait((member, roles, attempt + 1))
+            else:
+                self._failed(member)
+                logger.error(f"Gave up onboarding {member} after {attempt + 1} rate-limited attempts")
+            return
+
+        if success:
+            self.stats['assigned'] += 1
+        elif all(role in member.roles for role in roles):
+            self.stats['skipped'] += 1
+        else:
+            self._failed(member)
+            logger.warning(f"Could not onboard {member}: {message}")
+
+    def _failed(self, member: discord.Member):
+        self.stats['failed'] += 1
+        if member.joined_at is not None:
+            joined = member.joined_at.timestamp()
+            if self.oldest_failed_join is None or joined < self.oldest_failed_join:
+                self.oldest_failed_join = joined
+
+    async def _maybe_checkpoint(self):
+        # Only a fully drained backlog moves the checkpoint forward, and never past a failed join
+        if self.backlog:
+            return
+        checkpoint = self.newest_join
+        if self.oldest_failed_join is not None:
+            # Reconciliation takes joins after the checkpoint, so stop just short of the failure
+            checkpoint = min(checkpoint, self.oldest_failed_join - 0.001)
+        if checkpoint <= self.checkpoint:
+            return
+        self.checkpoint = checkpoint
+        await asyncio.to_thread(self.save)
+
+    def schedule_reconcile(self, guilds: List[discord.Guild]):
+        """Reconcile guilds in the background, e.g. from on_ready"""
+        for guild in guilds:
+            task = asyncio.create_task(self.reconcile(guild))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+    async def reconcile(self, guild: discord.Guild) -> int:
+        """
+        Queue members who joined since the checkpoint and are missing starter roles.
+        Runs once per guild per process; yields to the event loop while scanning.
+        """
+        if not self.enabled or guild.id in self._reconciled:
+            return 0
+        self._reconciled.add(guild.id)
+
+        roles = self._starter_roles(guild)
+        if not roles:
+            return 0
+        # Without a checkpoint only recent joins are touched, not everyone who never took a role
+        since = self.checkpoint or time.time() - self.reconcile_hours * 3600
+        since_dt = datetime.datetime.fromtimestamp(since, datetime.timezone.utc)
+
+        queued = 0
+        for index, member in enumerate(guild.members):
+            if index % 1000 == 999:
+                await asyncio.sleep(0)
+            if member.bot or member.pending or member.joined_at is None or member.joined_at <= since_dt:
+                continue
+            if (guild.id, member.id) in self.pending:
+                continue
+            missing = [role for role in roles if role not in member.roles]
+            if missing:
+                self.newest_join = max(self.newest_join, member.joined_at.timestamp())
+                self.queue.put_nowait((member, missing, 0))
+                queued += 1
+
+        self.stats['reconciled'] += queued
+        if queued:
+            logger.info(f"Reconciled {queued} member(s) in {guild} who joined without starter roles")
+        return queued
+
+    def save(self) -> bool:
+        """Persist the checkpoint"""
+        return save_json(self.path, {'checkpoint': self.checkpoint})
@@ -2,6 +2,7 @@ import discord
 import logging
 from enum import Enum
 from typing import List, Union
+from bot.tracing import traced
 from config.settings import BOT_CONFIG
 
 logger = logging.getLogger(__name__)
@@ -19,6 +20,7 @@ class PermissionManager:
         self.moderator_roles = BOT_CONFIG['moderator_roles']
         self.owner_ids = BOT_CONFIG['owner_ids']
     
+    @traced()
     def get_user_permission_level(self, user: Union[discord.Member, discord.User]) -> PermissionLevel:
         """
         Get the permission level of a user
@@ -55,6 +57,7 @@ class PermissionManager:
             logger.error(f"Error getting user permission level: {e}")
             return PermissionLevel.USER
     
+    @traced()
     def has_permission(self, user: Union[discord.Member, discord.User], required_level: PermissionLevel) -> bool:
         """
         Check if user has the required permission level
@@ -66,6 +69,7 @@ class PermissionManager:
             logger.error(f"Error checking permissions: {e}")
             return False
     
+    @traced()
     def can_manage_user(self, moderator: discord.Member, target: discord.Member) -> bool:
         """
         Check if moderator can manage the target user
@@ -115,16 +119,8 @@ def can_manage_user(moderator: discord.Member, target: discord.Member) -> bool:
 
 def require_permission(level: PermissionLevel):
     """
-    Decorator to require specific permission level for commands
+    Decorator to require specific permission level for commands.
+    Runs the command through the middleware pipeline with that level.
     """
-    def decorator(func):
-        async def wrapper(interaction: discord.Interaction, *args, **kwargs):
-            if not has_permission(interaction.user, level):
-                await interaction.response.send_message(
-                    "❌ You don't have permission to use this command.",
-                    ephemeral=True
-                )
-                return
-            return await func(interaction, *args, **kwargs)
-        return wrapper
-    return decorator
+    from bot.middleware import command_pipeline
+    return command_pipeline(level=level)
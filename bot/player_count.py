@@ -0,0 +1,106 @@
+import asyncio
+import aiohttp
+import logging
+import random
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+PLACE_ID_PATTERN = re.compile(r'(?:placeId=|/games/)(\d+)')
+
+class PlayerCountProvider(ABC):
+    """
+    Interface for fetching the player count behind a server link
+    """
+
+    name = "base"
+
+    @abstractmethod
+    async def fetch_player_count(self, session: aiohttp.ClientSession, link: str) -> int:
+        """
+        Return the current player count for a server link, raising on failure
+        """
+
+class HttpJsonPlayerCountProvider(PlayerCountProvider):
+    """
+    Reads player counts from a JSON HTTP endpoint.
+
+    url_template may use {place_id} and {link}. count_field is a dotted path
+    into the response; when it lands on a list, the counts of its items are
+    summed (e.g. "data.playing" over a Roblox server list).
+    """
+
+    name = "http_json"
+
+    def __init__(self, url_template: str, count_field: str, headers: Optional[Dict[str, str]] = None):
+        self.url_template = url_template
+        self.count_field = count_field.split('.') if count_field else []
+        self.headers = headers or {}
+
+    async def fetch_player_count(self, session: aiohttp.ClientSession, link: str) -> int:
+        match = PLACE_ID_PATTERN.search(link)
+        place_id = match.group(1) if match else ""
+        url = self.url_template.format(place_id=place_id, link=link)
+
+        async with session.get(url, headers=self.headers) as response:
+            response.raise_for_status()
+            data = await response.json()
+        return int(self._extract(data, self.count_field))
+
+    def _extract(self, data: Any, path) -> float:
+        if not path:
+            return data
+        if isinstance(data, list):
+            return sum(self._extract(item, path) for item in data)
+        return self._extract(data[path[0]], path[1:])
+
+class FakePlayerCountProvider(PlayerCountProvider):
+    """
+    Offline provider: a bounded random walk per link with optional latency and failures
+    """
+
+    name = "fake"
+
+    def __init__(self, max_players: int = 50, latency: float = 0.05, failure_rate: float = 0.0,
+                 seed: Optional[int] = None):
+        self.max_players = max_players
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.calls = 0
+        self._random = random.Random(seed)
+        self._counts: Dict[str, int] = {}
+
+    async def fetch_player_count(self, session: aiohttp.ClientSession, link: str) -> int:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self._random.uniform(0, self.latency))
+        if self._random.random() < self.failure_rate:
+            raise aiohttp.ClientError("Simulated provider failure")
+
+        count = self._counts.get(link, self._random.randint(0, self.max_players // 2))
+        count = max(0, min(self.max_players, count + self._random.randint(-3, 3)))
+        self._counts[link] = count
+        return count
+
+def create_provider(config: Dict[str, Any]) -> PlayerCountProvider:
+    """
+    Build the provider selected in the player_polling config
+    """
+    provider = config.get('provider', 'fake')
+    if provider == 'http_json':
+        http_config = config.get('http', {})
+        return HttpJsonPlayerCountProvider(
+            http_config['url_template'],
+            http_config.get('count_field', ''),
+            http_config.get('headers')
+        )
+    if provider == 'fake':
+        fake_config = config.get('fake', {})
+        return FakePlayerCountProvider(
+            max_players=fake_config.get('max_players', 50),
+            latency=fake_config.get('latency_seconds', 0.05),
+            failure_rate=fake_config.get('failure_rate', 0.0)
+        )
+    raise ValueError(f"Unknown player count provider '{provider}'")
@@ -0,0 +1,223 @@
+import asyncio
+import discord
+import logging
+import os
+from typing import Dict, List, Optional, Set, Tuple
+from bot.shutdown import DRAINING_MESSAGE, shutdown_coordinator
+from config.settings import BOT_CONFIG
+from utils.json_store import load_json, save_json
+
+logger = logging.getLogger(__name__)
+
+REACTION_ROLE_CONFIG = BOT_CONFIG.get('reaction_roles', {})
+REACTION_ROLE_FILE = os.path.join("config", "reaction_roles.json")
+
+def emoji_key(emoji: discord.PartialEmoji) -> str:
+    """Custom emojis by id (names can change), unicode emojis by character"""
+    return str(emoji.id) if emoji.id else emoji.name
+
+def button_key(role_id: int) -> str:
+    return f"button:{role_id}"
+
+class RoleButton(discord.ui.DynamicItem[discord.ui.Button], template=r'role:(?P<role_id>[0-9]+)'):
+    """
+    Persistent self-assign button. The role id lives in the custom_id, so
+    buttons keep working after a restart without re-registering any views.
+    """
+
+    def __init__(self, role_id: int, label: Optional[str] = None, emoji: Optional[str] = None):
+        super().__init__(discord.ui.Button(
+            label=label,
+            emoji=emoji,
+            style=discord.ButtonStyle.secondary,
+            custom_id=f"role:{role_id}"
+        ))
+        self.role_id = role_id
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(int(match['role_id']))
+
+    async def callback(self, interaction: discord.Interaction):
+        if not shutdown_coordinator.accepting("button"):
+            await interaction.response.send_message(DRAINING_MESSAGE, ephemeral=True)
+            return
+        with shutdown_coordinator.track("button"):
+            await interaction.client.reaction_roles.handle_button(interaction, self.role_id)
+
+class ReactionRoles:
+    """
+    Self-assignable roles through reactions and buttons.
+
+    Bindings live in an in-memory index, message_id -> {emoji key -> binding},
+    so each raw gateway event is answered from the member and role caches
+    without REST fetches. Reactions on unbound messages cost two dict lookups.
+    Role changes are debounced per (guild, user, role): rapid toggling only
+    applies the final state once the user settles. They go through
+    RoleManager, so protected roles and the role hierarchy are enforced. The
+    index is persisted to disk on every change. On close, changes still
+    settling are applied at once and changes already being applied are
+    awaited rather than cancelled.
+    """
+
+    def __init__(self, role_manager, path: str = REACTION_ROLE_FILE):
+        self.role_manager = role_manager
+        self.path = path
+        self.debounce = REACTION_ROLE_CONFIG.get('debounce_seconds', 1.5)
+        self.index: Dict[int, Dict[str, Dict]] = {}
+        # (guild_id, user_id, role_id) -> [member, role, wanted]
+        self.pending: Dict[Tuple[int, int, int], list] = {}
+        # Changes whose RoleManager call is running
+        self.in_flight = 0
+        self.applied = 0
+        self.coalesced = 0
+        # Tasks still sleeping out the debounce, by key
+        self._settling: Dict[Tuple[int, int, int], asyncio.Task] = {}
+        self._background: Set[asyncio.Task] = set()
+
+    @property
+    def backlog(self) -> int:
+        """Changes not applied yet, settling or in flight"""
+        return len(self.pending) + self.in_flight
+
+    async def start(self):
+        """Load the persisted index"""
+        entries = await asyncio.to_thread(load_json, self.path, [])
+        for entry in entries:
+            self.index.setdefault(entry['message_id'], {})[entry['key']] = entry
+        logger.info(f"Loaded {len(entries)} reaction/button role binding(s)")
+
+    def __len__(self) -> int:
+        return sum(len(bindings) for bindings in self.index.values())
+
+    def bind(self, guild_id: int, channel_id: int, message_id: int, key: str, role: discord.Role,
+             emoji: Optional[str] = None):
+        self.index.setdefault(message_id, {})[key] = {
+            'guild_id': guild_id,
+            'channel_id': channel_id,
+            'message_id': message_id,
+            'key': key,
+            'emoji': emoji,
+            'role_id': role.id,
+        }
+
+    def unbind(self, message_id: int, key: Optional[str] = None) -> int:
+        """Remove one binding, or every binding of a message when key is None"""
+        bindings = self.index.get(message_id)
+        if not bindings:
+            return 0
+        if key is None:
+            del self.index[message_id]
+            return len(bindings)
+        if bindings.pop(key, None) is None:
+            return 0
+        if not bindings:
+            del self.index[message_id]
+        return 1
+
+    def bindings_for_guild(self, guild_id: int) -> List[Dict]:
+        return [
+            entry for bindings in self.index.values() for entry in bindings.values()
+            if entry['guild_id'] == guild_id
+        ]
+
+    async def save(self) -> bool:
+        """Persist the index off the event loop"""
+        entries = [entry for bindings in self.index.values() for entry in bindings.values()]
+        return await asyncio.to_thread(save_json, self.path, entries)
+
+    def handle_reaction(self, payload: discord.RawReactionActionEvent, guild: Optional[discord.Guild]):
+        """
+        Route a raw reaction add/remove to a role change
+        """
+        bindings = self.index.get(payload.message_id)
+        if bindings is None or guild is None:
+            return
+        binding = bindings.get(emoji_key(payload.emoji))
+        if binding is None:
+            return
+
+        # payload.member is only set on add; removals resolve from the member cache
+        member = payload.member or guild.get_member(payload.user_id)
+        role = guild.get_role(binding['role_id'])
+        if member is None or member.bot or role is None:
+            return
+        self.request(member, role, payload.event_type == 'REACTION_ADD')
+
+    async def handle_button(self, interaction: discord.Interaction, role_id: int):
+        """Toggle a button role for the clicking member"""
+        guild = interaction.guild
+        bindings = self.index.get(interaction.message.id, {})
+        role = guild.get_role(role_id) if guild is not None else None
+        if button_key(role_id) not in bindings or role is None:
+            await interaction.response.send_message("❌ This role button is no longer active.", ephemeral=True)
+            return
+        if not self.role_manager.is_role_manageable(role, guild.me):
+            await interaction.response.send_message(f"❌ I can't assign **{role.name}**.", ephemeral=True)
+            return
+
+        member = interaction.user
+        pending = self.pending.get((guild.id, member.id, role.id))
+        has_role = pending[2] if pending is not None else role in member.roles
+        self.request(member, role, not has_role)
+        action = "removed from" if has_role else "added to"
+        await interaction.response.send_message(f"✅ **{role.name}** will be {action} you.", ephemeral=True)
+
+    def request(self, member: discord.Member, role: discord.Role, wanted: bool):
+        """
+        Ask for a member to have (or not have) a role; applied once toggling settles
+        """
+        key = (member.guild.id, member.id, role.id)
+        pending = self.pending.get(key)
+        if pending is not None:
+            pending[0] = member
+            pending[2] = wanted
+            self.coalesced += 1
+            return
+
+        self.pending[key] = [member, role, wanted]
+        self._settling[key] = self._spawn(self._settle(key))
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
+    async def _settle(self, key: Tuple[int, int, int]):
+        await asyncio.sleep(self.debounce)
+        self._settling.pop(key, None)
+        await self._apply(key)
+
+    async def _apply(self, key: Tuple[int, int, int]):
+        member, role, wanted = self.pending.pop(key)
+        # Toggled back to where it started
+        if wanted == (role in member.roles):
+            return
+
+        moderator = member.guild.me
+        self.in_flight += 1
+        try:
+            if wanted:
+                success, message = await self.role_manager.add_role(member, role, moderator)
+            else:
+                success, message = await self.role_manager.remove_role(member, role, moderator)
+        finally:
+            self.in_flight -= 1
+        if success:
+            self.applied += 1
+        else:
+            logger.warning(f"Self-assign of {role.name} for {member} failed: {message}")
+
+    async def close(self):
+        """Apply debounced changes now instead of waiting for them to settle"""
+        settling = list(self._settling.values())
+        self._settling.clear()
+        for task in settling:
+            task.cancel()
+        await asyncio.gather(*settling, return_exceptions=True)
+        for key in list(self.pending):
+            self._spawn(self._apply(key))
+        # asyncio.wait leaves the changes running if the caller gives up at a deadline
+        if self._background:
+            await asyncio.wait(set(self._background))
@@ -0,0 +1,97 @@
+import discord
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class RenderedEmbed(discord.Embed):
+    """
+    Embed that sends a pre-serialized payload.
+
+    discord.py calls to_dict() on every embed it sends; returning the stored
+    payload skips re-serializing the fields on each response.
+    """
+
+    _payload: Dict[str, Any]
+
+    @classmethod
+    def from_embed(cls, embed: discord.Embed) -> 'RenderedEmbed':
+        payload = embed.to_dict()
+        rendered = cls.from_dict(payload)
+        rendered._payload = payload
+        return rendered
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._payload
+
+class RenderCache:
+    """
+    Cache of rendered embeds per command and scope (usually a guild ID).
+
+    Each entry remembers the data version it was rendered from. The owners of
+    the data (status store, link registry, role index) bump their version
+    counter on change, so a version mismatch means the entry is stale.
+    """
+
+    def __init__(self, max_size: int = 512):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[Hashable, RenderedEmbed]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, command: str, scope: Hashable, version: Hashable) -> Optional[RenderedEmbed]:
+        """
+        Get the cached embed if it was rendered from the given version
+        """
+        key = (command, scope)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        return None
+
+    def put(self, command: str, scope: Hashable, version: Hashable, embed: discord.Embed) -> RenderedEmbed:
+        """
+        Store a freshly built embed and return its rendered form
+        """
+        key = (command, scope)
+        rendered = RenderedEmbed.from_embed(embed)
+        self._entries[key] = (version, rendered)
+        self._entries.move_to_end(key)
+
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+        return rendered
+
+    async def render(self, command: str, scope: Hashable, version: Hashable,
+                     builder: Callable[[], Any]) -> RenderedEmbed:
+        """
+        Get the cached embed or build it with an async builder and cache it
+        """
+        rendered = self.get(command, scope, version)
+        if rendered is not None:
+            return rendered
+        return self.put(command, scope, version, await builder())
+
+    def invalidate(self, command: Optional[str] = None, scope: Optional[Hashable] = None):
+        """
+        Drop cached entries for a command and/or scope (everything by default)
+        """
+        if command is None and scope is None:
+            self._entries.clear()
+            return
+
+        for key in list(self._entries):
+            if (command is None or key[0] == command) and (scope is None or key[1] == scope):
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+# Create global render cache instance
+render_cache = RenderCache()
@@ -1,15 +1,37 @@
 import discord
 import logging
 from typing import Tuple, Dict, List
+from bot.audit_store import RoleAuditStore
+from bot.event_bus import EventBus, RoleIndexChanged, RolesEdited
+from bot.tracing import traced, tracer
 from config.settings import BOT_CONFIG
 
 logger = logging.getLogger(__name__)
 
 class RoleManager:
-    def __init__(self):
+    def __init__(self, event_bus: EventBus):
+        self.events = event_bus
         self.protected_roles = BOT_CONFIG['protected_roles']
         self.role_categories = BOT_CONFIG['role_categories']
+        # Per-guild version of the role index, bumped on role and membership changes
+        self.guild_versions: Dict[int, int] = {}
+        self.audit = RoleAuditStore()
     
+    def get_guild_version(self, guild_id: int) -> int:
+        """Get the current role index version for a guild"""
+        return self.guild_versions.get(guild_id, 0)
+    
+    def bump_guild_version(self, guild_id: int):
+        """Mark the role index of a guild as changed"""
+        self.guild_versions[guild_id] = self.guild_versions.get(guild_id, 0) + 1
+        self.events.publish(RoleIndexChanged(guild_id))
+    
+    def roles_edited(self, guild_id: int):
+        """Mark the roles of a guild themselves as changed (created, edited, deleted or re-ranked)"""
+        self.bump_guild_version(guild_id)
+        self.events.publish(RolesEdited(guild_id))
+    
+    @traced()
     async def add_role(self, member: discord.Member, role: discord.Role, moderator: discord.Member) -> Tuple[bool, str]:
         """
         Add a role to a member
@@ -17,7 +39,9 @@ class RoleManager:
         """
         try:
             # Check if role is protected
-            if role.name.lower() in [r.lower() for r in self.protected_roles]:
+            with tracer.span("RoleManager.protected_role_check"):
+                protected = role.name.lower() in [r.lower() for r in self.protected_roles]
+            if protected:
                 return False, f"The role '{role.name}' is protected and cannot be assigned through the bot."
             
             # Check if member already has the role
@@ -34,6 +58,8 @@ class RoleManager:
             
             # Add the role
             await member.add_roles(role, reason=f"Role added by {moderator}")
+            self.bump_guild_version(member.guild.id)
+            self.audit.record(member.guild.id, "add", member, moderator, role)
             
             message = f"Successfully added the role '{role.name}' to {member.mention}."
             logger.info(f"Role {role.name} added to {member} by {moderator}")
@@ -49,6 +75,50 @@ class RoleManager:
             logger.error(f"Unexpected error adding role: {e}")
             return False, "An unexpected error occurred while adding the role."
     
+    @traced()
+    async def add_roles(self, member: discord.Member, roles: List[discord.Role], moderator: discord.Member,
+                        reason: str) -> Tuple[bool, str]:
+        """
+        Add several roles to a member in a single member edit.
+        Roles that are protected, above the bot or already held are skipped.
+        discord.RateLimited is raised so queued callers can back off and retry.
+        Returns: (success: bool, message: str)
+        """
+        try:
+            protected = {r.lower() for r in self.protected_roles}
+            top_position = member.guild.me.top_role.position
+            missing = [
+                role for role in roles
+                if role.name.lower() not in protected and role.position < top_position and role not in member.roles
+            ]
+            if not missing:
+                return False, f"{member.mention} has nothing to add."
+
+            if not member.guild.me.guild_permissions.manage_roles:
+                return False, "I don't have permission to manage roles."
+
+            # Non-atomic: one PATCH of the member's role list instead of one request per role
+            await member.add_roles(*missing, reason=reason, atomic=False)
+            self.bump_guild_version(member.guild.id)
+            for role in missing:
+                self.audit.record(member.guild.id, "add", member, moderator, role)
+
+            names = ", ".join(role.name for role in missing)
+            logger.info(f"Roles {names} added to {member} by {moderator} ({reason})")
+            return True, f"Successfully added {names} to {member.mention}."
+
+        except discord.RateLimited:
+            raise
+        except discord.Forbidden:
+            return False, "I don't have permission to manage these roles."
+        except discord.HTTPException as e:
+            logger.error(f"HTTP error adding roles: {e}")
+            return False, "Failed to add roles due to a Discord API error."
+        except Exception as e:
+            logger.error(f"Unexpected error adding roles: {e}")
+            return False, "An unexpected error occurred while adding the roles."
+
+    @traced()
     async def remove_role(self, member: discord.Member, role: discord.Role, moderator: discord.Member) -> Tuple[bool, str]:
         """
         Remove a role from a member
@@ -56,7 +126,9 @@ class RoleManager:
         """
         try:
             # Check if role is protected
-            if role.name.lower() in [r.lower() for r in self.protected_roles]:
+            with tracer.span("RoleManager.protected_role_check"):
+                protected = role.name.lower() in [r.lower() for r in self.protected_roles]
+            if protected:
                 return False, f"The role '{role.name}' is protected and cannot be removed through the bot."
             
             # Check if member has the role
@@ -73,6 +145,8 @@ class RoleManager:
             
             # Remove the role
             await member.remove_roles(role, reason=f"Role removed by {moderator}")
+            self.bump_guild_version(member.guild.id)
+            self.audit.record(member.guild.id, "remove", member, moderator, role)
             
             message = f"Successfully removed the role '{role.name}' from {member.mention}."
             logger.info(f"Role {role.name} removed from {member} by {moderator}")
@@ -88,6 +162,7 @@ class RoleManager:
             logger.error(f"Unexpected error removing role: {e}")
             return False, "An unexpected error occurred while removing the role."
     
+    @traced()
     async def get_roles_info(self, guild: discord.Guild) -> Dict[str, List[Dict]]:
         """
         Get information about roles in the guild
@@ -0,0 +1,72 @@
+import discord
+import logging
+from bisect import bisect_left
+from typing import Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Discord shows at most 25 autocomplete choices
+MAX_CHOICES = 25
+
+class RoleSearchIndex:
+    """
+    Per-guild role name index for autocomplete.
+
+    Every word of every assignable role name is a key in a sorted list, so
+    "dep" finds both "Department Head" and "Police Department" with one
+    bisect. Roles RoleManager.is_role_manageable rejects are left out at
+    build time. A guild's index is dropped on role events and rebuilt on
+    the next lookup, so a query costs O(log n + matches) however many
+    roles the guild has.
+    """
+
+    def __init__(self, role_manager):
+        self.role_manager = role_manager
+        # guild_id -> (sorted word keys, role ids aligned with the keys)
+        self._indexes: Dict[int, Tuple[List[str], List[int]]] = {}
+        self.builds = 0
+
+    def invalidate(self, guild_id: int):
+        self._indexes.pop(guild_id, None)
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    def _build(self, guild: discord.Guild) -> Tuple[List[str], List[int]]:
+        entries = []
+        me = guild.me
+        for role in guild.roles:
+            if me is None or not self.role_manager.is_role_manageable(role, me):
+                continue
+            name = role.name.lower()
+            words = name.split()
+            entries.append((name, role.id))
+            for index in range(1, len(words)):
+                entries.append((" ".join(words[index:]), role.id))
+        entries.sort()
+        index = ([key for key, _ in entries], [role_id for _, role_id in entries])
+        self._indexes[guild.id] = index
+        self.builds += 1
+        return index
+
+    def search(self, guild: discord.Guild, query: str, exclude: Optional[Set[int]] = None,
+               only: Optional[Set[int]] = None, limit: int = MAX_CHOICES) -> List[discord.Role]:
+        """
+        Assignable roles whose name, or any word in it, starts with query
+        """
+        keys, role_ids = self._indexes.get(guild.id) or self._build(guild)
+        prefix = query.strip().lower()
+
+        found: List[discord.Role] = []
+        seen: Set[int] = set()
+        position = bisect_left(keys, prefix)
+        while position < len(keys) and keys[position].startswith(prefix) and len(found) < limit:
+            role_id = role_ids[position]
+            position += 1
+            if role_id in seen or (exclude and role_id in exclude) or (only is not None and role_id not in only):
+                continue
+            seen.add(role_id)
+            role = guild.get_role(role_id)
+            if role is not None:
+                found.append(role)
+        return found
@@ -0,0 +1,248 @@
+import asyncio
+import discord
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Dict, List, Optional
+from bot.scheduler import Scheduler
+from config.settings import BOT_CONFIG
+from utils.json_store import load_json
+from utils.sqlite_store import SQLiteStore
+
+logger = logging.getLogger(__name__)
+
+RP_EVENT_CONFIG = BOT_CONFIG.get('rp_events', {})
+RP_EVENT_DB = os.path.join("data", "rp_events.db")
+# Sessions were kept in one JSON file before the SQLite store; imported once
+LEGACY_RP_EVENT_FILE = os.path.join("config", "rp_events.json")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rp_events (
+    id INTEGER PRIMARY KEY,
+    guild_id INTEGER NOT NULL,
+    channel_id INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    starts_at REAL NOT NULL,
+    ends_at REAL NOT NULL,
+    reminders TEXT NOT NULL,
+    ping_role_id INTEGER,
+    created_by TEXT NOT NULL,
+    started INTEGER NOT NULL,
+    reminded TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rp_event_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+UPSERT = """
+INSERT OR REPLACE INTO rp_events (
+    id, guild_id, channel_id, title, starts_at, ends_at,
+    reminders, ping_role_id, created_by, started, reminded
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+COLUMNS = ('id', 'guild_id', 'channel_id', 'title', 'starts_at', 'ends_at',
+           'reminders', 'ping_role_id', 'created_by', 'started', 'reminded')
+
+NO_ACTIVE_RP = "No active RP session"
+
+class RPEventManager:
+    """
+    Scheduled RP sessions with reminder pings and automatic status updates.
+
+    Sessions are persisted in SQLite (WAL), one row per session, so a
+    create, cancel, reminder, start or end writes only that session's row
+    (an O(log n) B-tree update) from a worker thread instead of rewriting
+    every session. Every reminder, start and end is a job on the shared
+    Scheduler, rebuilt from the stored sessions on startup.
+    A start or end that came due while the bot was offline still runs (so
+    the status is correct), and reminders missed by more than the grace
+    period are skipped instead of pinging late.
+    """
+
+    def __init__(self, bot, server_manager, scheduler: Scheduler, path: str = RP_EVENT_DB):
+        self.bot = bot
+        self.server_manager = server_manager
+        self.scheduler = scheduler
+        self.path = path
+        self.default_reminders: List[int] = RP_EVENT_CONFIG.get('default_reminders_minutes', [30, 10])
+        self.reminder_grace = RP_EVENT_CONFIG.get('reminder_grace_seconds', 300)
+        self.events: Dict[int, Dict] = {}
+        # event id -> scheduler job ids, kept in memory only
+        self._jobs: Dict[int, List[int]] = {}
+        self._next_id = 1
+        self.db = SQLiteStore(path, SCHEMA)
+
+    async def start(self):
+        """Load stored sessions and schedule their pending jobs"""
+        self._next_id, events = await self.db.run(self._load)
+        for event in events:
+            self.events[event['id']] = event
+            self._schedule(event)
+        self.scheduler.start()
+        if self.events:
+            logger.info(f"Restored {len(self.events)} scheduled RP session(s)")
+
+    async def close(self):
+        await self.db.close()
+
+    def _load(self):
+        conn = self.db.connect()
+        row = conn.execute("SELECT value FROM rp_event_meta WHERE key = 'next_id'").fetchone()
+        if row is None:
+            self._import_legacy(conn)
+            row = conn.execute("SELECT value FROM rp_event_meta WHERE key = 'next_id'").fetchone()
+        events = [self._from_row(values) for values in conn.execute(f"SELECT {', '.join(COLUMNS)} FROM rp_events")]
+        return row[0], events
+
+    def _import_legacy(self, conn: sqlite3.Connection):
+        state = load_json(LEGACY_RP_EVENT_FILE, {})
+        events = state.get('events', [])
+        with conn:
+            conn.executemany(UPSERT, [self._to_row(event) for event in events])
+            conn.execute("INSERT INTO rp_event_meta (key, value) VALUES ('next_id', ?)", (state.get('next_id', 1),))
+        if events:
+            logger.info(f"Imported {len(events)} RP session(s) from {LEGACY_RP_EVENT_FILE}")
+
+    @staticmethod
+    def _to_row(event: Dict) -> tuple:
+        return tuple(
+            json.dumps(event[column]) if column in ('reminders', 'reminded') else event[column]
+            for column in COLUMNS
+        )
+
+    @staticmethod
+    def _from_row(values: tuple) -> Dict:
+        event = dict(zip(COLUMNS, values))
+        event['reminders'] = json.loads(event['reminders'])
+        event['reminded'] = json.loads(event['reminded'])
+        event['started'] = bool(event['started'])
+        return event
+
+    def _write(self, event: Optional[Dict], deleted_id: Optional[int]):
+        conn = self.db.connect()
+        with conn:
+            if event is not None:
+                conn.execute(UPSERT, self._to_row(event))
+                conn.execute("UPDATE rp_event_meta SET value = ? WHERE key = 'next_id'", (self._next_id,))
+            if deleted_id is not None:
+                conn.execute("DELETE FROM rp_events WHERE id = ?", (deleted_id,))
+
+    async def _persist(self, event: Optional[Dict] = None, deleted_id: Optional[int] = None) -> bool:
+        """
+        Write one session (or delete one) without rewriting the others
+        """
+        try:
+            await self.db.run(self._write, event, deleted_id)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving RP session #{event['id'] if event else deleted_id}: {e}")
+            return False
+
+    def upcoming(self, guild_id: int) -> List[Dict]:
+        return sorted(
+            (event for event in self.events.values() if event['guild_id'] == guild_id),
+            key=lambda event: event['starts_at']
+        )
+
+    async def create(self, guild_id: int, channel_id: int, title: str, starts_at: float, ends_at: float,
+                     reminders: List[int], ping_role_id: Optional[int], created_by: str) -> Dict:
+        event = {
+            'id': self._next_id,
+            'guild_id': guild_id,
+            'channel_id': channel_id,
+            'title': title,
+            'starts_at': starts_at,
+            'ends_at': ends_at,
+            'reminders': sorted(set(reminders), reverse=True),
+            'ping_role_id': ping_role_id,
+            'created_by': created_by,
+            'started': False,
+            'reminded': [],
+        }
+        self._next_id += 1
+        self.events[event['id']] = event
+        self._schedule(event)
+        await self._persist(event)
+        logger.info(f"RP session #{event['id']} '{title}' scheduled by {created_by}")
+        return event
+
+    async def cancel(self, event_id: int, guild_id: int) -> Optional[Dict]:
+        event = self.events.get(event_id)
+        if event is None or event['guild_id'] != guild_id:
+            return None
+        for job_id in self._jobs.pop(event_id, []):
+            self.scheduler.cancel(job_id)
+        del self.events[event_id]
+        if event['started']:
+            await self._set_current_rp()
+        await self._persist(deleted_id=event_id)
+        logger.info(f"RP session #{event_id} '{event['title']}' cancelled")
+        return event
+
+    def _schedule(self, event: Dict):
+        now = time.time()
+        jobs = []
+        if not event['started']:
+            for minutes in event['reminders']:
+                due = event['starts_at'] - minutes * 60
+                if minutes not in event['reminded'] and due + self.reminder_grace >= now:
+                    jobs.append(self.scheduler.schedule(due, self._remind, event['id'], minutes))
+            jobs.append(self.scheduler.schedule(event['starts_at'], self._start, event['id']))
+        jobs.append(self.scheduler.schedule(event['ends_at'], self._end, event['id']))
+        self._jobs[event['id']] = jobs
+
+    def _channel(self, event: Dict) -> discord.PartialMessageable:
+        # Partial channels send without a fetch or a populated cache
+        return self.bot.get_partial_messageable(event['channel_id'], guild_id=event['guild_id'])
+
+    def _ping(self, event: Dict) -> str:
+        return f"<@&{event['ping_role_id']}> " if event['ping_role_id'] else ""
+
+    async def _remind(self, event_id: int, minutes: int):
+        event = self.events.get(event_id)
+        if event is None:
+            return
+        event['reminded'].append(minutes)
+        await self._persist(event)
+        await self._channel(event).send(
+            f"{self._ping(event)}⏰ **{event['title']}** starts <t:{int(event['starts_at'])}:R>!",
+            allowed_mentions=discord.AllowedMentions(roles=True)
+        )
+
+    async def _start(self, event_id: int):
+        event = self.events.get(event_id)
+        # Sessions that ended while the bot was offline are only closed out
+        if event is None or time.time() >= event['ends_at']:
+            return
+        event['started'] = True
+        await self._persist(event)
+        await self._set_current_rp()
+        await self._channel(event).send(
+            f"{self._ping(event)}🎬 **{event['title']}** is starting now! Use `/server` to join.",
+            allowed_mentions=discord.AllowedMentions(roles=True)
+        )
+        logger.info(f"RP session #{event_id} '{event['title']}' started")
+
+    async def _end(self, event_id: int):
+        event = self.events.pop(event_id, None)
+        self._jobs.pop(event_id, None)
+        if event is None:
+            return
+        await self._persist(deleted_id=event_id)
+        await self._set_current_rp()
+        logger.info(f"RP session #{event_id} '{event['title']}' ended")
+
+    async def _set_current_rp(self):
+        """Show the latest-started session still running, or none"""
+        # There is one server status, shared by every guild
+        active = [event for event in self.events.values() if event['started']]
+        current_rp = max(active, key=lambda event: event['starts_at'])['title'] if active else NO_ACTIVE_RP
+        status = await self.server_manager.get_server_status()
+        if status.get('current_rp') == current_rp:
+            return
+        await self.server_manager.update_server_status(status.get('player_count', 0), current_rp, "RP Scheduler")
@@ -0,0 +1,112 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Re-check the heap at least this often so wall-clock jumps are picked up
+MAX_SLEEP = 60.0
+
+Job = Tuple[Callable[..., Awaitable[Any]], tuple]
+
+class Scheduler:
+    """
+    One task running every timed job from a min-heap of (due time, job id).
+
+    Scheduling pushes onto the heap and cancelling only drops the job from
+    a dict; cancelled entries are skipped when they surface. Both are
+    O(log n) or better, and thousands of pending jobs still cost a single
+    sleeping task. The loop sleeps until the earliest due time and is
+    woken early when something earlier is scheduled. Due jobs run as their
+    own tasks so a slow callback can't hold up the rest. Due times are
+    wall-clock epoch seconds so they can be persisted by callers.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int]] = []
+        self._jobs: Dict[int, Job] = {}
+        self._ids = itertools.count(1)
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._running: Set[asyncio.Task] = set()
+        self.executed = 0
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    @property
+    def running(self) -> int:
+        """Jobs that came due and haven't finished yet"""
+        return len(self._running)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def hold(self):
+        """Stop dispatching due jobs; running jobs carry on and pending ones stay queued"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def stop(self):
+        self.hold()
+        tasks = list(self._running)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def schedule(self, when: float, callback: Callable[..., Awaitable[Any]], *args) -> int:
+        """
+        Run callback(*args) at epoch time when; returns a job id for cancel()
+        """
+        job_id = next(self._ids)
+        self._jobs[job_id] = (callback, args)
+        heapq.heappush(self._heap, (when, job_id))
+        # Only an earlier head changes how long the loop should sleep
+        if self._heap[0][1] == job_id:
+            self._wake.set()
+        return job_id
+
+    def cancel(self, job_id: int) -> bool:
+        if self._jobs.pop(job_id, None) is None:
+            return False
+        # Compact once cancelled entries dominate, amortised O(1) per cancel
+        if len(self._heap) > 2 * len(self._jobs) + 1024:
+            self._heap = [entry for entry in self._heap if entry[1] in self._jobs]
+            heapq.heapify(self._heap)
+        return True
+
+    def next_due(self) -> Optional[float]:
+        while self._heap and self._heap[0][1] not in self._jobs:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    async def _run(self):
+        while True:
+            self._wake.clear()
+            due = self.next_due()
+            now = time.time()
+            if due is None or due > now:
+                timeout = MAX_SLEEP if due is None else min(due - now, MAX_SLEEP)
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, job_id = heapq.heappop(self._heap)
+            callback, args = self._jobs.pop(job_id)
+            task = asyncio.create_task(self._execute(callback, args))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _execute(self, callback: Callable[..., Awaitable[Any]], args: tuple):
+        try:
+            await callback(*args)
+            self.executed += 1
+        except Exception as e:
+            logger.error(f"Scheduled job {getattr(callback, '__name__', callback)} failed: {e}")
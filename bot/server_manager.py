@@ -1,22 +1,62 @@
 import asyncio
+import aiohttp
 import logging
+import os
 import random
-from typing import Optional
+from discord.ext import tasks
+from typing import Dict, Optional
+from bot.event_bus import EventBus, LinksChanged, StatusChanged
+from bot.join_codes import JoinCodePool
+from bot.player_count import PlayerCountProvider, create_provider
+from bot.status_history import StatusHistory
+from bot.tracing import traced, tracer
 from config.settings import BOT_CONFIG
+from utils.json_store import read_json, save_json
+from utils.resilience import Backoff, CircuitBreaker
 
 logger = logging.getLogger(__name__)
 
+POLLING_CONFIG = BOT_CONFIG.get('player_polling', {})
+STATUS_FILE = os.path.join("config", "server_status.json")
+
 class ServerManager:
-    def __init__(self):
+    def __init__(self, event_bus: EventBus):
+        self.events = event_bus
         self.server_links = BOT_CONFIG['roblox_servers']
         self.current_link_index = 0
+        # Bumped whenever the stored status or the link list changes
+        self.status_version = 0
+        self.links_version = 0
+        self.history = StatusHistory()
+        self.history.load()
+        self.join_codes = JoinCodePool()
+        
+        # Background player-count polling
+        self.provider: Optional[PlayerCountProvider] = None
+        self.http_session: Optional[aiohttp.ClientSession] = None
+        # Last count fetched per link, the fallback while a link backs off or fails
+        self.player_counts: Dict[str, int] = {}
+        backoff_config = POLLING_CONFIG.get('backoff', {})
+        self.poll_backoff = Backoff(backoff_config.get('base_seconds', 5), backoff_config.get('max_seconds', 300))
+        breaker_config = POLLING_CONFIG.get('circuit_breaker', {})
+        self.poll_breaker = CircuitBreaker(
+            breaker_config.get('failure_threshold', 5),
+            breaker_config.get('reset_seconds', 120)
+        )
     
+    @traced()
     async def get_server_link(self) -> str:
         """
         Get a Roblox private server link
+        Pooled join codes are handed out first; configured links are the fallback
         Returns the server link or raises an exception if none available
         """
         try:
+            code = self.join_codes.take()
+            if code is not None:
+                logger.info(f"Provided pooled join code {code[:3]}...")
+                return self.join_codes.launch_url(code)
+            
             if not self.server_links:
                 raise Exception("No server links configured")
             
@@ -55,6 +95,8 @@ class ServerManager:
         try:
             if link not in self.server_links:
                 self.server_links.append(link)
+                self.links_version += 1
+                self.events.publish(LinksChanged())
                 logger.info(f"New server link added by {admin_user}")
                 return True
             else:
@@ -72,6 +114,8 @@ class ServerManager:
         try:
             if link in self.server_links:
                 self.server_links.remove(link)
+                self.links_version += 1
+                self.events.publish(LinksChanged())
                 logger.info(f"Server link removed by {admin_user}")
                 return True
             else:
@@ -82,20 +126,26 @@ class ServerManager:
             logger.error(f"Error removing server link: {e}")
             return False
     
+    def status_cache_version(self) -> tuple:
+        """
+        Cache version of the stored status: the update counter plus the status
+        file's mtime, so hand edits to the file are picked up too
+        """
+        try:
+            mtime = os.stat(STATUS_FILE).st_mtime_ns
+        except OSError:
+            mtime = None
+        return self.status_version, mtime
+    
+    @traced()
     async def get_server_status(self) -> dict:
         """
         Get status from manually configured server status file
         """
         try:
-            import json
-            import os
-            
-            status_file = os.path.join("config", "server_status.json")
-            
             # Read from status file
-            if os.path.exists(status_file):
-                with open(status_file, 'r') as f:
-                    status = json.load(f)
+            if os.path.exists(STATUS_FILE):
+                status = read_json(STATUS_FILE)
             else:
                 # Default status if file doesn't exist
                 status = {
@@ -119,20 +169,18 @@ class ServerManager:
                 'current_rp': "Status unavailable",
                 'last_updated': "Error",
                 'updated_by': "System",
-                'server_name': "Homeland RP | Private Server"
+                'server_name': "Homeland RP | Private Server",
+                'fallback': True
             }
     
+    @traced()
     async def update_server_status(self, player_count: int, current_rp: str, updated_by: str) -> bool:
         """
         Update server status information (Owner/Admin only)
         """
         try:
-            import json
-            import os
             import datetime
             
-            status_file = os.path.join("config", "server_status.json")
-            
             new_status = {
                 'online': True,
                 'player_count': player_count,
@@ -141,12 +189,15 @@ class ServerManager:
                 'updated_by': updated_by
             }
             
-            # Create config directory if it doesn't exist
-            os.makedirs("config", exist_ok=True)
+            # Written atomically, so a failed write (e.g. a full disk) keeps the previous status readable
+            if not save_json(STATUS_FILE, new_status):
+                return False
+            self.status_version += 1
             
-            # Write to status file
-            with open(status_file, 'w') as f:
-                json.dump(new_status, f, indent=2)
+            self.history.record(player_count, current_rp)
+            self.events.publish(StatusChanged())
+            if self.history.save_due():
+                await self.save_history()
             
             logger.info(f"Server status updated by {updated_by}: {player_count} players, RP: {current_rp}")
             return True
@@ -155,6 +206,93 @@ class ServerManager:
             logger.error(f"Error updating server status: {e}")
             return False
     
+    async def save_history(self) -> bool:
+        """
+        Persist the status history rollups without blocking the event loop
+        """
+        try:
+            snapshot = self.history.to_dict()
+            return await asyncio.to_thread(self.history.save, snapshot)
+        except Exception as e:
+            logger.error(f"Error saving status history: {e}")
+            return False
+    
+    async def start_polling(self, provider: Optional[PlayerCountProvider] = None):
+        """
+        Start polling player counts for every configured link in the background
+        """
+        if self.player_count_poller.is_running():
+            return
+        
+        self.provider = provider or create_provider(POLLING_CONFIG)
+        timeout = aiohttp.ClientTimeout(total=POLLING_CONFIG.get('timeout_seconds', 5))
+        self.http_session = aiohttp.ClientSession(timeout=timeout, trace_configs=[tracer.http_trace_config()])
+        self.player_count_poller.change_interval(seconds=POLLING_CONFIG.get('interval_seconds', 60))
+        self.player_count_poller.start()
+        logger.info(f"Player count polling started with the '{self.provider.name}' provider")
+    
+    async def stop_polling(self):
+        """
+        Stop the poller and close its HTTP session
+        """
+        self.player_count_poller.cancel()
+        if self.http_session is not None:
+            await self.http_session.close()
+            self.http_session = None
+    
+    @tasks.loop(seconds=60)
+    async def player_count_poller(self):
+        try:
+            with tracer.trace("player count poll", kind="task"):
+                await self.poll_player_counts()
+        except Exception as e:
+            logger.error(f"Error polling player counts: {e}")
+    
+    async def poll_player_counts(self) -> Optional[int]:
+        """
+        Fetch counts for all links concurrently and store the total
+        Returns the total, or None if no link produced a count
+        """
+        links = list(self.server_links)
+        results = await asyncio.gather(*(self._fetch_player_count(link) for link in links))
+        counts = [count for count in results if count is not None]
+        if not counts:
+            logger.warning("No player counts available from any server link")
+            return None
+        
+        total = sum(counts)
+        status = await self.get_server_status()
+        current_rp = status.get('current_rp', "No active RP session")
+        if status.get('player_count') != total:
+            await self.update_server_status(total, current_rp, "Player count poller")
+        else:
+            # Unchanged counts are still samples for the history
+            self.history.record(total, current_rp)
+        return total
+    
+    @traced()
+    async def _fetch_player_count(self, link: str) -> Optional[int]:
+        """
+        Fetch one link's count through the backoff and circuit breaker
+        Falls back to the last known count when the fetch is skipped or fails
+        """
+        stale = self.player_counts.get(link)
+        if not self.poll_backoff.ready(link) or not self.poll_breaker.allow():
+            return stale
+        
+        try:
+            count = await self.provider.fetch_player_count(self.http_session, link)
+        except Exception as e:
+            self.poll_breaker.record_failure()
+            delay = self.poll_backoff.failure(link)
+            logger.warning(f"Player count fetch failed for {link[:50]}... ({e}), retrying in {delay:.0f}s")
+            return stale
+        
+        self.poll_breaker.record_success()
+        self.poll_backoff.success(link)
+        self.player_counts[link] = count
+        return count
+    
     def validate_roblox_link(self, link: str) -> bool:
         """
         Validate if a link is a proper Roblox private server link
@@ -0,0 +1,163 @@
+import asyncio
+import logging
+import signal
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional
+from config.settings import BOT_CONFIG
+
+logger = logging.getLogger(__name__)
+
+SHUTDOWN_CONFIG = BOT_CONFIG.get('shutdown', {})
+
+DRAINING_MESSAGE = "🔄 The bot is restarting. Please try again in a few seconds."
+
+# How often drain conditions are re-checked
+POLL_INTERVAL = 0.1
+
+class ShutdownCoordinator:
+    """
+    Drains the bot before it disconnects, on SIGTERM/SIGINT or process exit.
+
+    Once draining, new triggers (commands, messages, reactions, buttons,
+    joins) are refused and scheduled jobs stop being dispatched. Work that
+    is already running is then given until the deadline to finish, in
+    order: tracked triggers and running jobs, debounced self-assign
+    changes, the pending status board edit, then the onboarding backlog.
+    The bot is closed afterwards, which flushes every persister to disk,
+    and a report of what completed and what was dropped is logged and kept
+    on the coordinator. Anything dropped is either rebuilt on the next
+    start (scheduled sessions, onboarding reconciliation) or listed in the
+    report.
+    """
+
+    def __init__(self):
+        self.drain_seconds = SHUTDOWN_CONFIG.get('drain_seconds', 20)
+        self.draining = False
+        self.in_flight: Counter = Counter()
+        self.finished: Counter = Counter()
+        self.rejected: Counter = Counter()
+        self.report: Optional[Dict[str, Any]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @contextmanager
+    def track(self, kind: str):
+        """Count a trigger as in flight until the block exits"""
+        self.in_flight[kind] += 1
+        try:
+            yield
+        finally:
+            self.in_flight[kind] -= 1
+            if self.draining:
+                self.finished[kind] += 1
+
+    def accepting(self, kind: str) -> bool:
+        """Whether new work may start; refusals are counted for the report"""
+        if self.draining:
+            self.rejected[kind] += 1
+            return False
+        return True
+
+    def install(self, bot):
+        """Drain on SIGTERM (rolling restarts) and SIGINT (Ctrl+C)"""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, self.request, bot, sig.name)
+            except (NotImplementedError, RuntimeError):
+                # Windows event loops have no signal handlers; Ctrl+C still ends in shutdown()
+                pass
+
+    def request(self, bot, reason: str):
+        if self._task is not None:
+            logger.info(f"{reason} received while already shutting down")
+            return
+        self._task = asyncio.create_task(self._shutdown(bot, reason))
+
+    async def shutdown(self, bot, reason: str) -> Dict[str, Any]:
+        """
+        Drain and close the bot once; later calls wait for the first one
+        """
+        self.request(bot, reason)
+        return await asyncio.shield(self._task)
+
+    async def _wait_until(self, done: Callable[[], bool], deadline: float) -> bool:
+        while not done():
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(POLL_INTERVAL)
+        return True
+
+    async def _within(self, coro, deadline: float) -> bool:
+        try:
+            await asyncio.wait_for(coro, max(0.0, deadline - time.monotonic()))
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def _shutdown(self, bot, reason: str) -> Dict[str, Any]:
+        started = time.monotonic()
+        deadline = started + self.drain_seconds
+        self.draining = True
+        bot.scheduler.hold()
+        logger.info(f"Shutting down ({reason}): draining for up to {self.drain_seconds}s")
+
+        onboarded = bot.onboarding.stats['assigned']
+        self_assign = bot.reaction_roles.backlog
+        jobs = bot.scheduler.running
+
+        await self._wait_until(lambda: not sum(self.in_flight.values()) and not bot.scheduler.running, deadline)
+        dropped_triggers = +self.in_flight
+        dropped_jobs = bot.scheduler.running
+
+        self_assign_applied = not self_assign or await self._within(bot.reaction_roles.close(), deadline)
+        # Changes still settling or in flight at the deadline die with the HTTP session
+        self_assign_left = bot.reaction_roles.backlog
+        board_published = not bot.status_board.updating or await self._within(bot.status_board.flush(), deadline)
+        await self._wait_until(lambda: not bot.onboarding.backlog, deadline)
+        onboarding_left = bot.onboarding.backlog
+        drained = time.monotonic() - started
+
+        audit_rows = len(bot.role_manager.audit.pending)
+        activity_rows = len(bot.activity_tracker.pending)
+        try:
+            await bot.close()
+        except Exception as e:
+            logger.error(f"Error closing the bot: {e}")
+
+        self.report = {
+            'reason': reason,
+            'drain_seconds': round(drained, 2),
+            'completed': {
+                **{f"{kind}s": count for kind, count in self.finished.items()},
+                'scheduled jobs': jobs - dropped_jobs,
+                'self-assign changes': self_assign - self_assign_left,
+                'onboarded members': bot.onboarding.stats['assigned'] - onboarded,
+                'audit rows flushed': audit_rows - len(bot.role_manager.audit.pending),
+                'activity deltas flushed': activity_rows - len(bot.activity_tracker.pending),
+            },
+            'dropped': {
+                **{f"{kind}s in flight": count for kind, count in dropped_triggers.items()},
+                'scheduled jobs': dropped_jobs,
+                'self-assign changes': self_assign_left,
+                'status board edit': 0 if board_published else 1,
+                'onboarding backlog (reconciled on restart)': onboarding_left,
+                'audit rows': len(bot.role_manager.audit.pending),
+                'activity deltas': len(bot.activity_tracker.pending),
+            },
+            'refused': {f"{kind}s": count for kind, count in self.rejected.items()},
+        }
+        if not self_assign_applied:
+            logger.warning("Self-assign changes were still being applied at the drain deadline")
+
+        dropped = {name: count for name, count in self.report['dropped'].items() if count}
+        completed = {name: count for name, count in self.report['completed'].items() if count}
+        logger.info(f"Shutdown drained in {drained:.1f}s; completed {completed or 'nothing pending'}")
+        if dropped:
+            logger.warning(f"Shutdown dropped {dropped}")
+        if self.report['refused']:
+            logger.info(f"Refused while draining: {self.report['refused']}")
+        return self.report
+
+shutdown_coordinator = ShutdownCoordinator()
@@ -0,0 +1,199 @@
+import asyncio
+import discord
+import logging
+import time
+from array import array
+from typing import Dict, Hashable, List, Optional, Set
+from bot.permissions import has_permission, PermissionLevel
+from config.settings import BOT_CONFIG
+
+logger = logging.getLogger(__name__)
+
+SPAM_CONFIG = BOT_CONFIG.get('spam_guard', {})
+
+class WindowCounter:
+    """
+    Sliding-window event counters with a fixed-size timestamp ring per key.
+
+    A key trips when `limit` events fall within `window` seconds: the slot
+    about to be overwritten holds the timestamp of the event `limit` events
+    ago. Memory per key is limit * 8 bytes; idle keys are swept once the map
+    outgrows its threshold.
+    """
+
+    def __init__(self, limit: int, window: float, sweep_threshold: int = 10000):
+        self.limit = limit
+        self.window = window
+        self.sweep_threshold = sweep_threshold
+        # key -> [ring of timestamps, next slot]
+        self._rings: Dict[Hashable, list] = {}
+
+    def hit(self, key: Hashable, now: float) -> bool:
+        """Record an event and return whether the key is over its limit"""
+        entry = self._rings.get(key)
+        if entry is None:
+            ring = array('d', [float('-inf')]) * self.limit
+            ring[0] = now
+            self._rings[key] = [ring, 1 % self.limit]
+            if len(self._rings) > self.sweep_threshold:
+                self._sweep(now)
+            return self.limit <= 1
+
+        ring, index = entry
+        oldest = ring[index]
+        ring[index] = now
+        entry[1] = index + 1 if index + 1 < self.limit else 0
+        return now - oldest < self.window
+
+    def _sweep(self, now: float):
+        limit = self.limit
+        for key in [k for k, (ring, index) in self._rings.items()
+                    if now - ring[index - 1 if index else limit - 1] >= self.window]:
+            del self._rings[key]
+        # Keep sweeps amortised when most keys are still active
+        self.sweep_threshold = max(self.sweep_threshold, len(self._rings) * 2)
+
+    def __len__(self) -> int:
+        return len(self._rings)
+
+class SpamGuard:
+    """
+    Per-message spam and raid detection for on_message.
+
+    Tracks messages per user, per channel and per identical content in
+    sliding windows. A user over the rate or repeating their own content is
+    quarantined with the configured role through RoleManager; a flooded
+    channel is locked out of auto-responses for a while. The same text from
+    many different members (a copy-paste raid, or just a common question)
+    only raises a raid alert, since it says nothing about any one poster.
+    The normal path is four counter updates and a hash.
+    """
+
+    def __init__(self, role_manager):
+        self.role_manager = role_manager
+        self.enabled = SPAM_CONFIG.get('enabled', True)
+        max_keys = SPAM_CONFIG.get('max_keys', 10000)
+        self.users = WindowCounter(
+            SPAM_CONFIG.get('user_messages', 6), SPAM_CONFIG.get('user_window_seconds', 5), max_keys
+        )
+        self.channels = WindowCounter(
+            SPAM_CONFIG.get('channel_messages', 25), SPAM_CONFIG.get('channel_window_seconds', 5), max_keys
+        )
+        self.duplicates = WindowCounter(
+            SPAM_CONFIG.get('duplicate_messages', 4), SPAM_CONFIG.get('duplicate_window_seconds', 15), max_keys
+        )
+        self.raid_texts = WindowCounter(
+            SPAM_CONFIG.get('raid_messages', 10), SPAM_CONFIG.get('raid_window_seconds', 15), max_keys
+        )
+        self.duplicate_min_length = SPAM_CONFIG.get('duplicate_min_length', 20)
+        self.lockout = SPAM_CONFIG.get('lockout_seconds', 60)
+        self.quarantine_role = SPAM_CONFIG.get('quarantine_role')
+
+        # (guild_id, user_id) or channel_id -> monotonic time the lockout ends
+        self.flagged_users: Dict[tuple, float] = {}
+        self.flooded_channels: Dict[int, float] = {}
+        # (guild_id, fingerprint) -> monotonic time the raid alert may repeat
+        self.raid_alerts: Dict[tuple, float] = {}
+        self.trips = {'user_rate': 0, 'channel_rate': 0, 'duplicate': 0, 'raid': 0}
+        self.quarantined = 0
+        self._background: Set[asyncio.Task] = set()
+
+    def check(self, message: discord.Message, now: Optional[float] = None) -> bool:
+        """
+        Count a guild message; returns True when auto-responses should be suppressed for it
+        """
+        guild = message.guild
+        if not self.enabled or guild is None:
+            return False
+
+        if now is None:
+            now = time.monotonic()
+        user_key = (guild.id, message.author.id)
+        channel_id = message.channel.id
+        suppressed = False
+
+        if self.channels.hit(channel_id, now):
+            if self.flooded_channels.get(channel_id, 0.0) <= now:
+                self.trips['channel_rate'] += 1
+                logger.warning(f"Message flood in #{message.channel}, auto-responses paused for {self.lockout}s")
+            self.flooded_channels[channel_id] = now + self.lockout
+            suppressed = True
+        elif self.flooded_channels and self.flooded_channels.get(channel_id, 0.0) > now:
+            suppressed = True
+
+        tripped = None
+        if self.users.hit(user_key, now):
+            tripped = 'user_rate'
+        content = message.content
+        if len(content) >= self.duplicate_min_length:
+            fingerprint = hash(" ".join(content.lower().split()))
+            if self.duplicates.hit((guild.id, message.author.id, fingerprint), now):
+                tripped = tripped or 'duplicate'
+            if self.raid_texts.hit((guild.id, fingerprint), now):
+                self._raid_alert(message, (guild.id, fingerprint), now)
+
+        if tripped is not None:
+            self._flag(message, user_key, tripped, now)
+            return True
+        if self.flagged_users and self.flagged_users.get(user_key, 0.0) > now:
+            return True
+        return suppressed
+
+    def _flag(self, message: discord.Message, user_key: tuple, reason: str, now: float):
+        already_flagged = self.flagged_users.get(user_key, 0.0) > now
+        self.flagged_users[user_key] = now + self.lockout
+        if already_flagged:
+            return
+
+        self.trips[reason] += 1
+        if len(self.flagged_users) > 1024:
+            for key in [k for k, until in self.flagged_users.items() if until <= now]:
+                del self.flagged_users[key]
+
+        logger.warning(f"Spam detected from {message.author} in #{message.channel} ({reason})")
+        if self.quarantine_role and isinstance(message.author, discord.Member):
+            task = asyncio.create_task(self._quarantine(message.author, reason))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+    def _raid_alert(self, message: discord.Message, raid_key: tuple, now: float):
+        # Alert only: the posters may be regulars asking the same question
+        if self.raid_alerts.get(raid_key, 0.0) > now:
+            return
+        self.raid_alerts[raid_key] = now + self.lockout
+        self.trips['raid'] += 1
+        if len(self.raid_alerts) > 1024:
+            for key in [k for k, until in self.raid_alerts.items() if until <= now]:
+                del self.raid_alerts[key]
+        logger.warning(
+            f"Possible raid in {message.guild}: the same message was posted {self.raid_texts.limit} times "
+            f"within {self.raid_texts.window}s, latest by {message.author} in #{message.channel}"
+        )
+
+    async def _quarantine(self, member: discord.Member, reason: str):
+        # Staff are flagged (auto-responses suppressed) but never quarantined
+        if has_permission(member, PermissionLevel.MODERATOR):
+            return
+
+        guild = member.guild
+        role = discord.utils.get(guild.roles, name=self.quarantine_role)
+        if role is None:
+            logger.warning(f"Quarantine role '{self.quarantine_role}' not found in {guild}")
+            return
+        if role in member.roles:
+            return
+
+        success, message = await self.role_manager.add_role(member, role, guild.me)
+        if success:
+            self.quarantined += 1
+            logger.warning(f"Quarantined {member} in {guild} for {reason}")
+        else:
+            logger.error(f"Failed to quarantine {member}: {message}")
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            'tracked_keys': len(self.users) + len(self.channels) + len(self.duplicates) + len(self.raid_texts),
+            'flagged_users': len(self.flagged_users),
+            'quarantined': self.quarantined,
+            **self.trips,
+        }
@@ -0,0 +1,161 @@
+import asyncio
+import discord
+import logging
+import os
+import time
+from typing import Optional
+from bot.embeds import build_server_status_embed
+from bot.event_bus import StatusChanged
+from config.settings import BOT_CONFIG
+from utils.json_store import load_json, save_json
+
+logger = logging.getLogger(__name__)
+
+BOARD_CONFIG = BOT_CONFIG.get('status_board', {})
+BOARD_FILE = os.path.join("config", "status_board.json")
+
+class StatusBoard:
+    """
+    A single status message edited in place whenever the server status changes.
+
+    Updates are debounced: a burst of status changes produces one edit per
+    interval, always showing the latest data. The channel and message IDs
+    are persisted so the same message is reused after a restart.
+    """
+
+    def __init__(self, bot, server_manager, path: str = BOARD_FILE):
+        self.bot = bot
+        self.server_manager = server_manager
+        self.path = path
+        self.interval = BOARD_CONFIG.get('debounce_seconds', 10)
+        self.redirect_serverstatus = BOARD_CONFIG.get('redirect_serverstatus', True)
+        self.guild_id: Optional[int] = None
+        self.channel_id: Optional[int] = BOARD_CONFIG.get('channel_id')
+        self.message_id: Optional[int] = None
+        self.last_edit = 0.0
+        self.edits = 0
+        self._dirty = False
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def active(self) -> bool:
+        return self.channel_id is not None and self.message_id is not None
+
+    @property
+    def pending(self) -> bool:
+        """Whether an edit is waiting for the debounce interval"""
+        return self._dirty
+
+    @property
+    def updating(self) -> bool:
+        """Whether an edit is waiting or being published"""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def jump_url(self) -> Optional[str]:
+        if not self.active or self.guild_id is None:
+            return None
+        return f"https://discord.com/channels/{self.guild_id}/{self.channel_id}/{self.message_id}"
+
+    async def start(self):
+        """
+        Restore the board from disk and make sure its message exists
+        """
+        state = load_json(self.path, {})
+        if state.get('channel_id'):
+            self.channel_id = state['channel_id']
+            self.guild_id = state.get('guild_id')
+            self.message_id = state.get('message_id')
+
+        self.server_manager.events.subscribe(StatusChanged, lambda event: self.request_update(), "status board")
+
+        if self.channel_id is None:
+            logger.info("No status board channel configured")
+            return
+
+        await self._publish()
+
+    async def move_to(self, channel: discord.TextChannel) -> bool:
+        """
+        Post a new board message in a channel and make it the live board
+        """
+        self.channel_id = channel.id
+        self.guild_id = channel.guild.id
+        self.message_id = None
+        return await self._publish()
+
+    def request_update(self):
+        """
+        Schedule a debounced edit of the board message
+        """
+        if self.channel_id is None:
+            return
+        self._dirty = True
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def flush(self):
+        """
+        Publish a pending edit now instead of after the debounce interval
+        """
+        if not self.updating:
+            return
+        task = self._task
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        self._task = None
+        self._dirty = False
+        await self._publish()
+
+    async def _run(self):
+        while self._dirty:
+            wait = self.last_edit + self.interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            # Updates arriving during the edit schedule one more pass
+            self._dirty = False
+            await self._publish()
+
+    async def _publish(self) -> bool:
+        try:
+            status_info = await self.server_manager.get_server_status()
+            embed = build_server_status_embed(status_info)
+            embed.title = "📌 Homeland RP Live Server Status"
+
+            if self.message_id is not None:
+                try:
+                    message = self._partial_message()
+                    await message.edit(embed=embed)
+                    self._mark_edited()
+                    return True
+                except discord.NotFound:
+                    logger.warning("Status board message was deleted, posting a new one")
+
+            channel = self.bot.get_channel(self.channel_id) or await self.bot.fetch_channel(self.channel_id)
+            message = await channel.send(embed=embed)
+            self.guild_id = channel.guild.id
+            self.message_id = message.id
+            self._mark_edited()
+            await asyncio.to_thread(self.save)
+            logger.info(f"Status board posted in #{channel} ({message.id})")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error updating status board: {e}")
+            return False
+
+    def _partial_message(self) -> discord.PartialMessage:
+        channel = self.bot.get_partial_messageable(self.channel_id, guild_id=self.guild_id)
+        return channel.get_partial_message(self.message_id)
+
+    def _mark_edited(self):
+        self.last_edit = time.monotonic()
+        self.edits += 1
+
+    def save(self) -> bool:
+        """Persist the board location"""
+        return save_json(self.path, {
+            'guild_id': self.guild_id,
+            'channel_id': self.channel_id,
+            'message_id': self.message_id
+        })
@@ -0,0 +1,343 @@
+import logging
+import os
+import time
+from array import array
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+from config.settings import BOT_CONFIG
+from utils.json_store import load_json, save_json
+
+logger = logging.getLogger(__name__)
+
+HISTORY_CONFIG = BOT_CONFIG.get('status_history', {})
+HISTORY_FILE = os.path.join("config", "status_history.json")
+
+# name, bucket width in seconds, buckets kept
+RESOLUTIONS: Tuple[Tuple[str, int, int], ...] = (
+    ("minute", 60, 1440),
+    ("hour", 3600, 720),
+    ("day", 86400, 730),
+)
+
+class SampleRing:
+    """
+    Fixed-capacity ring buffer of raw (timestamp, player count) samples
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.times = array('d', bytes(8 * capacity))
+        self.counts = array('i', bytes(4 * capacity))
+        self.start = 0
+        self.size = 0
+
+    def append(self, timestamp: float, count: int):
+        index = (self.start + self.size) % self.capacity
+        self.times[index] = timestamp
+        self.counts[index] = count
+        if self.size == self.capacity:
+            self.start = (self.start + 1) % self.capacity
+        else:
+            self.size += 1
+
+    def latest(self, n: int) -> List[Tuple[float, int]]:
+        """Get up to n most recent samples, oldest first"""
+        n = min(n, self.size)
+        result = []
+        for offset in range(self.size - n, self.size):
+            index = (self.start + offset) % self.capacity
+            result.append((self.times[index], self.counts[index]))
+        return result
+
+    def __len__(self) -> int:
+        return self.size
+
+class Rollup:
+    """
+    Contiguous fixed-width buckets of player-count aggregates.
+
+    Closed buckets are kept with prefix sums (for averages and least-squares
+    trends) and an append-only sparse table (for range peaks), so any window
+    query costs O(1). Empty buckets fill gaps to keep index arithmetic trivial.
+    """
+
+    def __init__(self, name: str, width: int, retention: int):
+        self.name = name
+        self.width = width
+        self.retention = retention
+        self._reset(None)
+
+    def _reset(self, offset: Optional[int]):
+        # Absolute bucket number of closed index 0
+        self.offset = offset
+        self.counts: List[int] = []
+        self.sums: List[float] = []
+        self.maxes: List[int] = []
+        # Prefix sums over closed buckets: samples, value sum, and per non-empty bucket n, x, y, xx, xy
+        self.p_count = [0]
+        self.p_sum = [0.0]
+        self.p_n = [0]
+        self.p_x = [0.0]
+        self.p_y = [0.0]
+        self.p_xx = [0.0]
+        self.p_xy = [0.0]
+        # levels[k][i] = max of closed buckets i .. i + 2**k - 1
+        self.levels: List[List[int]] = [[]]
+        self.open_number: Optional[int] = None
+        self.open_count = 0
+        self.open_sum = 0.0
+        self.open_max = -1
+
+    def add(self, timestamp: float, value: int):
+        number = int(timestamp // self.width)
+        if self.open_number is None:
+            self.open_number = number
+        elif number > self.open_number:
+            self._advance(number)
+
+        # Late samples are folded into the open bucket
+        self.open_count += 1
+        self.open_sum += value
+        if value > self.open_max:
+            self.open_max = value
+
+    def _advance(self, number: int):
+        gap = number - self.open_number - 1
+        if gap >= self.retention:
+            # Everything kept would be older than the retention window
+            self._reset(number - self.retention)
+            for _ in range(self.retention):
+                self._close(0, 0.0, -1)
+        else:
+            self._close(self.open_count, self.open_sum, self.open_max)
+            for _ in range(gap):
+                self._close(0, 0.0, -1)
+
+        self.open_number = number
+        self.open_count = 0
+        self.open_sum = 0.0
+        self.open_max = -1
+
+        if len(self.counts) > self.retention * 2:
+            self._trim()
+
+    def _close(self, count: int, total: float, peak: int):
+        if self.offset is None:
+            self.offset = self.open_number
+        index = len(self.counts)
+        self.counts.append(count)
+        self.sums.append(total)
+        self.maxes.append(peak)
+
+        self.p_count.append(self.p_count[-1] + count)
+        self.p_sum.append(self.p_sum[-1] + total)
+        if count:
+            y = total / count
+            self.p_n.append(self.p_n[-1] + 1)
+            self.p_x.append(self.p_x[-1] + index)
+            self.p_y.append(self.p_y[-1] + y)
+            self.p_xx.append(self.p_xx[-1] + index * index)
+            self.p_xy.append(self.p_xy[-1] + index * y)
+        else:
+            self.p_n.append(self.p_n[-1])
+            self.p_x.append(self.p_x[-1])
+            self.p_y.append(self.p_y[-1])
+            self.p_xx.append(self.p_xx[-1])
+            self.p_xy.append(self.p_xy[-1])
+
+        # Append the new ranges ending at this bucket to every sparse-table level
+        levels = self.levels
+        levels[0].append(peak)
+        size = len(levels[0])
+        k = 1
+        while (1 << k) <= size:
+            if len(levels) == k:
+                levels.append([])
+            i = size - (1 << k)
+            half = 1 << (k - 1)
+            levels[k].append(max(levels[k - 1][i], levels[k - 1][i + half]))
+            k += 1
+
+    def _trim(self):
+        drop = len(self.counts) - self.retention
+        counts, sums, maxes = self.counts[drop:], self.sums[drop:], self.maxes[drop:]
+        open_state = (self.open_number, self.open_count, self.open_sum, self.open_max)
+        self._rebuild(self.offset + drop, counts, sums, maxes, open_state)
+
+    def _rebuild(self, offset: int, counts: List[int], sums: List[float], maxes: List[int],
+                 open_state: Tuple[Optional[int], int, float, int]):
+        self._reset(offset)
+        for count, total, peak in zip(counts, sums, maxes):
+            self._close(count, total, peak)
+        self.open_number, self.open_count, self.open_sum, self.open_max = open_state
+
+    def _range_max(self, i: int, j: int) -> int:
+        if i >= j:
+            return -1
+        k = (j - i).bit_length() - 1
+        level = self.levels[k]
+        return max(level[i], level[j - (1 << k)])
+
+    def query(self, start: float, end: float) -> Dict[str, float]:
+        """
+        Aggregate all samples between two timestamps at this resolution
+        """
+        first = int(start // self.width)
+        last = int(end // self.width)
+
+        count, total, peak = 0, 0.0, -1
+        n, sx, sy, sxx, sxy = 0, 0.0, 0.0, 0.0, 0.0
+
+        if self.offset is not None and self.counts:
+            i = max(0, first - self.offset)
+            j = min(len(self.counts), last - self.offset + 1)
+            if i < j:
+                count = self.p_count[j] - self.p_count[i]
+                total = self.p_sum[j] - self.p_sum[i]
+                peak = self._range_max(i, j)
+                n = self.p_n[j] - self.p_n[i]
+                sx = self.p_x[j] - self.p_x[i]
+                sy = self.p_y[j] - self.p_y[i]
+                sxx = self.p_xx[j] - self.p_xx[i]
+                sxy = self.p_xy[j] - self.p_xy[i]
+
+        if self.open_number is not None and self.open_count and first <= self.open_number <= last:
+            count += self.open_count
+            total += self.open_sum
+            peak = max(peak, self.open_max)
+            x = self.open_number - (self.offset if self.offset is not None else self.open_number)
+            y = self.open_sum / self.open_count
+            n += 1
+            sx += x
+            sy += y
+            sxx += x * x
+            sxy += x * y
+
+        # Least-squares slope of bucket averages, converted to players per hour
+        trend = 0.0
+        denominator = n * sxx - sx * sx
+        if n >= 2 and denominator:
+            trend = (n * sxy - sx * sy) / denominator * (3600 / self.width)
+
+        return {
+            'samples': count,
+            'average': total / count if count else 0.0,
+            'peak': peak if peak >= 0 else 0,
+            'trend_per_hour': trend,
+            'resolution': self.name
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            'offset': self.offset,
+            'counts': list(self.counts),
+            'sums': list(self.sums),
+            'maxes': list(self.maxes),
+            'open': [self.open_number, self.open_count, self.open_sum, self.open_max]
+        }
+
+    def load(self, data: dict):
+        offset = data.get('offset')
+        open_state = tuple(data.get('open', [None, 0, 0.0, -1]))
+        if offset is None:
+            self._reset(None)
+            self.open_number, self.open_count, self.open_sum, self.open_max = open_state
+            return
+        counts = data.get('counts', [])[-self.retention:]
+        sums = data.get('sums', [])[-self.retention:]
+        maxes = data.get('maxes', [])[-self.retention:]
+        offset += len(data.get('counts', [])) - len(counts)
+        self._rebuild(offset, counts, sums, maxes, open_state)
+
+class StatusHistory:
+    """
+    Player-count and RP-session history: a raw sample ring plus minute, hour
+    and day rollups. Memory is bounded by the ring capacity and the rollup
+    retention; the rollups and session log are persisted to disk.
+    """
+
+    def __init__(self, path: str = HISTORY_FILE, ring_capacity: Optional[int] = None):
+        self.path = path
+        self.ring = SampleRing(ring_capacity or HISTORY_CONFIG.get('ring_capacity', 4096))
+        self.rollups = [Rollup(name, width, retention) for name, width, retention in RESOLUTIONS]
+        # (start timestamp, RP session) recorded whenever the session changes
+        self.sessions: Deque[Tuple[float, str]] = deque(maxlen=HISTORY_CONFIG.get('session_log_size', 200))
+        self.save_interval = HISTORY_CONFIG.get('save_interval_seconds', 300)
+        self.dirty = False
+        self.last_saved = time.monotonic()
+
+    def record(self, player_count: int, current_rp: str, timestamp: Optional[float] = None):
+        """
+        Append a sample to the ring and every rollup
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        self.ring.append(timestamp, player_count)
+        for rollup in self.rollups:
+            rollup.add(timestamp, player_count)
+
+        if not self.sessions or self.sessions[-1][1] != current_rp:
+            self.sessions.append((timestamp, current_rp))
+        self.dirty = True
+
+    def query(self, window_seconds: float, now: Optional[float] = None) -> Dict:
+        """
+        Get peak, average and trend over the last window_seconds, using the
+        finest rollup whose retention covers the window
+        """
+        now = time.time() if now is None else now
+        start = now - window_seconds
+
+        rollup = self.rollups[-1]
+        for candidate in self.rollups:
+            if candidate.width * candidate.retention >= window_seconds:
+                rollup = candidate
+                break
+
+        result = rollup.query(start, now)
+        result['recent'] = [count for timestamp, count in self.ring.latest(10) if timestamp >= start]
+        result['sessions'] = self.sessions_between(start, now)
+        return result
+
+    def sessions_between(self, start: float, end: float) -> List[Tuple[float, str]]:
+        """Get RP sessions active at any point between two timestamps"""
+        result = []
+        for index, (began, name) in enumerate(self.sessions):
+            ended = self.sessions[index + 1][0] if index + 1 < len(self.sessions) else end
+            if began <= end and ended >= start:
+                result.append((began, name))
+        return result
+
+    def save_due(self) -> bool:
+        return self.dirty and time.monotonic() - self.last_saved >= self.save_interval
+
+    def to_dict(self) -> dict:
+        return {
+            'rollups': {rollup.name: rollup.to_dict() for rollup in self.rollups},
+            'sessions': list(self.sessions)
+        }
+
+    def save(self, snapshot: Optional[dict] = None) -> bool:
+        """
+        Write rollups and the session log to disk.
+        Take the snapshot on the event loop when saving from a worker thread.
+        """
+        success = save_json(self.path, snapshot if snapshot is not None else self.to_dict(), indent=None)
+        if success:
+            self.dirty = False
+            self.last_saved = time.monotonic()
+        return success
+
+    def load(self):
+        """Restore rollups and the session log from disk"""
+        data = load_json(self.path, {})
+        try:
+            for rollup in self.rollups:
+                if rollup.name in data.get('rollups', {}):
+                    rollup.load(data['rollups'][rollup.name])
+            for began, name in data.get('sessions', []):
+                self.sessions.append((began, name))
+        except Exception as e:
+            logger.error(f"Error loading status history: {e}")
+            for rollup in self.rollups:
+                rollup._reset(None)
+            self.sessions.clear()
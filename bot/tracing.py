@@ -0,0 +1,230 @@
+import aiohttp
+import asyncio
+import functools
+import json
+import logging
+import os
+import random
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Set
+from config.settings import BOT_CONFIG
+
+logger = logging.getLogger(__name__)
+
+TRACING_CONFIG = BOT_CONFIG.get('tracing', {})
+TRACE_FILE = os.path.join("logs", "traces.jsonl")
+
+_current_span: ContextVar[Optional['Span']] = ContextVar('current_span', default=None)
+
+class Span:
+    """
+    A timed operation within a trace. Use as a context manager.
+    """
+
+    __slots__ = ('tracer', 'trace_id', 'span_id', 'parent_id', 'name', 'attributes', 'started_at',
+                 'duration', 'error', '_started', '_token', '_trace')
+
+    def __init__(self, tracer: 'Tracer', name: str, parent: Optional['Span'], attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.trace_id = parent.trace_id if parent is not None else f"{random.getrandbits(64):016x}"
+        self.parent_id = parent.span_id if parent is not None else None
+        self.attributes = attributes
+        self.started_at = 0.0
+        self.duration = 0.0
+        self.error: Optional[str] = None
+        self._started = 0.0
+        self._token = None
+        # Finished spans of the whole trace, shared with the root
+        self._trace: List['Span'] = parent._trace if parent is not None else []
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def __enter__(self) -> 'Span':
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration = time.perf_counter() - self._started
+        if exc_type is not None and self.error is None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        self._trace.append(self)
+        if self.parent_id is None:
+            self.tracer._export(self._trace)
+        return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'start': self.started_at,
+            'duration_ms': round(self.duration * 1000, 3),
+            'error': self.error,
+            'attributes': self.attributes,
+        }
+
+class _NoopSpan:
+    """Stands in for spans of unsampled traces"""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def __enter__(self) -> '_NoopSpan':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+NOOP_SPAN = _NoopSpan()
+
+class Tracer:
+    """
+    Lightweight span tracing exported to a JSON-lines file.
+
+    tracer.trace() starts a root span (one per interaction or message
+    trigger) and makes the sampling decision; tracer.span() and @traced
+    add child spans only while a sampled trace is active, so untraced
+    code paths cost one context variable lookup. Finished traces are
+    buffered and appended to the file in batches from a worker thread.
+    """
+
+    def __init__(self, path: str = TRACE_FILE):
+        self.path = path
+        self.enabled = TRACING_CONFIG.get('enabled', False)
+        self.sample_rate = TRACING_CONFIG.get('sample_rate', 0.1)
+        self.batch_size = TRACING_CONFIG.get('batch_size', 200)
+        self.flush_interval = TRACING_CONFIG.get('flush_interval_seconds', 5)
+        self.max_file_bytes = TRACING_CONFIG.get('max_file_bytes', 10485760)
+        self.pending: List[str] = []
+        self.traces = 0
+        self.dropped = 0
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._background: Set[asyncio.Task] = set()
+
+    def trace(self, name: str, **attributes) -> Any:
+        """Start a root span, sampled at sample_rate"""
+        if not self.enabled or random.random() >= self.sample_rate:
+            return NOOP_SPAN
+        return Span(self, name, None, attributes)
+
+    def span(self, name: str, **attributes) -> Any:
+        """Start a child span of the current span, if a sampled trace is active"""
+        parent = _current_span.get()
+        if parent is None:
+            return NOOP_SPAN
+        return Span(self, name, parent, attributes)
+
+    def current(self) -> Any:
+        return _current_span.get() or NOOP_SPAN
+
+    def _export(self, spans: List[Span]):
+        self.traces += 1
+        # Keep the buffer bounded if the disk can't keep up
+        if len(self.pending) >= self.batch_size * 10:
+            self.dropped += 1
+            return
+        self.pending.extend(json.dumps(span.to_dict(), default=str) for span in spans)
+        if len(self.pending) >= self.batch_size and not self._flush_lock.locked():
+            try:
+                task = asyncio.get_running_loop().create_task(self.flush())
+            except RuntimeError:
+                return
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+    async def start(self):
+        """Start the periodic flusher"""
+        if self.enabled and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._flush_loop())
+            logger.info(f"Tracing enabled (sample rate {self.sample_rate:.0%}) -> {self.path}")
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        """Append buffered spans to the trace file off the event loop"""
+        async with self._flush_lock:
+            if not self.pending:
+                return 0
+            batch, self.pending = self.pending, []
+            try:
+                await asyncio.to_thread(self._write, batch)
+            except Exception as e:
+                logger.error(f"Error writing traces: {e}")
+                return 0
+            return len(batch)
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def _write(self, lines: List[str]):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self.path) and os.path.getsize(self.path) >= self.max_file_bytes:
+            os.replace(self.path, f"{self.path}.1")
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+
+    def http_trace_config(self) -> aiohttp.TraceConfig:
+        """aiohttp hooks recording a child span per outbound request"""
+        config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, context, params):
+            context.span = self.span(f"HTTP {params.method}", host=params.url.host, path=params.url.path)
+            context.span.__enter__()
+
+        async def on_request_end(session, context, params):
+            context.span.set_attribute('status', params.response.status)
+            context.span.__exit__(None, None, None)
+
+        async def on_request_exception(session, context, params):
+            context.span.__exit__(type(params.exception), params.exception, None)
+
+        config.on_request_start.append(on_request_start)
+        config.on_request_end.append(on_request_end)
+        config.on_request_exception.append(on_request_exception)
+        return config
+
+def traced(name: Optional[str] = None):
+    """
+    Decorator wrapping a function or coroutine function in a child span
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _current_span.get() is None:
+                    return await func(*args, **kwargs)
+                with tracer.span(span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return func(*args, **kwargs)
+            with tracer.span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+tracer = Tracer()
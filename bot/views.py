@@ -0,0 +1,84 @@
+import discord
+import logging
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class LinkView(discord.ui.View):
+    """
+    View that only carries link buttons.
+
+    Link buttons open a URL on the client and never dispatch an interaction
+    back to the bot, so the view has no timeout and reports itself as finished.
+    discord.py only stores views that are unfinished (and, on newer versions,
+    dispatchable), so sending a LinkView never registers it in the view store
+    or starts a timeout task. That makes one instance safe to reuse across sends.
+    """
+
+    def __init__(self):
+        super().__init__(timeout=None)
+
+    def add_link(self, url: str, label: str, emoji: Optional[str] = None) -> 'LinkView':
+        """Add a link button to the view"""
+        self.add_item(discord.ui.Button(
+            label=label,
+            style=discord.ButtonStyle.link,
+            url=url,
+            emoji=emoji
+        ))
+        return self
+
+    def is_finished(self) -> bool:
+        return True
+
+    def is_dispatchable(self) -> bool:
+        return False
+
+class LinkViewCache:
+    """
+    Cache of reusable link views keyed by URL, label and emoji
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._views: "OrderedDict[Tuple[str, str, Optional[str]], LinkView]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_view(self, url: str, label: str, emoji: Optional[str] = None) -> LinkView:
+        """
+        Get the cached link view for a URL, building it on first use
+        """
+        key = (url, label, emoji)
+        view = self._views.get(key)
+        if view is not None:
+            self._views.move_to_end(key)
+            self.hits += 1
+            return view
+
+        self.misses += 1
+        view = LinkView().add_link(url, label, emoji)
+        self._views[key] = view
+
+        # Evict the least recently used view when the cache is full
+        if len(self._views) > self.max_size:
+            self._views.popitem(last=False)
+
+        return view
+
+    def clear(self):
+        """Drop all cached views"""
+        self._views.clear()
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+# Create global link view cache instance
+link_view_cache = LinkViewCache()
+
+def get_link_view(url: str, label: str, emoji: Optional[str] = None) -> LinkView:
+    """
+    Global function to get a reusable link view
+    """
+    return link_view_cache.get_view(url, label, emoji)
@@ -3,6 +3,24 @@ import logging
 import os
 from keep_alive import keep_alive
 from bot.commands import setup_commands
+from bot.views import get_link_view
+from bot.event_bus import ConfigReloaded, EventBus, LinksChanged, RoleIndexChanged, RolesEdited, StatusChanged
+from bot.render_cache import render_cache
+from bot.server_manager import ServerManager
+from bot.role_manager import RoleManager
+from bot.role_search import RoleSearchIndex
+from bot.rp_events import RPEventManager
+from bot.scheduler import Scheduler
+from bot.activity import ActivityTracker
+from bot.status_board import StatusBoard
+from bot.spam_guard import SpamGuard
+from bot.onboarding import OnboardingQueue
+from bot.reaction_roles import ReactionRoles, RoleButton
+from bot.shutdown import shutdown_coordinator
+from bot.diagnostics import loop_lag_monitor
+from bot.fault_injection import faults
+from bot.memory_profiler import memory_profiler
+from bot.tracing import tracer
 from config.settings import BOT_CONFIG
 from utils.logger import setup_logger
 from discord.ext import commands
@@ -22,18 +40,60 @@ class HomelandBot(commands.Bot):
             command_prefix='!',
             intents=intents,
             help_command=None,
-            case_insensitive=True
+            case_insensitive=True,
+            http_trace=tracer.http_trace_config(),
+            # Longer 429 waits raise discord.RateLimited so queued work (onboarding) can back off instead
+            max_ratelimit_timeout=BOT_CONFIG.get('bot_settings', {}).get('max_ratelimit_timeout', 30)
         )
 
         self.last_auto_response = {}
+        self.event_bus = EventBus()
+        self.server_manager = ServerManager(self.event_bus)
+        self.role_manager = RoleManager(self.event_bus)
+        self.role_search = RoleSearchIndex(self.role_manager)
+        self.spam_guard = SpamGuard(self.role_manager)
+        self.onboarding = OnboardingQueue(self.role_manager)
+        self.reaction_roles = ReactionRoles(self.role_manager)
+        self.status_board = StatusBoard(self, self.server_manager)
+        self.scheduler = Scheduler()
+        self.rp_events = RPEventManager(self, self.server_manager, self.scheduler)
+        self.activity_tracker = ActivityTracker(self, self.role_manager, self.scheduler)
+        self.subscribe_consumers()
+
+    def subscribe_consumers(self):
+        """Fan change notifications out to the caches built from the changed data"""
+        bus = self.event_bus
+        bus.subscribe(RolesEdited, lambda event: self.role_search.invalidate(event.guild_id), "role search")
+        # Cached embeds are versioned, so these only free stale entries early
+        bus.subscribe(RoleIndexChanged, lambda event: render_cache.invalidate("roleinfo", event.guild_id), "roleinfo embeds")
+        bus.subscribe(StatusChanged, lambda event: render_cache.invalidate("serverstatus"), "status embeds")
+        bus.subscribe(LinksChanged, lambda event: render_cache.invalidate("server"), "server embeds")
+        # Reloaded cogs may render differently
+        bus.subscribe(ConfigReloaded, lambda event: render_cache.invalidate(), "embed cache")
 
     async def setup_hook(self):
+        if faults.enabled:
+            faults.install(self.http)
+        loop_lag_monitor.start()
+        await tracer.start()
         await setup_commands(self)
         try:
             synced = await self.tree.sync()
             logger.info(f"Synced {len(synced)} command(s)")
         except Exception as e:
             logger.error(f"Failed to sync commands: {e}")
+        await self.role_manager.audit.start()
+        await self.onboarding.start()
+        await self.reaction_roles.start()
+        # Role buttons carry their role in the custom_id and survive restarts
+        self.add_dynamic_items(RoleButton)
+        await self.status_board.start()
+        # The first run seeds the pool with the codes in the configured links
+        await self.server_manager.join_codes.start(self.server_manager.server_links)
+        await self.rp_events.start()
+        await self.activity_tracker.start()
+        if BOT_CONFIG.get('player_polling', {}).get('enabled', False):
+            await self.server_manager.start_polling()
 
     async def on_ready(self):
         logger.info(f'{self.user} has logged in successfully!')
@@ -44,11 +104,24 @@ class HomelandBot(commands.Bot):
         )
         await self.change_presence(activity=activity)
 
+        # Joins missed while the bot was offline
+        self.onboarding.schedule_reconcile(self.guilds)
+
     async def on_message(self, message):
         if message.author.bot:
             return
+        if not shutdown_coordinator.accepting("message"):
+            return
+        with shutdown_coordinator.track("message"):
+            await self.handle_message(message)
+
+    async def handle_message(self, message):
+        # Floods and spammers don't get auto-responses or activity credit
+        suppressed = self.spam_guard.check(message)
+        if not suppressed:
+            self.activity_tracker.record(message)
 
-        if "code" in message.content.lower():
+        if not suppressed and "code" in message.content.lower():
             import time
             current_time = time.time()
             channel_id = message.channel.id
@@ -57,37 +130,86 @@ class HomelandBot(commands.Bot):
                 if current_time - self.last_auto_response[channel_id] < 30:
                     return
 
-            try:
-                from bot.server_manager import ServerManager
-                server_manager = ServerManager()
-                server_link = await server_manager.get_server_link()
+            with tracer.trace("on_message code trigger", kind="message", channel_id=channel_id):
+                try:
+                    server_link = await self.server_manager.get_server_link()
 
-                embed = discord.Embed(
-                    title="🎮 Homeland RP Server",
-                    description="Click the button below to join our private server!",
-                    color=discord.Color.blue()
-                )
+                    embed = discord.Embed(
+                        title="🎮 Homeland RP Server",
+                        description="Click the button below to join our private server!",
+                        color=discord.Color.blue()
+                    )
 
-                view = discord.ui.View(timeout=300)
-                button = discord.ui.Button(
-                    label="Join Server",
-                    style=discord.ButtonStyle.link,
-                    url=server_link,
-                    emoji="🎮"
-                )
-                view.add_item(button)
+                    view = get_link_view(server_link, "Join Server", "🎮")
 
-                await message.channel.send(embed=embed, view=view)
-                self.last_auto_response[channel_id] = current_time
+                    await message.channel.send(embed=embed, view=view)
+                    self.last_auto_response[channel_id] = current_time
 
-                logger.info(f"Auto-sent server button to {message.author} in response to 'code' keyword")
+                    logger.info(f"Auto-sent server button to {message.author} in response to 'code' keyword")
 
-            except Exception as e:
-                logger.error(f"Error auto-sending server link: {e}")
-                await message.channel.send("Server not available right now.")
+                except Exception as e:
+                    logger.error(f"Error auto-sending server link: {e}")
+                    await message.channel.send("Server not available right now.")
 
         await self.process_commands(message)
 
+    async def on_guild_role_create(self, role):
+        self.role_manager.roles_edited(role.guild.id)
+
+    async def on_guild_role_update(self, before, after):
+        self.role_manager.roles_edited(after.guild.id)
+
+    async def on_guild_role_delete(self, role):
+        self.role_manager.roles_edited(role.guild.id)
+
+    async def on_member_update(self, before, after):
+        if before.roles != after.roles:
+            # The bot's own top role decides which roles it can manage
+            if after.id == self.user.id:
+                self.role_manager.roles_edited(after.guild.id)
+            else:
+                self.role_manager.bump_guild_version(after.guild.id)
+        if before.pending and not after.pending and shutdown_coordinator.accepting("join"):
+            self.onboarding.enqueue(after)
+
+    async def on_member_join(self, member):
+        self.role_manager.bump_guild_version(member.guild.id)
+        # Joins refused while draining are picked up by reconciliation on the next start
+        if shutdown_coordinator.accepting("join"):
+            self.onboarding.enqueue(member)
+
+    async def on_member_remove(self, member):
+        self.role_manager.bump_guild_version(member.guild.id)
+
+    async def on_raw_reaction_add(self, payload):
+        if shutdown_coordinator.accepting("reaction"):
+            self.reaction_roles.handle_reaction(payload, self.get_guild(payload.guild_id))
+
+    async def on_raw_reaction_remove(self, payload):
+        if shutdown_coordinator.accepting("reaction"):
+            self.reaction_roles.handle_reaction(payload, self.get_guild(payload.guild_id))
+
+    async def on_raw_message_delete(self, payload):
+        if self.reaction_roles.unbind(payload.message_id):
+            await self.reaction_roles.save()
+
+    async def close(self):
+        loop_lag_monitor.stop()
+        if memory_profiler.running:
+            await memory_profiler.stop()
+        await self.scheduler.stop()
+        await self.server_manager.stop_polling()
+        await self.server_manager.join_codes.close()
+        await self.onboarding.close()
+        await self.reaction_roles.close()
+        await self.activity_tracker.close()
+        await self.rp_events.close()
+        await self.server_manager.save_history()
+        await self.role_manager.audit.close()
+        await tracer.close()
+        await self.event_bus.close()
+        await super().close()
+
     async def on_command_error(self, ctx, error):
         if isinstance(error, commands.CommandNotFound):
             return
@@ -104,12 +226,16 @@ async def main():
         keep_alive()  # ✅ Esto mantiene vivo el bot en Render
 
     bot = HomelandBot()
+    # SIGTERM from a rolling deploy drains in-flight work before disconnecting
+    shutdown_coordinator.install(bot)
     try:
         await bot.start(token)
-    except KeyboardInterrupt:
-        logger.info("Bot shutdown requested by user")
     except Exception as e:
         logger.error(f"Bot encountered an error: {e}")
     finally:
-        await bot.close()
+        # Waits for a signal-triggered drain, or drains now if the bot stopped on its own
+        await shutdown_coordinator.shutdown(bot, "process exit")
+
 
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,28 @@
+import pytest
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    """Run every test in an empty directory, so the stores' relative paths never touch the repo's state"""
+    (tmp_path / "config").mkdir()
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+class Clock:
+    """Stands in for the `time` module of utils.resilience, so backoff and breaker timing is manual"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+@pytest.fixture
+def clock(monkeypatch):
+    import utils.resilience
+
+    clock = Clock()
+    monkeypatch.setattr(utils.resilience, "time", clock)
+    return clock
@@ -0,0 +1,67 @@
+import asyncio
+from types import SimpleNamespace
+
+from bot.activity import ActivityTracker
+
+GUILD_ID = 900000000000000000
+
+class FlakyRoleManager:
+    """RoleManager stand-in that fails the first add_role calls"""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.calls = 0
+
+    async def add_role(self, member, role, moderator):
+        self.calls += 1
+        if self.calls <= self.failures:
+            return False, "You are being rate limited."
+        member.roles.append(role)
+        return True, "ok"
+
+def make_tracker(failures: int):
+    role = SimpleNamespace(name="Veteran Player")
+    members = {}
+    guild = SimpleNamespace(id=GUILD_ID, roles=[role], me=None, get_member=members.get)
+    bot = SimpleNamespace(get_guild=lambda guild_id: guild if guild_id == GUILD_ID else None)
+    tracker = ActivityTracker(bot, FlakyRoleManager(failures), scheduler=None, path="data/activity.db")
+    tracker.reward_role = role.name
+    return tracker, members
+
+def add_member(members, user_id: int):
+    members[user_id] = SimpleNamespace(id=user_id, bot=False, roles=[])
+    return members[user_id]
+
+def test_failed_grant_is_retried_on_the_next_run():
+    async def scenario():
+        tracker, members = make_tracker(failures=1)
+        member = add_member(members, 1)
+        tracker.reward_candidates.add((GUILD_ID, 1))
+
+        assert await tracker.grant_rewards() == 0
+        assert tracker.reward_candidates == {(GUILD_ID, 1)}
+        assert not tracker.rewarded_members
+
+        assert await tracker.grant_rewards() == 1
+        assert tracker.reward_candidates == set()
+        assert tracker.rewarded_members == {(GUILD_ID, 1)}
+        assert [role.name for role in member.roles] == ["Veteran Player"]
+        await tracker.close()
+
+    asyncio.run(scenario())
+
+def test_uncached_members_stay_candidates_and_bots_are_dropped():
+    async def scenario():
+        tracker, members = make_tracker(failures=0)
+        add_member(members, 2).bot = True
+        tracker.reward_candidates.update({(GUILD_ID, 1), (GUILD_ID, 2), (GUILD_ID + 1, 3)})
+
+        assert await tracker.grant_rewards() == 0
+        assert tracker.reward_candidates == {(GUILD_ID, 1), (GUILD_ID + 1, 3)}
+
+        add_member(members, 1)
+        assert await tracker.grant_rewards() == 1
+        assert tracker.reward_candidates == {(GUILD_ID + 1, 3)}
+        await tracker.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,66 @@
+import argparse
+import json
+
+import pytest
+
+from tools import bench
+
+@pytest.fixture
+def run_bench(monkeypatch, workdir):
+    """Run tools.bench.main on two small fixtures with every case timed at 1 ms per call"""
+    monkeypatch.setattr(bench, "FIXTURES", {'small': (10, 100), 'medium': (20, 200)})
+    monkeypatch.setattr(bench, "time_call", lambda func, repeats: (func(), 0.001)[1])
+    baseline = workdir / "baseline.json"
+
+    def run(baseline_times=None, **options):
+        if baseline_times is not None:
+            baseline.write_text(json.dumps(baseline_times), encoding="utf-8")
+        args = argparse.Namespace(save=False, check=False, threshold=0.25, filter='', baseline=str(baseline),
+                                  repeats=1)
+        vars(args).update(options)
+        return bench.main(args)
+
+    run.baseline = baseline
+    return run
+
+def test_committed_baseline_covers_the_code_trigger_cases():
+    baseline = bench.load_baseline(bench.BASELINE_FILE)
+    assert {"on_message_code[handout]", "on_message_code[cooldown]"} <= set(baseline)
+
+def test_save_records_every_case(run_bench):
+    assert run_bench(save=True) == 0
+    saved = json.loads(run_bench.baseline.read_text(encoding="utf-8"))
+    assert saved["on_message_code[handout]"] == 0.001
+    assert saved["on_message_code[cooldown]"] == 0.001
+    assert "on_message_keyword[200 chars]" in saved
+
+def test_check_passes_within_the_threshold(run_bench):
+    assert run_bench({"server_status": 0.0009}, check=True, filter="server_status") == 0
+
+def test_check_fails_past_the_threshold(run_bench, capsys):
+    assert run_bench({"server_status": 0.0005}, check=True, filter="server_status") == 1
+    assert "1 regression(s) over 25%: server_status" in capsys.readouterr().out
+
+def test_threshold_is_configurable(run_bench):
+    assert run_bench({"server_status": 0.0005}, check=True, threshold=1.5, filter="server_status") == 0
+
+def test_check_without_a_baseline_fails(run_bench):
+    assert run_bench(check=True, filter="server_status") == 1
+
+def test_code_cases_hit_the_trigger(run_bench, monkeypatch):
+    guilds = {}
+    build_guilds = bench.build_guilds
+    monkeypatch.setattr(bench, "build_guilds", lambda names: guilds.update(build_guilds(names)) or guilds)
+    sends = []
+
+    def time_call(func, repeats):
+        http = guilds['small'].http
+        before = http.calls["POST /channels/{channel_id}/messages"]
+        func()
+        sends.append(http.calls["POST /channels/{channel_id}/messages"] - before)
+        return 0.001
+
+    monkeypatch.setattr(bench, "time_call", time_call)
+    assert run_bench(filter="on_message_code") == 0
+    # The handout posts the link embed; straight after it the channel is in cooldown
+    assert sends == [1, 0]
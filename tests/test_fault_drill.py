@@ -0,0 +1,13 @@
+import argparse
+import asyncio
+
+import pytest
+
+from tools.fault_drill import SCENARIOS, run_scenario
+
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+def test_bot_survives_fault_scenario(scenario, capsys):
+    """Each drill scenario passes: nothing escapes, no task dies, latency stays bounded"""
+    args = argparse.Namespace(events=120, rate=100, seed=0, verbose=False)
+    passed = asyncio.run(run_scenario(scenario, args))
+    assert passed, capsys.readouterr().out
@@ -0,0 +1,206 @@
+import asyncio
+import datetime
+import json
+from types import SimpleNamespace
+
+import discord
+import pytest
+
+from bot.event_bus import EventBus
+from bot.fault_injection import FaultInjector
+from bot.join_codes import JoinCodePool
+from bot.onboarding import OnboardingQueue
+from bot.role_manager import RoleManager
+from bot.server_manager import ServerManager
+from tools.fakes import FakeGuild, FakeHTTP
+from utils import json_store
+from utils.json_store import load_json, save_json
+
+LINK = "https://www.roblox.com/games/start?placeId=1&launchData=joinCode%3DSEED0001"
+
+def injector(**sections) -> FaultInjector:
+    return FaultInjector({'enabled': True, 'seed': 0, **sections})
+
+@pytest.fixture(autouse=True)
+def no_file_hooks():
+    yield
+    json_store.set_hooks()
+
+def test_disabled_injector_installs_passthrough_hooks():
+    FaultInjector({}).install()
+    assert save_json("config/state.json", {'a': 1})
+    assert load_json("config/state.json") == {'a': 1}
+
+def test_disk_full_write_fails_and_keeps_the_previous_file():
+    save_json("config/state.json", {'version': 1})
+    faults = injector(files={'disk_full_rate': 1.0})
+    faults.install()
+
+    assert save_json("config/state.json", {'version': 2}) is False
+    assert faults.injected['disk_full'] == 1
+    json_store.set_hooks()
+    assert load_json("config/state.json") == {'version': 1}
+
+def test_corrupt_read_returns_the_default():
+    save_json("config/state.json", {'version': 1})
+    injector(files={'corrupt_json_rate': 1.0}).install()
+    assert load_json("config/state.json", "default") == "default"
+
+def test_corrupt_read_leaves_the_join_code_pool_intact():
+    async def scenario():
+        pool = JoinCodePool("config/join_codes.json")
+        await pool.start([LINK])
+        pool.add("KEEP1234", None, 3, "admin")
+        await pool.close()
+        with open("config/join_codes.json", encoding="utf-8") as f:
+            saved = f.read()
+
+        injector(files={'corrupt_json_rate': 1.0}).install()
+        restarted = JoinCodePool("config/join_codes.json")
+        await restarted.start([LINK])
+        # Not mistaken for a first run: nothing is seeded and nothing is saved over the file
+        assert len(restarted) == 0
+        assert restarted.writable is False
+        restarted.add("NEW12345", None, None, "admin")
+        assert await restarted.save() is False
+        await restarted.close()
+
+        json_store.set_hooks()
+        with open("config/join_codes.json", encoding="utf-8") as f:
+            assert f.read() == saved
+        recovered = JoinCodePool("config/join_codes.json")
+        await recovered.start([])
+        assert sorted(recovered.codes) == ["KEEP1234", "SEED0001"]
+        await recovered.close()
+
+    asyncio.run(scenario())
+
+def test_join_code_pool_failed_save_is_retried_on_close():
+    async def scenario():
+        pool = JoinCodePool("config/join_codes.json")
+        await pool.start([LINK])
+        injector(files={'disk_full_rate': 1.0}).install()
+        pool.add("KEEP1234", None, 3, "admin")
+        assert await pool.save() is False
+        assert pool._dirty
+
+        json_store.set_hooks()
+        await pool.close()
+        saved = load_json("config/join_codes.json")['codes']
+        assert sorted(entry['code'] for entry in saved) == ["KEEP1234", "SEED0001"]
+
+    asyncio.run(scenario())
+
+def test_corrupt_status_file_reads_as_the_fallback():
+    async def scenario():
+        manager = ServerManager(EventBus())
+        assert await manager.update_server_status(12, "Bank heist", "admin")
+
+        injector(files={'corrupt_json_rate': 1.0}).install()
+        status = await manager.get_server_status()
+        assert status['fallback'] is True
+        assert status['current_rp'] == "Status unavailable"
+
+    asyncio.run(scenario())
+
+def test_status_write_on_a_full_disk_reports_failure():
+    async def scenario():
+        manager = ServerManager(EventBus())
+        assert await manager.update_server_status(12, "Bank heist", "admin")
+        version = manager.status_version
+
+        injector(files={'disk_full_rate': 1.0}).install()
+        assert await manager.update_server_status(20, "Car chase", "admin") is False
+        assert manager.status_version == version
+
+        json_store.set_hooks()
+        status = await manager.get_server_status()
+        assert (status['player_count'], status['current_rp']) == (12, "Bank heist")
+
+    asyncio.run(scenario())
+
+def wrapped_client(faults: FaultInjector):
+    calls = []
+
+    async def request(route, **kwargs):
+        calls.append(route)
+        return "ok"
+
+    http = SimpleNamespace(request=request, max_ratelimit_timeout=30.0)
+    faults.install(http)
+    return http, calls
+
+def route():
+    return SimpleNamespace(method="PATCH", path="/guilds/{guild_id}/members/{user_id}")
+
+def test_http_5xx_is_raised_as_a_discord_server_error():
+    async def scenario():
+        http, calls = wrapped_client(injector(http={'server_error_rate': 1.0}))
+        with pytest.raises(discord.DiscordServerError) as raised:
+            await http.request(route())
+        assert raised.value.status == 503
+        assert calls == []
+
+    asyncio.run(scenario())
+
+def test_http_429_waits_within_the_limit_and_raises_past_it():
+    async def scenario():
+        http, calls = wrapped_client(injector(http={'rate_limit_rate': 1.0, 'retry_after_seconds': 0.01}))
+        assert await http.request(route()) == "ok"
+        assert len(calls) == 1
+
+        http, calls = wrapped_client(injector(http={'rate_limit_rate': 1.0, 'retry_after_seconds': 60}))
+        with pytest.raises(discord.RateLimited):
+            await http.request(route())
+        assert calls == []
+
+    asyncio.run(scenario())
+
+def test_http_timeout_raises_after_the_configured_wait():
+    async def scenario():
+        http, calls = wrapped_client(injector(http={'timeout_rate': 1.0, 'timeout_seconds': 0.01}))
+        with pytest.raises(asyncio.TimeoutError):
+            await http.request(route())
+        assert calls == []
+
+    asyncio.run(scenario())
+
+async def drain(onboarding: OnboardingQueue):
+    await asyncio.sleep(0)
+    while onboarding.backlog:
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.01)
+
+def test_onboarding_5xx_is_surfaced_and_retried_on_restart():
+    async def scenario():
+        faults = injector(http={'server_error_rate': 1.0})
+        guild = FakeGuild(900000000000000000, FakeHTTP(latency=0, faults=faults), ["Civilian", "Verified"], 0)
+        member = guild.add_member(900000000000100000, "newcomer")
+        member.joined_at = datetime.datetime.now(datetime.timezone.utc)
+
+        onboarding = OnboardingQueue(RoleManager(EventBus()), "config/onboarding.json")
+        onboarding.batch_window = 0
+        await onboarding.start()
+        onboarding.enqueue(member)
+        await drain(onboarding)
+        await onboarding.close()
+
+        assert onboarding.stats['failed'] == 1
+        assert onboarding.stats['assigned'] == 0
+        assert faults.injected['5xx'] >= 1
+        # The failed join stays inside the reconciliation window
+        with open("config/onboarding.json", encoding="utf-8") as f:
+            checkpoint = json.load(f)['checkpoint']
+        assert checkpoint < member.joined_at.timestamp()
+
+        faults.configure({})
+        restarted = OnboardingQueue(RoleManager(EventBus()), "config/onboarding.json")
+        await restarted.start()
+        assert await restarted.reconcile(guild) == 1
+        await drain(restarted)
+        await restarted.close()
+
+        assert restarted.stats['assigned'] == 1
+        assert {role.name for role in member.roles} >= {"Civilian", "Verified"}
+
+    asyncio.run(scenario())
@@ -0,0 +1,64 @@
+import asyncio
+
+import discord
+
+from bot.middleware import CommandError, command_pipeline
+from tools.fakes import FakeChannel, FakeGuild, FakeHTTP, FakeInteraction
+
+DELETE_ORIGINAL = "DELETE /webhooks/{application_id}/{token}/messages/@original"
+
+def make_interaction() -> FakeInteraction:
+    http = FakeHTTP(latency=0)
+    guild = FakeGuild(900000000000000000, http, ["Civilian"], 1)
+    channel = FakeChannel(guild.id + 1, guild, http)
+    interaction = FakeInteraction(1, guild.members[-1], channel)
+    interaction.followups = []
+    send = interaction.followup.send
+
+    async def record(*args, **kwargs):
+        interaction.followups.append((args, kwargs))
+        await send(*args, **kwargs)
+
+    interaction.followup.send = record
+    return interaction
+
+def run_slow_command(error: Exception) -> FakeInteraction:
+    @command_pipeline(defer=True)
+    async def slow(interaction):
+        # Let the automatic defer post its public "thinking" placeholder first
+        await asyncio.sleep(0.01)
+        raise error
+
+    interaction = make_interaction()
+    asyncio.run(slow(interaction))
+    return interaction
+
+def test_ephemeral_error_after_a_public_defer_replaces_the_placeholder():
+    interaction = run_slow_command(CommandError("Not in a patrol."))
+
+    assert interaction.http.calls[DELETE_ORIGINAL] == 1
+    assert interaction.followups == [(("❌ Not in a patrol.",), {'ephemeral': True})]
+    assert interaction.extras == {}
+
+def test_unexpected_error_after_a_public_defer_stays_ephemeral():
+    interaction = run_slow_command(RuntimeError("boom"))
+
+    assert interaction.http.calls[DELETE_ORIGINAL] == 1
+    [(args, kwargs)] = interaction.followups
+    assert kwargs == {'ephemeral': True}
+
+def test_public_error_after_a_public_defer_edits_the_placeholder():
+    interaction = run_slow_command(CommandError("Server is full.", ephemeral=False))
+
+    assert interaction.http.calls[DELETE_ORIGINAL] == 0
+    assert interaction.followups == [(("❌ Server is full.",), {'ephemeral': False})]
+
+def test_forbidden_after_a_public_defer_stays_ephemeral():
+    class Response:
+        status = 403
+        reason = "Forbidden"
+
+    interaction = run_slow_command(discord.Forbidden(Response(), "Missing Permissions"))
+
+    assert interaction.http.calls[DELETE_ORIGINAL] == 1
+    assert interaction.followups == [(("❌ I don't have permission to do that.",), {'ephemeral': True})]
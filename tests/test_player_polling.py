@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+
+from bot.event_bus import EventBus
+from bot.player_count import FakePlayerCountProvider, PlayerCountProvider
+from bot.server_manager import ServerManager
+
+LINKS = [f"https://www.roblox.com/games/start?placeId={index}" for index in range(1, 4)]
+
+def make_manager(failure_rate: float) -> ServerManager:
+    manager = ServerManager(EventBus())
+    manager.server_links = list(LINKS)
+    manager.provider = FakePlayerCountProvider(latency=0, failure_rate=failure_rate, seed=0)
+    return manager
+
+def fetch(manager: ServerManager, link: str = LINKS[0]):
+    return asyncio.run(manager._fetch_player_count(link))
+
+def test_provider_interface_is_abstract():
+    with pytest.raises(TypeError):
+        PlayerCountProvider()
+
+def test_failed_link_backs_off_until_its_delay_passes(clock):
+    manager = make_manager(failure_rate=1.0)
+    provider = manager.provider
+
+    assert fetch(manager) is None
+    assert provider.calls == 1
+    # Inside the backoff window the provider isn't asked again
+    fetch(manager)
+    assert provider.calls == 1
+
+    clock.advance(manager.poll_backoff.base)
+    fetch(manager)
+    assert provider.calls == 2
+    assert manager.poll_backoff.failures(LINKS[0]) == 2
+
+def test_backoff_delay_grows_and_is_capped(clock):
+    manager = make_manager(failure_rate=1.0)
+    backoff = manager.poll_backoff
+    delays = [backoff.failure(LINKS[0]) for _ in range(12)]
+
+    # Full jitter: each delay is within [ceiling / 2, ceiling], the ceiling doubling up to the maximum
+    assert backoff.base / 2 <= delays[0] <= backoff.base
+    assert all(delay <= backoff.maximum for delay in delays)
+    assert delays[-1] >= backoff.maximum / 2
+
+def test_breaker_opens_after_threshold_and_recovers_half_open(clock):
+    manager = make_manager(failure_rate=1.0)
+    breaker = manager.poll_breaker
+    provider = manager.provider
+
+    # Distinct failures so per-link backoff doesn't hide them from the breaker
+    for attempt in range(breaker.failure_threshold):
+        clock.advance(manager.poll_backoff.maximum)
+        fetch(manager, LINKS[attempt % len(LINKS)])
+    assert breaker.state == breaker.OPEN
+    calls = provider.calls
+
+    # Open: no link reaches the provider
+    for link in LINKS:
+        fetch(manager, link)
+    assert provider.calls == calls
+
+    # After the reset timeout one trial goes through; success closes the circuit
+    clock.advance(breaker.reset_timeout)
+    provider.failure_rate = 0.0
+    assert fetch(manager, LINKS[1]) is not None
+    assert provider.calls == calls + 1
+    assert breaker.state == breaker.CLOSED
+
+def test_failed_half_open_trial_reopens_the_circuit(clock):
+    manager = make_manager(failure_rate=1.0)
+    breaker = manager.poll_breaker
+    for attempt in range(breaker.failure_threshold):
+        clock.advance(manager.poll_backoff.maximum)
+        fetch(manager, LINKS[attempt % len(LINKS)])
+    clock.advance(breaker.reset_timeout)
+    calls = manager.provider.calls
+
+    fetch(manager, LINKS[2])
+    assert manager.provider.calls == calls + 1
+    assert breaker.state == breaker.OPEN
+
+def test_failure_falls_back_to_the_last_known_count(clock):
+    manager = make_manager(failure_rate=0.0)
+    count = fetch(manager)
+    assert count is not None
+
+    manager.provider.failure_rate = 1.0
+    assert fetch(manager) == count
+    assert manager.poll_backoff.failures(LINKS[0]) == 1
+
+def test_poll_stores_the_total_of_the_links_that_answered(clock):
+    manager = make_manager(failure_rate=0.0)
+    total = asyncio.run(manager.poll_player_counts())
+
+    assert total == sum(manager.player_counts[link] for link in LINKS)
+    status = asyncio.run(manager.get_server_status())
+    assert status['player_count'] == total
+
+def test_every_poll_asks_the_provider(clock):
+    manager = make_manager(failure_rate=0.0)
+    asyncio.run(manager.poll_player_counts())
+    clock.advance(1)
+    asyncio.run(manager.poll_player_counts())
+    assert manager.provider.calls == 2 * len(LINKS)
@@ -0,0 +1,72 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+from bot.reaction_roles import ReactionRoles
+from bot.shutdown import ShutdownCoordinator
+
+class SlowRoleManager:
+    """RoleManager stand-in whose role changes wait until released"""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.started = asyncio.Event()
+        self.added = []
+
+    async def add_role(self, member, role, moderator):
+        self.started.set()
+        await self.release.wait()
+        member.roles.append(role)
+        self.added.append((member.id, role.id))
+        return True, "ok"
+
+def member(user_id: int):
+    guild = SimpleNamespace(id=1, me=None)
+    return SimpleNamespace(id=user_id, guild=guild, roles=[])
+
+def role(role_id: int):
+    return SimpleNamespace(id=role_id, name=f"role-{role_id}")
+
+def test_close_awaits_a_change_that_is_being_applied():
+    async def scenario():
+        manager = SlowRoleManager()
+        reaction_roles = ReactionRoles(manager, "config/reaction_roles.json")
+        reaction_roles.debounce = 0
+        reaction_roles.request(member(10), role(20), True)
+        await manager.started.wait()
+        # Still debouncing when close() arrives
+        reaction_roles.debounce = 60
+        reaction_roles.request(member(11), role(21), True)
+        assert reaction_roles.backlog == 2
+
+        closing = asyncio.create_task(reaction_roles.close())
+        await asyncio.sleep(0.01)
+        assert not closing.done()
+        manager.release.set()
+        await closing
+
+        assert sorted(manager.added) == [(10, 20), (11, 21)]
+        assert reaction_roles.applied == 2
+        assert reaction_roles.backlog == 0
+
+    asyncio.run(scenario())
+
+def test_change_in_flight_at_the_deadline_is_reported_and_not_cancelled():
+    async def scenario():
+        manager = SlowRoleManager()
+        reaction_roles = ReactionRoles(manager, "config/reaction_roles.json")
+        reaction_roles.debounce = 0
+        reaction_roles.request(member(10), role(20), True)
+        await manager.started.wait()
+
+        coordinator = ShutdownCoordinator()
+        assert await coordinator._within(reaction_roles.close(), time.monotonic() + 0.01) is False
+        # Counted as not applied rather than silently lost
+        assert reaction_roles.backlog == 1
+
+        manager.release.set()
+        await asyncio.gather(*reaction_roles._background)
+        assert manager.added == [(10, 20)]
+        assert reaction_roles.backlog == 0
+
+    asyncio.run(scenario())
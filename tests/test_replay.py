@@ -0,0 +1,53 @@
+import asyncio
+
+from tools.fakes import FakeHTTP
+from tools.replay import ReplayHarness, load_events, save_events, synthetic_events
+
+def test_synthetic_stream_is_seeded_and_evenly_spaced():
+    events = synthetic_events(50, rate=100, channels=3, members=10, seed=7)
+
+    assert events == synthetic_events(50, rate=100, channels=3, members=10, seed=7)
+    assert events != synthetic_events(50, rate=100, channels=3, members=10, seed=8)
+    assert [event['at'] for event in events] == [index / 100 for index in range(50)]
+    for event in events:
+        assert 0 <= event['channel'] < 3
+        if event['type'] == 'command' and event['command'] in ('addrole', 'removerole'):
+            assert event['user'] == 'owner'
+            assert 0 <= event['options']['member'] < 10
+
+def test_recorded_stream_round_trips(workdir):
+    events = synthetic_events(20, rate=100, channels=2, members=5)
+    save_events(str(workdir / "events.jsonl"), events)
+    assert load_events(str(workdir / "events.jsonl")) == events
+
+def test_replay_runs_every_event_without_errors_or_expired_interactions():
+    events = [
+        {'at': 0.0, 'type': 'message', 'channel': 0, 'user': 1, 'content': "anyone on tonight?"},
+        {'at': 0.01, 'type': 'message', 'channel': 1, 'user': 2, 'content': "what's the server code?"},
+        {'at': 0.02, 'type': 'command', 'channel': 0, 'user': 3, 'command': 'server'},
+        {'at': 0.03, 'type': 'command', 'channel': 1, 'user': 4, 'command': 'serverstatus'},
+        {'at': 0.04, 'type': 'command', 'channel': 2, 'user': 5, 'command': 'roleinfo'},
+        {'at': 0.05, 'type': 'command', 'channel': 0, 'user': 'owner', 'command': 'addrole',
+         'options': {'member': 6, 'role': "Police"}},
+        {'at': 0.06, 'type': 'command', 'channel': 1, 'user': 'owner', 'command': 'removerole',
+         'options': {'member': 6, 'role': "Police"}},
+    ] + synthetic_events(40, rate=400, channels=3, members=20, seed=1)
+
+    async def scenario():
+        harness = ReplayHarness(FakeHTTP(latency=0, seed=0), channels=3, members=20, roles=40)
+        await harness.setup()
+        try:
+            await harness.replay(events, speed=10)
+        finally:
+            await harness.close()
+        return harness
+
+    harness = asyncio.run(scenario())
+
+    assert not harness.errors
+    assert harness.expired == 0
+    assert sum(len(values) for values in harness.latencies.values()) == len(events)
+    assert {'message', '/server', '/serverstatus', '/roleinfo', '/addrole', '/removerole'} <= set(harness.latencies)
+    # The role changes reached the member endpoints
+    assert any(route.startswith("PUT") and "/roles/" in route for route in harness.http.calls)
+    assert any(route.startswith("DELETE") and "/roles/" in route for route in harness.http.calls)
@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+
+from bot.activity import ActivityTracker
+from bot.audit_store import RoleAuditStore
+from bot.rp_events import RPEventManager
+from utils.sqlite_store import SQLiteStore
+
+SCHEMA = "CREATE TABLE IF NOT EXISTS notes (id INTEGER PRIMARY KEY, text TEXT NOT NULL);"
+
+def test_database_is_opened_in_wal_mode_with_the_schema():
+    async def scenario():
+        store = SQLiteStore("data/notes.db", SCHEMA)
+
+        def write_and_read(text):
+            conn = store.connect()
+            with conn:
+                conn.execute("INSERT INTO notes (text) VALUES (?)", (text,))
+            return (conn.execute("PRAGMA journal_mode").fetchone()[0],
+                    conn.execute("PRAGMA synchronous").fetchone()[0],
+                    conn.execute("SELECT text FROM notes").fetchall())
+
+        journal, synchronous, rows = await store.run(write_and_read, "hello")
+        await store.close()
+        assert (journal, synchronous, rows) == ("wal", 1, [("hello",)])
+
+        reopened = SQLiteStore("data/notes.db", SCHEMA)
+        rows = await reopened.run(lambda: reopened.connect().execute("SELECT text FROM notes").fetchall())
+        await reopened.close()
+        assert rows == [("hello",)]
+
+    asyncio.run(scenario())
+
+@pytest.mark.parametrize("make_store", [
+    lambda: RoleAuditStore("data/role_audit.db"),
+    lambda: RPEventManager(None, None, None, "data/rp_events.db"),
+    lambda: ActivityTracker(None, None, None, "data/activity.db"),
+])
+def test_stores_share_the_helper(make_store):
+    store = make_store()
+    assert isinstance(store.db, SQLiteStore)
+    assert store.db.path == store.path
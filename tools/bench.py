@@ -0,0 +1,233 @@
+"""
+Microbenchmarks for the bot's hot functions on synthetic guilds.
+
+Covers RoleManager.get_roles_info, role autocomplete (RoleSearchIndex),
+PermissionManager.get_user_permission_level,
+PermissionManager.can_manage_user, the on_message keyword check, the
+"code" auto-response (link handout, embed and send, and the per-channel
+cooldown short-circuit), SpamGuard.check, EventBus publish-to-delivery and ServerManager.get_server_status on guilds from
+10 to 1,000 roles and 100 to 100k members. Each case is timed in several repeats and the fastest
+per-call time is kept. --save stores the results as the baseline (committed
+as tools/bench_baseline.json); --check (or --compare) compares against it
+and exits with status 1 when a case is slower than the baseline by more
+than the threshold. Runs fully offline.
+
+Usage: python -m tools.bench [--save | --check] [--threshold 0.25] [--filter roles_info]
+       [--baseline tools/bench_baseline.json] [--repeats 5]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.fakes import FakeChannel, FakeGuild, FakeHTTP, FakeMessage, homeland_role_names
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baseline.json")
+
+# name -> (roles, members)
+FIXTURES = {
+    'small': (10, 100),
+    'medium': (100, 10000),
+    'many_roles': (1000, 1000),
+    'many_members': (10, 100000),
+}
+
+MESSAGE_LENGTHS = [20, 200, 2000]
+
+EVENT_BUS_SUBSCRIBERS = [0, 5, 25]
+
+def time_call(func: Callable, repeats: int, target: float = 0.2) -> float:
+    """Fastest seconds per call over repeats, each repeat running for about target seconds"""
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= target / 4 or number >= 1 << 20:
+            break
+        number *= 4
+    number = max(1, int(number * target / max(elapsed, 1e-9)))
+
+    best = float('inf')
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - started) / number)
+    return best
+
+def build_guilds(names: List[str]) -> Dict[str, FakeGuild]:
+    http = FakeHTTP(latency=0)
+    return {
+        name: FakeGuild(800000000000000000 + index * 10000000, http,
+                        homeland_role_names(FIXTURES[name][0]), FIXTURES[name][1], roles_per_member=5)
+        for index, name in enumerate(names)
+    }
+
+def build_cases(loop: asyncio.AbstractEventLoop, bot, wanted: str) -> List[Tuple[str, Callable]]:
+    from bot.permissions import permission_manager
+    from bot.role_search import RoleSearchIndex
+    from bot.spam_guard import SpamGuard
+
+    run = loop.run_until_complete
+    cases: List[Tuple[str, Callable]] = []
+    guilds = build_guilds(list(FIXTURES))
+
+    for name in FIXTURES:
+        guild = guilds[name]
+        cases.append((f"roles_info[{name}]", lambda g=guild: run(bot.role_manager.get_roles_info(g))))
+
+    search = RoleSearchIndex(bot.role_manager)
+    for name in FIXTURES:
+        guild = guilds[name]
+        cases.append((f"role_autocomplete[{name}]", lambda g=guild: search.search(g, "po")))
+        # Cold: the first lookup after a role event rebuilds the guild's index
+        cases.append((f"role_autocomplete_rebuild[{name}]",
+                      lambda g=guild: (search.invalidate(g.id), search.search(g, "po"))))
+
+    for name in FIXTURES:
+        members = [m for m in guilds[name].members if not m.bot]
+        # Cycle through members so results reflect the guild, not one member
+        state = {'index': 0}
+
+        def permission_level(members=members, state=state):
+            state['index'] = (state['index'] + 1) % len(members)
+            permission_manager.get_user_permission_level(members[state['index']])
+
+        def manage_user(members=members, state=state):
+            state['index'] = (state['index'] + 1) % len(members)
+            permission_manager.can_manage_user(members[state['index']], members[state['index'] - 1])
+
+        cases.append((f"permission_level[{name}]", permission_level))
+        cases.append((f"can_manage_user[{name}]", manage_user))
+
+    guild = guilds['small']
+    channel = FakeChannel(guild.id + 1, guild, guild.http)
+    author = next(m for m in guild.members if not m.bot)
+    # One author hammering one channel would trip the spam guard; it gets its own case below
+    bot.spam_guard.enabled = False
+    for length in MESSAGE_LENGTHS:
+        content = ("anyone up for a patrol tonight " * (length // 31 + 1))[:length]
+        message = FakeMessage(1, author, channel, content)
+        cases.append((f"on_message_keyword[{length} chars]", lambda m=message: run(bot.on_message(m))))
+
+    # Messages that hit the "code" trigger: a full handout, and one inside the channel's cooldown
+    code_message = FakeMessage(2, author, channel, "what's the server code?")
+
+    def code_handout():
+        bot.last_auto_response.pop(channel.id, None)
+        run(bot.on_message(code_message))
+
+    cases.append(("on_message_code[handout]", code_handout))
+    cases.append(("on_message_code[cooldown]", lambda: run(bot.on_message(code_message))))
+
+    guard = SpamGuard(bot.role_manager)
+    guild = guilds['medium']
+    authors = [m for m in guild.members if not m.bot]
+    channels = [FakeChannel(guild.id + 1 + index, guild, guild.http) for index in range(100)]
+    # Normal traffic: distinct authors, channels and content stay under every limit
+    messages = [FakeMessage(index, authors[index], channels[index % len(channels)],
+                            f"anyone up for a patrol tonight at {index}?") for index in range(len(authors))]
+    # A synthetic clock keeps the benchmark's own call rate from looking like a raid
+    state = {'index': 0, 'now': 0.0}
+
+    def spam_guard_check():
+        state['index'] = (state['index'] + 1) % len(messages)
+        state['now'] += 0.01
+        guard.check(messages[state['index']], state['now'])
+
+    cases.append(("spam_guard_check", spam_guard_check))
+
+    # One distinct invalidation, published and then drained by every subscriber.
+    # Each case has its own event type so the subscriber counts don't add up.
+    bus = bot.event_bus
+    for count in EVENT_BUS_SUBSCRIBERS:
+        event_type = NamedTuple(f"BenchEvent{count}", [('guild_id', int)])
+        for index in range(count):
+            bus.subscribe(event_type, lambda event: None, f"bench consumer {index}")
+
+        async def publish_and_drain(event_type=event_type, state={'guild_id': 0}):
+            state['guild_id'] += 1
+            bus.publish(event_type(state['guild_id']))
+            while bus.backlog:
+                await asyncio.sleep(0)
+
+        cases.append((f"event_bus_roundtrip[{count} subscribers]", lambda f=publish_and_drain: run(f())))
+    cases.append(("server_status", lambda: run(bot.server_manager.get_server_status())))
+    return [(name, func) for name, func in cases if wanted in name]
+
+def load_baseline(path: str) -> Dict[str, float]:
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def main(args) -> int:
+    from tools.replay import ReplayHarness
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    harness = ReplayHarness(FakeHTTP(latency=0), channels=1, members=1, roles=1)
+    loop.run_until_complete(harness.setup())
+    bot = harness.bot
+
+    baseline = load_baseline(args.baseline)
+    results: Dict[str, float] = {}
+    regressions = []
+
+    print(f"{'case':<40}{'per call':>14}{'baseline':>14}{'change':>10}")
+    try:
+        for name, func in build_cases(loop, bot, args.filter):
+            seconds = time_call(func, args.repeats)
+            results[name] = seconds
+            line = f"{name:<40}{format_time(seconds):>14}"
+            if name not in baseline:
+                line += f"{'(new case)':>14}"
+            else:
+                change = seconds / baseline[name] - 1
+                flag = "  REGRESSION" if change > args.threshold else ""
+                line += f"{format_time(baseline[name]):>14}{change:>+10.1%}{flag}"
+                if flag:
+                    regressions.append(name)
+            print(line)
+    finally:
+        loop.run_until_complete(harness.close())
+        loop.close()
+
+    if args.save:
+        baseline.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"\nBaseline saved to {args.baseline}")
+
+    if args.check:
+        if not baseline:
+            print(f"\nNo baseline at {args.baseline}; run with --save first")
+            return 1
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+        print(f"\nNo regressions over {args.threshold:.0%}")
+    return 0
+
+def format_time(seconds: float) -> str:
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.2f} µs"
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--save', action='store_true', help="store these results as the baseline")
+    parser.add_argument('--check', '--compare', action='store_true', help="exit 1 on regressions over the threshold")
+    parser.add_argument('--threshold', type=float, default=0.25, help="allowed slowdown, 0.25 = 25%%")
+    parser.add_argument('--filter', default='', help="only run cases whose name contains this")
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--repeats', type=int, default=5)
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,270 @@
+"""
+Offline stand-ins for the discord.py objects the bot handles.
+
+FakeMember and FakeRole subclass the real discord.py classes and fill in
+the attributes their properties read, so permission checks, role
+hierarchy comparisons, Role.members and Member.guild_permissions run the
+real discord.py code. Everything that would reach Discord goes through
+FakeHTTP, which adds latency, simulates 429 rate limits the way
+discord.py retries them, optionally runs the bot's FaultInjector, and
+counts calls per route.
+"""
+import asyncio
+import random
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+import discord
+from discord.utils import SnowflakeList
+
+# Discord drops interactions that aren't acknowledged within 3 seconds
+INTERACTION_DEADLINE = 3.0
+
+def homeland_role_names(count: int) -> List[str]:
+    """The configured category roles first, padded with generic roles up to count"""
+    from config.settings import BOT_CONFIG
+
+    names: List[str] = []
+    for role_names in BOT_CONFIG['role_categories'].values():
+        names.extend(name for name in role_names if name not in names)
+    names = names[:count]
+    names.extend(f"Custom Role {index}" for index in range(count - len(names)))
+    return names
+
+class FakeHTTP:
+    """
+    Stubbed REST layer with configurable latency and rate limiting
+    """
+
+    def __init__(self, latency: float = 0.05, jitter: float = 0.5, rate_limit_rate: float = 0.0,
+                 retry_after: float = 1.0, max_retries: int = 5, seed: Optional[int] = None,
+                 faults=None):
+        self.latency = latency
+        self.faults = faults
+        self.jitter = jitter
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.max_retries = max_retries
+        self.calls: Counter = Counter()
+        self.rate_limited: Counter = Counter()
+        self._random = random.Random(seed)
+
+    async def request(self, route: str):
+        """Simulate one REST call, retrying 429 responses like discord.py does"""
+        for attempt in range(self.max_retries + 1):
+            self.calls[route] += 1
+            if self.faults is not None:
+                await self.faults.http(route)
+            if self.latency:
+                await asyncio.sleep(self.latency * self._random.uniform(1 - self.jitter, 1 + self.jitter))
+            if self._random.random() >= self.rate_limit_rate:
+                return
+            self.rate_limited[route] += 1
+            if attempt < self.max_retries:
+                await asyncio.sleep(self.retry_after)
+        raise discord.RateLimited(self.retry_after)
+
+class FakeUser(discord.User):
+    def __init__(self, user_id: int, name: str, bot: bool = False):
+        self.id = user_id
+        self.name = name
+        self.discriminator = '0'
+        self.global_name = None
+        self.bot = bot
+        self.system = False
+        self._state = None
+
+class FakeRole(discord.Role):
+    def __init__(self, guild: 'FakeGuild', role_id: int, name: str, position: int,
+                 permissions: discord.Permissions = None, managed: bool = False):
+        self.guild = guild
+        self.id = role_id
+        self.name = name
+        self.position = position
+        self._permissions = (permissions or discord.Permissions.none()).value
+        self._colour = 0
+        self._secondary_colour = None
+        self._tertiary_colour = None
+        self._icon = None
+        self.unicode_emoji = None
+        self.managed = managed
+        self.mentionable = False
+        self.hoist = False
+        self.tags = None
+        self._flags = 0
+        self._state = None
+
+class FakeMember(discord.Member):
+    def __init__(self, guild: 'FakeGuild', user: FakeUser, role_ids: List[int] = ()):
+        self.guild = guild
+        self._user = user
+        self._roles = SnowflakeList(role_ids)
+        self.nick = None
+        self.joined_at = None
+        self.premium_since = None
+        self.timed_out_until = None
+        self.pending = False
+        self.activities = ()
+        self._permissions = None
+        self._flags = 0
+        self._state = None
+
+    async def add_roles(self, *roles, reason: Optional[str] = None, atomic: bool = True):
+        if not atomic:
+            # discord.py sends the whole new role list in one member edit
+            await self.guild.http.request("PATCH /guilds/{guild_id}/members/{user_id}")
+        for role in roles:
+            if atomic:
+                await self.guild.http.request("PUT /guilds/{guild_id}/members/{user_id}/roles/{role_id}")
+            # Applied locally as the gateway's member update would
+            if not self._roles.has(role.id):
+                self._roles.add(role.id)
+
+    async def remove_roles(self, *roles, reason: Optional[str] = None, atomic: bool = True):
+        for role in roles:
+            await self.guild.http.request("DELETE /guilds/{guild_id}/members/{user_id}/roles/{role_id}")
+            if self._roles.has(role.id):
+                self._roles.remove(role.id)
+
+class FakeGuild:
+    """
+    Guild with a synthetic role hierarchy and member list.
+
+    Role 0 is @everyone; the bot's own member holds the highest role with
+    manage_roles so role changes pass the hierarchy checks.
+    """
+
+    def __init__(self, guild_id: int, http: FakeHTTP, role_names: List[str], member_count: int,
+                 roles_per_member: int = 3, owner_id: int = 0, seed: int = 0):
+        rng = random.Random(seed)
+        self.id = guild_id
+        self.name = f"Guild {guild_id}"
+        self.http = http
+        self.owner_id = owner_id
+
+        self._roles: Dict[int, FakeRole] = {guild_id: FakeRole(self, guild_id, "@everyone", 0)}
+        for position, name in enumerate(role_names, start=1):
+            role_id = guild_id + position
+            self._roles[role_id] = FakeRole(self, role_id, name, position)
+        bot_role_id = guild_id + len(role_names) + 1
+        self._roles[bot_role_id] = FakeRole(
+            self, bot_role_id, "Homeland Bot", len(role_names) + 1,
+            discord.Permissions(manage_roles=True), managed=True
+        )
+
+        assignable = [role_id for role_id in self._roles if role_id not in (guild_id, bot_role_id)]
+        self._members: Dict[int, FakeMember] = {}
+        # Snowflake-sized ids that stay within SQLite's 64-bit integers
+        base_user_id = guild_id + 1000000
+        for index in range(member_count):
+            user = FakeUser(base_user_id + index, f"member{index}")
+            picks = rng.sample(assignable, min(roles_per_member, len(assignable)))
+            self._members[user.id] = FakeMember(self, user, picks)
+
+        bot_user = FakeUser(base_user_id - 1, "Homeland RP | Official Bot", bot=True)
+        self.me = FakeMember(self, bot_user, [bot_role_id])
+        self._members[bot_user.id] = self.me
+
+    @property
+    def roles(self) -> List[FakeRole]:
+        return sorted(self._roles.values())
+
+    @property
+    def members(self) -> List[FakeMember]:
+        return list(self._members.values())
+
+    @property
+    def member_count(self) -> int:
+        return len(self._members)
+
+    @property
+    def default_role(self) -> FakeRole:
+        return self._roles[self.id]
+
+    def get_role(self, role_id: int) -> Optional[FakeRole]:
+        return self._roles.get(role_id)
+
+    def get_member(self, user_id: int) -> Optional[FakeMember]:
+        return self._members.get(user_id)
+
+    def add_member(self, user_id: int, name: str, role_ids: List[int] = ()) -> FakeMember:
+        member = FakeMember(self, FakeUser(user_id, name), role_ids)
+        self._members[user_id] = member
+        return member
+
+    def __str__(self) -> str:
+        return self.name
+
+class FakeChannel:
+    def __init__(self, channel_id: int, guild: FakeGuild, http: FakeHTTP):
+        self.id = channel_id
+        self.guild = guild
+        self.name = f"channel-{channel_id}"
+        self.http = http
+
+    async def send(self, *args, **kwargs):
+        await self.http.request("POST /channels/{channel_id}/messages")
+
+    def __str__(self) -> str:
+        return self.name
+
+class FakeMessage:
+    def __init__(self, message_id: int, author: FakeMember, channel: FakeChannel, content: str):
+        self.id = message_id
+        self.author = author
+        self.channel = channel
+        self.guild = channel.guild
+        self.content = content
+        self._state = None
+
+class FakeFollowup:
+    def __init__(self, interaction: 'FakeInteraction'):
+        self.interaction = interaction
+
+    async def send(self, *args, **kwargs):
+        await self.interaction.http.request("POST /webhooks/{application_id}/{token}")
+
+class FakeResponse:
+    def __init__(self, interaction: 'FakeInteraction'):
+        self.interaction = interaction
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def _acknowledge(self):
+        if self._done:
+            raise discord.InteractionResponded(self.interaction)
+        self._done = True
+        if time.perf_counter() - self.interaction.created > INTERACTION_DEADLINE:
+            self.interaction.expired = True
+        await self.interaction.http.request("POST /interactions/{interaction_id}/{token}/callback")
+
+    async def send_message(self, *args, **kwargs):
+        await self._acknowledge()
+
+    async def defer(self, *args, **kwargs):
+        await self._acknowledge()
+
+    async def edit_message(self, *args, **kwargs):
+        await self._acknowledge()
+
+class FakeInteraction:
+    def __init__(self, interaction_id: int, user: FakeMember, channel: FakeChannel, command=None):
+        self.id = interaction_id
+        self.user = user
+        self.channel = channel
+        self.channel_id = channel.id
+        self.guild = channel.guild
+        self.guild_id = channel.guild.id
+        self.command = command
+        self.http = channel.http
+        self.extras: Dict = {}
+        self.expired = False
+        self.created = time.perf_counter()
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+
+    async def delete_original_response(self):
+        await self.http.request("DELETE /webhooks/{application_id}/{token}/messages/@original")
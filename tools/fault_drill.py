@@ -0,0 +1,168 @@
+"""
+Fault drills: replay traffic against the real bot while Discord and the disk misbehave.
+
+Each scenario configures the bot's FaultInjector (the object the
+fault_injection config section drives) with latency, 429s, 5xx errors,
+timeouts, a full disk or corrupt JSON, then replays a synthetic stream
+through ReplayHarness and FakeHTTP and checks that:
+
+- no handler lets an exception escape and no task dies with one,
+- every event finishes within the scenario's latency bound,
+- the file-store fallbacks hold: a corrupt status file reads as the
+  "Status unavailable" fallback and a failed status write reports failure
+  and leaves the previous status readable.
+
+Exits with status 1 when a check fails. Runs offline in a temporary
+working directory, so the bot's state files are left alone.
+
+Usage: python -m tools.fault_drill [--scenario timeouts] [--events 400] [--rate 100]
+       [--seed 0] [--verbose]
+"""
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import shutil
+import sys
+import tempfile
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.fakes import FakeHTTP
+from tools.replay import ReplayHarness, percentile, synthetic_events
+from utils import json_store
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# name -> (fault_injection config, latency bound in seconds)
+SCENARIOS: Dict[str, Tuple[dict, float]] = {
+    'latency': ({'http': {'latency_seconds': 0.4}}, 4.0),
+    '429': ({'http': {'rate_limit_rate': 0.2, 'retry_after_seconds': 0.5}}, 5.0),
+    '5xx': ({'http': {'server_error_rate': 0.2}}, 2.0),
+    'timeouts': ({'http': {'timeout_rate': 0.05, 'timeout_seconds': 1.5}}, 6.0),
+    'disk_full': ({'files': {'disk_full_rate': 1.0}}, 2.0),
+    'corrupt_json': ({'files': {'corrupt_json_rate': 1.0}}, 2.0),
+    'everything': ({
+        'http': {'latency_seconds': 0.1, 'rate_limit_rate': 0.05, 'retry_after_seconds': 0.5,
+                 'server_error_rate': 0.05, 'timeout_rate': 0.02, 'timeout_seconds': 1.5},
+        'files': {'disk_full_rate': 0.3, 'corrupt_json_rate': 0.3},
+    }, 8.0),
+}
+
+# Every Nth event is an owner /updatestatus, so status writes and reads happen under faults
+STATUS_UPDATE_EVERY = 20
+
+def drill_events(count: int, rate: float, seed: int) -> List[dict]:
+    events = synthetic_events(count, rate, channels=5, members=200, seed=seed)
+    for index in range(0, count, STATUS_UPDATE_EVERY):
+        events[index] = {
+            'at': events[index]['at'], 'type': 'command', 'channel': 0, 'user': 'owner',
+            'command': 'updatestatus', 'options': {'player_count': index % 50, 'current_rp': f"Drill {index}"},
+        }
+    return events
+
+async def file_checks(bot, faults, name: str) -> List[Tuple[str, bool]]:
+    """Direct checks of the status store fallbacks for the file scenarios"""
+    server_manager = bot.server_manager
+    config = dict(faults.config)
+    checks = []
+
+    if name == 'corrupt_json':
+        status = await server_manager.get_server_status()
+        checks.append(("corrupt status file reads as the fallback",
+                       status['online'] is False and status['current_rp'] == "Status unavailable"))
+
+    if name == 'disk_full':
+        faults.configure({})
+        await server_manager.update_server_status(7, "Before the disk filled", "drill")
+        faults.configure(config)
+        failed = not await server_manager.update_server_status(8, "After the disk filled", "drill")
+        faults.configure({})
+        status = await server_manager.get_server_status()
+        faults.configure(config)
+        checks.append(("status write on a full disk reports failure", failed))
+        checks.append(("previous status survives a failed write",
+                       status['current_rp'] == "Before the disk filled"))
+    return checks
+
+async def run_scenario(name: str, args) -> bool:
+    from bot.fault_injection import faults
+
+    config, bound = SCENARIOS[name]
+    crashed: List[dict] = []
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(lambda loop, context: crashed.append(context))
+
+    faults.configure({})
+    http = FakeHTTP(latency=0.02, seed=args.seed, faults=faults)
+    harness = ReplayHarness(http, channels=5, members=200, roles=40)
+    await harness.setup()
+    if not args.verbose:
+        # Injected faults are logged as errors by design
+        logging.getLogger().setLevel(logging.CRITICAL)
+
+    faults.configure({**config, 'enabled': True, 'seed': args.seed})
+    # FakeHTTP runs the HTTP faults itself; the JSON stores need the file hooks
+    faults.install()
+    faults.injected.clear()
+    try:
+        elapsed = await harness.replay(drill_events(args.events, args.rate, args.seed))
+        checks = await file_checks(harness.bot, faults, name)
+        # Let background work (status board, event bus, audit flushes) finish under faults too
+        await asyncio.sleep(1.0)
+    finally:
+        faults.configure({})
+        await harness.close()
+        json_store.set_hooks()
+    gc.collect()
+    await asyncio.sleep(0)
+
+    latencies = [value for values in harness.latencies.values() for value in values]
+    worst = max(latencies, default=0.0)
+    checks += [
+        ("no exceptions escaped a handler", not harness.errors),
+        ("no task died with an exception", not crashed),
+        (f"every event finished within {bound:.0f}s", worst <= bound),
+    ]
+
+    passed = all(ok for _, ok in checks)
+    print(f"\n[{'PASS' if passed else 'FAIL'}] {name}: {len(latencies)} events in {elapsed:.1f}s, "
+          f"p99 {percentile(latencies, 0.99) * 1000:.0f}ms, max {worst * 1000:.0f}ms, "
+          f"expired interactions {harness.expired}")
+    print(f"  injected: {dict(faults.injected) or 'nothing'}")
+    for description, ok in checks:
+        print(f"  {'ok ' if ok else 'FAILED'} {description}")
+    if harness.errors:
+        print(f"  escaped: {dict(harness.errors)}")
+    for context in crashed[:5]:
+        print(f"  crashed: {context.get('message')} {context.get('exception')!r}")
+    return passed
+
+async def main(args) -> int:
+    names = [args.scenario] if args.scenario else list(SCENARIOS)
+    workdir = tempfile.mkdtemp(prefix="fault_drill_")
+    status_file = os.path.join(REPO_ROOT, "config", "server_status.json")
+    os.makedirs(os.path.join(workdir, "config"))
+    if os.path.exists(status_file):
+        shutil.copy(status_file, os.path.join(workdir, "config"))
+    os.chdir(workdir)
+    try:
+        results = [await run_scenario(name, args) for name in names]
+    finally:
+        os.chdir(REPO_ROOT)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    failed = [name for name, passed in zip(names, results) if not passed]
+    print(f"\n{len(names) - len(failed)}/{len(names)} scenario(s) passed" + (f"; failed: {', '.join(failed)}" if failed else ""))
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scenario', choices=list(SCENARIOS), help="run one scenario (all by default)")
+    parser.add_argument('--events', type=int, default=400, help="synthetic events per scenario")
+    parser.add_argument('--rate', type=float, default=100, help="events per second")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--verbose', action='store_true', help="show the bot's error logs")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,41 @@
+"""
+Report command usage, errors, top users and link handouts from the bot logs.
+
+Streams logs/homeland_bot.log and its rotated (optionally gzipped) backups.
+
+Usage: python -m tools.log_stats [--hours 24] [--top 5] [--log-dir logs]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.log_analytics import LogAnalyzer, format_report
+
+def main(hours: float, top: int, log_dir: str):
+    analyzer = LogAnalyzer(log_dir)
+    since = time.time() - hours * 3600 if hours else None
+
+    started = time.perf_counter()
+    summary = analyzer.summarize(since)
+    elapsed = time.perf_counter() - started
+
+    window = f"last {hours:g}h" if hours else "all time"
+    print(f"Homeland RP log stats ({window}, {summary['files']} file(s), "
+          f"{analyzer.bytes_read / 1024:.0f} KiB read in {elapsed:.2f}s)")
+    if summary['first_hour']:
+        print(f"Covering {summary['first_hour']}:00 to {summary['last_hour']}:59")
+    for title, text in format_report(summary, top):
+        print(f"\n{title}")
+        for line in text.splitlines():
+            print(f"  {line}")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--hours', type=float, default=24, help="window size, 0 for everything")
+    parser.add_argument('--top', type=int, default=5)
+    parser.add_argument('--log-dir', default='logs')
+    args = parser.parse_args()
+    main(args.hours, args.top, args.log_dir)
@@ -0,0 +1,106 @@
+"""
+Measure the cost of link-button views under a sustained trigger load.
+
+Compares building a fresh View(timeout=300) per send, registered the way
+discord.py registers stored views, against reusing cached LinkViews.
+Reports live task count, scheduled timer count and traced memory.
+
+Usage: python -m tools.measure_link_views [--sends 5000] [--urls 4]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import discord
+from discord.ui.view import ViewStore
+from bot.views import LinkViewCache
+
+JOIN_URL = "https://www.roblox.com/games/start?placeId=7711635737&launchData=joinCode%3D{code}"
+
+def register_like_send(store: ViewStore, view: discord.ui.View, message_id: int):
+    """Apply the same store condition discord.py uses after a send"""
+    if view and not view.is_finished() and view.is_dispatchable():
+        store.add_view(view, message_id)
+
+def register_legacy(store: ViewStore, view: discord.ui.View, message_id: int):
+    """Store condition used by discord.py before link views were skipped"""
+    if view and not view.is_finished():
+        store.add_view(view, message_id)
+
+def build_fresh_view(url: str) -> discord.ui.View:
+    view = discord.ui.View(timeout=300)
+    view.add_item(discord.ui.Button(
+        label="Join Server",
+        style=discord.ButtonStyle.link,
+        url=url,
+        emoji="🎮"
+    ))
+    return view
+
+def count_timers(loop: asyncio.AbstractEventLoop) -> int:
+    """Count pending (not cancelled) timer handles on the loop"""
+    return sum(1 for handle in getattr(loop, '_scheduled', []) if not handle.cancelled())
+
+async def run_scenario(name: str, sends: int, urls: int, make_view, register) -> dict:
+    loop = asyncio.get_running_loop()
+    store = ViewStore(state=None)
+    baseline_tasks = len(asyncio.all_tasks())
+    baseline_timers = count_timers(loop)
+
+    tracemalloc.start()
+    snapshot_before = tracemalloc.get_traced_memory()[0]
+
+    for message_id in range(sends):
+        url = JOIN_URL.format(code=f"code{message_id % urls}")
+        view = make_view(url)
+        view.to_components()  # serialization done on every send
+        register(store, view, message_id)
+        if message_id % 100 == 0:
+            await asyncio.sleep(0)
+
+    await asyncio.sleep(0)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {
+        'scenario': name,
+        'tasks': len(asyncio.all_tasks()) - baseline_tasks,
+        'timers': count_timers(loop) - baseline_timers,
+        'memory_kib': (current - snapshot_before) / 1024,
+        'peak_kib': peak / 1024,
+    }
+
+    # Cancel the timeout tasks the legacy path left behind
+    for task in asyncio.all_tasks():
+        if task is not asyncio.current_task():
+            task.cancel()
+    await asyncio.sleep(0)
+    return result
+
+async def main(sends: int, urls: int):
+    cache = LinkViewCache()
+    scenarios = [
+        ("fresh view, legacy store", build_fresh_view, register_legacy),
+        ("fresh view, current store", build_fresh_view, register_like_send),
+        ("cached LinkView, legacy store", lambda url: cache.get_view(url, "Join Server", "🎮"), register_legacy),
+        ("cached LinkView, current store", lambda url: cache.get_view(url, "Join Server", "🎮"), register_like_send),
+    ]
+
+    print(f"{sends} sends over {urls} distinct URL(s)")
+    print(f"{'scenario':<32}{'tasks':>8}{'timers':>8}{'mem KiB':>12}{'peak KiB':>12}")
+    for name, make_view, register in scenarios:
+        r = await run_scenario(name, sends, urls, make_view, register)
+        print(f"{r['scenario']:<32}{r['tasks']:>8}{r['timers']:>8}"
+              f"{r['memory_kib']:>12.1f}{r['peak_kib']:>12.1f}")
+    print(f"cache hits={cache.hits} misses={cache.misses}")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sends', type=int, default=5000)
+    parser.add_argument('--urls', type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args.sends, args.urls))
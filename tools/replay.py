@@ -0,0 +1,234 @@
+"""
+Replay gateway messages and slash commands against the real bot handlers offline.
+
+Builds a HomelandBot with its command extensions loaded, then feeds it a
+synthetic or recorded event stream at a controlled rate. Messages go to
+HomelandBot.on_message; commands call the tree command callbacks with
+fake interactions. All Discord traffic goes to a stubbed HTTP layer with
+configurable latency and 429 rate limiting.
+
+Events are JSON lines: {"at": seconds, "type": "message", "channel": n,
+"user": n, "content": "..."} or {"at": seconds, "type": "command",
+"channel": n, "user": n, "command": "addrole", "options": {"member": n,
+"role": "Police"}}. Users are member indexes; "owner" is the bot owner.
+
+Usage: python -m tools.replay [--events FILE | --synthetic 2000 --rate 200]
+       [--speed 1.0] [--record FILE] [--latency 0.05] [--rate-limit 0.01]
+       [--channels 20] [--members 500] [--roles 40]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.fakes import (FakeChannel, FakeGuild, FakeHTTP, FakeInteraction, FakeMessage,
+                         homeland_role_names)
+
+GUILD_ID = 900000000000000000
+CHANNEL_BASE = GUILD_ID + 500000
+
+# Synthetic stream mix: (weight, event template)
+SYNTHETIC_MIX = [
+    (55, {'type': 'message', 'content': "anyone on tonight?"}),
+    (15, {'type': 'message', 'content': "what's the server code?"}),
+    (10, {'type': 'command', 'command': 'server'}),
+    (8, {'type': 'command', 'command': 'serverstatus'}),
+    (6, {'type': 'command', 'command': 'roleinfo'}),
+    (3, {'type': 'command', 'command': 'addrole', 'owner': True}),
+    (3, {'type': 'command', 'command': 'removerole', 'owner': True}),
+]
+ROLE_CHANGE_ROLES = ["Police", "Civilian", "EMS", "Firefighter", "VIP"]
+
+def synthetic_events(count: int, rate: float, channels: int, members: int, seed: int = 0):
+    """Generate an event stream evenly spaced at rate events per second"""
+    rng = random.Random(seed)
+    weights = [weight for weight, _ in SYNTHETIC_MIX]
+    templates = [template for _, template in SYNTHETIC_MIX]
+    events = []
+    for index in range(count):
+        template = rng.choices(templates, weights)[0]
+        event = {
+            'at': index / rate,
+            'type': template['type'],
+            'channel': rng.randrange(channels),
+            'user': 'owner' if template.get('owner') else rng.randrange(members),
+        }
+        if template['type'] == 'message':
+            event['content'] = template['content']
+        else:
+            event['command'] = template['command']
+            if template['command'] in ('addrole', 'removerole'):
+                event['options'] = {'member': rng.randrange(members), 'role': rng.choice(ROLE_CHANGE_ROLES)}
+        events.append(event)
+    return events
+
+def load_events(path: str):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def save_events(path: str, events):
+    with open(path, 'w', encoding='utf-8') as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[int((len(ordered) - 1) * fraction)] if ordered else 0.0
+
+class ReplayHarness:
+    """
+    A real HomelandBot wired to a fake guild and HTTP layer
+    """
+
+    def __init__(self, http: FakeHTTP, channels: int, members: int, roles: int):
+        self.http = http
+        self.channel_count = channels
+        self.member_count = members
+        self.role_count = roles
+        self.latencies = defaultdict(list)
+        self.errors = Counter()
+        self.expired = 0
+
+    async def setup(self):
+        import main
+        from bot.audit_store import RoleAuditStore
+        from bot.commands import setup_commands
+        from config.settings import BOT_CONFIG
+
+        # main configures file logging on import; replayed traffic stays out of the bot's log
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        logging.basicConfig(level=logging.WARNING)
+
+        self.bot = main.HomelandBot()
+        await setup_commands(self.bot)
+        # Keep replayed role changes out of the real audit database
+        self._tmp = tempfile.TemporaryDirectory()
+        self.bot.role_manager.audit = RoleAuditStore(os.path.join(self._tmp.name, "role_audit.db"))
+        await self.bot.role_manager.audit.start()
+
+        self.guild = FakeGuild(GUILD_ID, self.http, homeland_role_names(self.role_count), self.member_count)
+        self.members = [m for m in self.guild.members if not m.bot]
+        # Normally set on login; command processing compares message authors against it
+        self.bot._connection.user = self.guild.me._user
+        self.roles_by_name = {role.name: role for role in self.guild.roles}
+        owner_ids = BOT_CONFIG.get('owner_ids') or [1]
+        self.owner = self.guild.add_member(owner_ids[0], "owner")
+        self.channels = [FakeChannel(CHANNEL_BASE + index, self.guild, self.http)
+                         for index in range(self.channel_count)]
+
+    async def close(self):
+        await self.bot.role_manager.audit.close()
+        await self.bot.event_bus.close()
+        self._tmp.cleanup()
+
+    def _user(self, ref):
+        return self.owner if ref == 'owner' else self.members[int(ref) % len(self.members)]
+
+    async def run_event(self, index: int, event: dict, due: float):
+        channel = self.channels[event.get('channel', 0) % len(self.channels)]
+        user = self._user(event.get('user', 0))
+        kind = event['type']
+        try:
+            if kind == 'message':
+                message = FakeMessage(index, user, channel, event.get('content', ''))
+                await self.bot.on_message(message)
+            else:
+                kind = f"/{event['command']}"
+                await self._run_command(index, event, user, channel, due)
+        except Exception as e:
+            self.errors[f"{kind}: {type(e).__name__}"] += 1
+        self.latencies[kind].append(time.perf_counter() - due)
+
+    async def _run_command(self, index: int, event: dict, user, channel, due: float):
+        command = self.bot.tree.get_command(event['command'])
+        if command is None:
+            raise LookupError(f"Unknown command /{event['command']}")
+
+        kwargs = {}
+        for name, value in event.get('options', {}).items():
+            if name in ('member', 'moderator'):
+                kwargs[name] = self._user(value)
+            elif name == 'role':
+                # Autocomplete submits the role id
+                kwargs[name] = str(self.roles_by_name[value].id)
+            else:
+                kwargs[name] = value
+
+        interaction = FakeInteraction(index, user, channel, command)
+        interaction.created = due
+        await command.callback(command.binding, interaction, **kwargs)
+        if interaction.expired:
+            self.expired += 1
+
+    async def replay(self, events, speed: float = 1.0) -> float:
+        """Dispatch every event at its scheduled time; latency counts from that time"""
+        tasks = []
+        started = time.perf_counter()
+        for index, event in enumerate(events):
+            due = started + event['at'] / speed
+            delay = due - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(self.run_event(index, event, due)))
+        await asyncio.gather(*tasks)
+        return time.perf_counter() - started
+
+    def report(self, elapsed: float, events: int):
+        from bot.deferral import deferral_metrics
+
+        print(f"{events} events in {elapsed:.2f}s ({events / elapsed:.1f} events/s)")
+        print(f"\n{'event':<16}{'count':>8}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+        for kind, values in sorted(self.latencies.items()):
+            print(f"{kind:<16}{len(values):>8}{percentile(values, 0.5) * 1000:>10.1f}"
+                  f"{percentile(values, 0.99) * 1000:>10.1f}{max(values) * 1000:>10.1f}")
+
+        deferred = sum(entry['deferred'] for entry in deferral_metrics.summary().values())
+        print(f"\nauto-deferred: {deferred}  expired (>3s to first response): {self.expired}")
+        print(f"errors: {dict(self.errors) or 'none'}")
+        print(f"\n{'outbound route':<58}{'calls':>8}{'429s':>8}")
+        for route, calls in self.http.calls.most_common():
+            print(f"{route:<58}{calls:>8}{self.http.rate_limited[route]:>8}")
+
+async def main(args):
+    if args.events:
+        events = load_events(args.events)
+    else:
+        events = synthetic_events(args.synthetic, args.rate, args.channels, args.members, args.seed)
+    if args.record:
+        save_events(args.record, events)
+
+    http = FakeHTTP(latency=args.latency, rate_limit_rate=args.rate_limit, retry_after=args.retry_after,
+                    seed=args.seed)
+    harness = ReplayHarness(http, args.channels, args.members, args.roles)
+    await harness.setup()
+    try:
+        elapsed = await harness.replay(events, args.speed)
+    finally:
+        await harness.close()
+    harness.report(elapsed, len(events))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--events', help="JSON-lines event stream to replay")
+    parser.add_argument('--synthetic', type=int, default=2000, help="number of synthetic events")
+    parser.add_argument('--rate', type=float, default=200, help="synthetic events per second")
+    parser.add_argument('--speed', type=float, default=1.0, help="replay speed multiplier")
+    parser.add_argument('--record', help="write the event stream to this file")
+    parser.add_argument('--latency', type=float, default=0.05, help="mean HTTP latency in seconds")
+    parser.add_argument('--rate-limit', type=float, default=0.0, help="fraction of requests answered with 429")
+    parser.add_argument('--retry-after', type=float, default=1.0)
+    parser.add_argument('--channels', type=int, default=20)
+    parser.add_argument('--members', type=int, default=500)
+    parser.add_argument('--roles', type=int, default=40)
+    parser.add_argument('--seed', type=int, default=0)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,67 @@
+"""
+Summarize span latencies from the trace file written by bot/tracing.py.
+
+For every root (e.g. /addrole) prints each span name beneath it with count,
+average/p50/p95 total time and average self time (time not spent in child spans).
+
+Usage: python -m tools.trace_report [--file logs/traces.jsonl] [--root /addrole]
+"""
+import argparse
+import json
+import os
+import sys
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bot.tracing import TRACE_FILE
+
+def read_traces(path: str):
+    """Yield the spans of each complete trace, grouped by trace id"""
+    traces = defaultdict(list)
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                span = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            traces[span['trace_id']].append(span)
+            # Roots are exported last, so a root closes its trace
+            if span['parent_id'] is None:
+                yield traces.pop(span['trace_id'])
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[int((len(ordered) - 1) * fraction)]
+
+def main(path: str, root_filter: str):
+    # root name -> span name -> list of (total ms, self ms)
+    timings = defaultdict(lambda: defaultdict(list))
+    for spans in read_traces(path):
+        root = spans[-1]
+        if root_filter and root['name'] != root_filter:
+            continue
+        child_time = defaultdict(float)
+        for span in spans:
+            if span['parent_id'] is not None:
+                child_time[span['parent_id']] += span['duration_ms']
+        for span in spans:
+            timings[root['name']][span['name']].append(
+                (span['duration_ms'], span['duration_ms'] - child_time[span['span_id']])
+            )
+
+    for root_name, spans in sorted(timings.items()):
+        print(f"\n{root_name} ({len(spans[root_name])} trace(s))")
+        print(f"  {'span':<44} {'count':>6} {'avg ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'self ms':>9}")
+        for name, values in sorted(spans.items(), key=lambda item: -sum(v[0] for v in item[1])):
+            totals = [total for total, _ in values]
+            self_avg = sum(own for _, own in values) / len(values)
+            print(f"  {name[:44]:<44} {len(values):>6} {sum(totals) / len(totals):>9.2f} "
+                  f"{percentile(totals, 0.5):>9.2f} {percentile(totals, 0.95):>9.2f} {self_avg:>9.2f}")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--file', default=TRACE_FILE)
+    parser.add_argument('--root', default='', help="only report traces with this root span name")
+    args = parser.parse_args()
+    main(args.file, args.root)
@@ -0,0 +1,66 @@
+import json
+import logging
+import os
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Optional hooks around file I/O (fault injection installs them); None means plain I/O.
+# read_hook(path, text) returns the text to parse; write_hook(path) may raise before a write.
+read_hook: Optional[Callable[[str, str], str]] = None
+write_hook: Optional[Callable[[str], None]] = None
+
+def set_hooks(read: Optional[Callable[[str, str], str]] = None, write: Optional[Callable[[str], None]] = None):
+    """Install (or with no arguments, remove) the file I/O hooks"""
+    global read_hook, write_hook
+    read_hook, write_hook = read, write
+
+def read_json(path: str) -> Any:
+    """
+    Load a JSON file, raising if it is missing, unreadable or corrupt
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    if read_hook is not None:
+        text = read_hook(path, text)
+    return json.loads(text)
+
+def load_json(path: str, default: Any = None) -> Any:
+    """
+    Load a JSON file, returning the default if it is missing or unreadable
+    """
+    try:
+        return read_json(path)
+    except FileNotFoundError:
+        return default
+    except json.JSONDecodeError as e:
+        logger.error(f"Corrupt JSON in {path}: {e}")
+        return default
+    except Exception as e:
+        logger.error(f"Error reading {path}: {e}")
+        return default
+
+def save_json(path: str, data: Any, indent: int = 2) -> bool:
+    """
+    Write a JSON file atomically (temp file + rename) so readers never see a partial write
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            if write_hook is not None:
+                write_hook(path)
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return True
+
+    except Exception as e:
+        logger.error(f"Error writing {path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
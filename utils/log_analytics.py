@@ -0,0 +1,238 @@
+import gzip
+import os
+import re
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from config.settings import BOT_CONFIG
+
+LOG_CONFIG = BOT_CONFIG.get('logging', {})
+LOG_DIR = 'logs'
+
+# Lines written with the default format; continuation lines (tracebacks) don't match
+LINE_PATTERN = re.compile(
+    r'^(?P<hour>\d{4}-\d{2}-\d{2} \d{2}):\d{2}:\d{2} - (?P<name>\S+) - (?P<level>[A-Z]+) - (?P<message>.*)$'
+)
+COMMAND_PATTERN = re.compile(r"^Command '(?P<command>[^']+)' used by (?P<user>.+?) in ")
+COMMAND_ERROR_PATTERN = re.compile(r'^(?:Error|Forbidden) in /(?P<command>\S+):')
+LINK_PATTERNS = (
+    re.compile(r'^Server link provided to (?P<user>.+?) in '),
+    re.compile(r'^Server link requested by (?P<user>.+?) in '),
+    re.compile(r'^Auto-sent server button to (?P<user>.+?) in response'),
+)
+
+HOUR_FORMAT = '%Y-%m-%d %H'
+
+class LogStats:
+    """
+    Counters for a set of log lines
+    """
+
+    __slots__ = ('lines', 'commands', 'command_errors', 'errors', 'warnings', 'users', 'links')
+
+    def __init__(self):
+        self.lines = 0
+        self.commands: Counter = Counter()
+        self.command_errors: Counter = Counter()
+        # Logger name -> ERROR/CRITICAL lines
+        self.errors: Counter = Counter()
+        self.warnings = 0
+        self.users: Counter = Counter()
+        self.links: Counter = Counter()
+
+    def add(self, name: str, level: str, message: str):
+        self.lines += 1
+        if level in ('ERROR', 'CRITICAL'):
+            self.errors[name] += 1
+            match = COMMAND_ERROR_PATTERN.match(message)
+            if match:
+                self.command_errors[match.group('command')] += 1
+            return
+        if level == 'WARNING':
+            self.warnings += 1
+            return
+
+        if message.startswith('Command '):
+            match = COMMAND_PATTERN.match(message)
+            if match:
+                self.commands[match.group('command')] += 1
+                self.users[match.group('user')] += 1
+            return
+        for pattern in LINK_PATTERNS:
+            match = pattern.match(message)
+            if match:
+                self.links[match.group('user')] += 1
+                return
+
+    def merge(self, other: 'LogStats'):
+        self.lines += other.lines
+        self.commands.update(other.commands)
+        self.command_errors.update(other.command_errors)
+        self.errors.update(other.errors)
+        self.warnings += other.warnings
+        self.users.update(other.users)
+        self.links.update(other.links)
+
+class Segment:
+    """
+    Parsed state of one log file: bytes consumed and per-hour stats
+    """
+
+    __slots__ = ('offset', 'hours')
+
+    def __init__(self):
+        self.offset = 0
+        self.hours: Dict[str, LogStats] = {}
+
+def read_lines(path: str, offset: int = 0) -> Iterator[Tuple[int, str]]:
+    """
+    Yield (end offset, line) for every complete line, streaming from disk
+    """
+    if path.endswith('.gz'):
+        with gzip.open(path, 'rb') as f:
+            for raw in f:
+                yield 0, raw.decode('utf-8', errors='replace').rstrip('\r\n')
+        return
+
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        for raw in f:
+            # A partial last line is still being written; pick it up next time
+            if not raw.endswith(b'\n'):
+                return
+            offset += len(raw)
+            yield offset, raw.decode('utf-8', errors='replace').rstrip('\r\n')
+
+def parse_records(lines: Iterable[Tuple[int, str]]) -> Iterator[Tuple[int, str, str, str, str]]:
+    """
+    Yield (end offset, hour, logger name, level, message) for lines in the log format
+    """
+    for offset, line in lines:
+        match = LINE_PATTERN.match(line)
+        if match:
+            yield offset, match.group('hour'), match.group('name'), match.group('level'), match.group('message')
+
+class LogAnalyzer:
+    """
+    Streams the current and rotated bot logs into per-hour counters.
+
+    Each file is read line by line, so memory doesn't grow with log size.
+    Parsed files are memoized by inode: a rotated file that only got renamed
+    is never read again, and the active file is resumed from the last byte
+    read. Windows are aligned to whole hours.
+    """
+
+    def __init__(self, log_dir: str = LOG_DIR, log_file: Optional[str] = None, backup_count: Optional[int] = None):
+        self.log_dir = log_dir
+        self.log_file = log_file or LOG_CONFIG.get('file', 'homeland_bot.log')
+        self.backup_count = backup_count if backup_count is not None else LOG_CONFIG.get('backup_count', 5)
+        # (device, inode) -> (file size, Segment)
+        self._segments: Dict[Tuple[int, int], Tuple[int, Segment]] = {}
+        self._lock = threading.Lock()
+        self.bytes_read = 0
+
+    def log_paths(self) -> List[str]:
+        """Existing log files, oldest first"""
+        base = os.path.join(self.log_dir, self.log_file)
+        paths = []
+        for index in range(self.backup_count, 0, -1):
+            for candidate in (f"{base}.{index}.gz", f"{base}.{index}"):
+                if os.path.exists(candidate):
+                    paths.append(candidate)
+        if os.path.exists(base):
+            paths.append(base)
+        return paths
+
+    def summarize(self, since: Optional[float] = None) -> Dict:
+        """
+        Aggregate all logs from the hour containing `since` (a Unix timestamp) onwards.
+        Blocking; run it in a worker thread from the event loop.
+        """
+        first_hour = datetime.fromtimestamp(since).strftime(HOUR_FORMAT) if since is not None else ''
+        total = LogStats()
+        hours = set()
+
+        with self._lock:
+            live = set()
+            for path in self.log_paths():
+                try:
+                    key, segment = self._load(path)
+                except OSError:
+                    continue
+                live.add(key)
+                for hour, stats in segment.hours.items():
+                    if hour >= first_hour:
+                        total.merge(stats)
+                        hours.add(hour)
+
+            # Forget files that rotated out
+            for key in list(self._segments):
+                if key not in live:
+                    del self._segments[key]
+
+        return {
+            'stats': total,
+            'first_hour': min(hours) if hours else None,
+            'last_hour': max(hours) if hours else None,
+            'files': len(live),
+        }
+
+    def _load(self, path: str) -> Tuple[Tuple[int, int], Segment]:
+        stat = os.stat(path)
+        key = (stat.st_dev, stat.st_ino)
+        cached = self._segments.get(key)
+
+        if cached is not None and cached[0] == stat.st_size:
+            return key, cached[1]
+
+        if cached is not None and cached[0] < stat.st_size and not path.endswith('.gz'):
+            segment = cached[1]
+        else:
+            segment = Segment()
+
+        for offset, hour, name, level, message in parse_records(read_lines(path, segment.offset)):
+            stats = segment.hours.get(hour)
+            if stats is None:
+                stats = segment.hours[hour] = LogStats()
+            stats.add(name, level, message)
+            if offset:
+                self.bytes_read += offset - segment.offset
+                segment.offset = offset
+
+        if path.endswith('.gz'):
+            self.bytes_read += stat.st_size
+            segment.offset = stat.st_size
+        self._segments[key] = (segment.offset, segment)
+        return key, segment
+
+    def cached_segments(self) -> int:
+        return len(self._segments)
+
+def format_report(summary: Dict, top: int = 5) -> List[Tuple[str, str]]:
+    """
+    Turn a summary into (section title, text) pairs for the CLI and /logstats
+    """
+    stats: LogStats = summary['stats']
+
+    def ranked(counter: Counter) -> str:
+        if not counter:
+            return "None"
+        return "\n".join(f"{name}: {count}" for name, count in counter.most_common(top))
+
+    error_total = sum(stats.errors.values())
+    invocations = sum(stats.commands.values())
+    command_errors = sum(stats.command_errors.values())
+    rate = f" ({command_errors / invocations:.1%} of commands)" if invocations else ""
+
+    return [
+        ("Overview", f"{stats.lines} log lines, {invocations} commands, {error_total} errors, "
+                     f"{stats.warnings} warnings, {sum(stats.links.values())} link handouts"),
+        ("Commands", ranked(stats.commands)),
+        (f"Command Errors{rate}", ranked(stats.command_errors)),
+        ("Errors by Logger", ranked(stats.errors)),
+        ("Top Users", ranked(stats.users)),
+        ("Link Handouts", ranked(stats.links)),
+    ]
+
+log_analyzer = LogAnalyzer()
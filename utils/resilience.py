@@ -0,0 +1,119 @@
+import asyncio
+import random
+import time
+from typing import Any, Dict, Hashable, Tuple
+
+class Backoff:
+    """
+    Per-key exponential backoff with full jitter
+    """
+
+    def __init__(self, base: float = 5.0, maximum: float = 300.0):
+        self.base = base
+        self.maximum = maximum
+        # key -> (consecutive failures, monotonic time of next allowed attempt)
+        self._state: Dict[Hashable, Tuple[int, float]] = {}
+
+    def ready(self, key: Hashable) -> bool:
+        state = self._state.get(key)
+        return state is None or time.monotonic() >= state[1]
+
+    def failure(self, key: Hashable) -> float:
+        """Record a failure and return the delay before the next attempt"""
+        failures = self._state.get(key, (0, 0.0))[0] + 1
+        ceiling = min(self.maximum, self.base * (2 ** (failures - 1)))
+        delay = random.uniform(ceiling / 2, ceiling)
+        self._state[key] = (failures, time.monotonic() + delay)
+        return delay
+
+    def success(self, key: Hashable):
+        self._state.pop(key, None)
+
+    def failures(self, key: Hashable) -> int:
+        return self._state.get(key, (0, 0.0))[0]
+
+class CircuitBreaker:
+    """
+    Stops calls to a failing dependency for a while.
+
+    closed: calls pass. open: calls are rejected until reset_timeout passes.
+    half-open: one trial call is let through; success closes the circuit,
+    failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+
+    def allow(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            self._trial_in_flight = False
+        if self._trial_in_flight:
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {'state': self.state, 'failures': self.failures}
+
+class TokenBucket:
+    """
+    Async rate limiter: rate tokens per second with bursts up to capacity.
+
+    pause() empties the bucket and holds every waiter until a server-side
+    retry_after has passed, so a 429 slows all callers instead of one.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            if now < self.paused_until:
+                await asyncio.sleep(self.paused_until - now)
+                continue
+            self._refill(now)
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        now = time.monotonic()
+        self.paused_until = max(self.paused_until, now + seconds)
+        self.tokens = 0.0
+        self.updated = self.paused_until
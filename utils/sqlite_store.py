@@ -0,0 +1,47 @@
+import asyncio
+import os
+import sqlite3
+import threading
+from typing import Any, Callable, Optional
+
+class SQLiteStore:
+    """
+    One SQLite (WAL) database shared by a store's worker threads.
+
+    The connection is opened on first use with the same journal and sync
+    settings for every store, and the store's schema script is applied to
+    it. Calls go through run(), which holds the lock on a worker thread, so
+    the event loop never waits on the disk and writes never interleave.
+    """
+
+    def __init__(self, path: str, schema: str):
+        self.path = path
+        self.schema = schema
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def connect(self) -> sqlite3.Connection:
+        """Get the connection, opening it if needed; call with the lock held"""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(self.schema)
+            self._conn = conn
+        return self._conn
+
+    def locked(self, func: Callable[..., Any], *args) -> Any:
+        with self._lock:
+            return func(*args)
+
+    async def run(self, func: Callable[..., Any], *args) -> Any:
+        """Run func(*args) on a worker thread with the lock held"""
+        return await asyncio.to_thread(self.locked, func, *args)
+
+    async def close(self):
+        if self._conn is not None:
+            await self.run(self._conn.close)
+            self._conn = None